@@ -4,177 +4,41 @@ GitHub Projects 로드맵에 Issues 추가 및 날짜 설정 스크립트
 Issues를 Project에 추가하고 시작일/종료일을 설정합니다.
 """
 
-import json
-import subprocess
 import re
-from typing import Optional, Tuple, Dict, List
+from itertools import islice
+from typing import Optional, Tuple, Dict, List, Set
 
-def get_github_repo() -> Optional[Tuple[str, str]]:
-    """현재 Git 리포지토리 정보를 가져옵니다."""
-    try:
-        result = subprocess.run(
-            ['gh', 'repo', 'view', '--json', 'nameWithOwner'],
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='ignore',
-            check=True
-        )
-        repo_info = json.loads(result.stdout)
-        owner, repo = repo_info['nameWithOwner'].split('/')
-        return owner, repo
-    except Exception:
-        return None
-
-def get_owner_type(owner: str) -> str:
-    """Owner가 Organization인지 User인지 확인합니다."""
-    try:
-        result = subprocess.run(
-            ['gh', 'api', f'users/{owner}'],
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='ignore',
-            check=True
-        )
-        user_data = json.loads(result.stdout)
-        return 'organization' if user_data.get('type') == 'Organization' else 'user'
-    except Exception:
-        return 'user'  # 기본값
+import telemetry
+from cli_args import get_int_option, get_option, has_flag
+from git_repo import get_github_repo
+from github_mirror import GitHubMirror
+from graphql_batch import DEFAULT_BATCH_SIZE, BatchResult, execute_aliased, gql_value
+from node_ids import NodeIdResolver
+from pagination import DEFAULT_PAGE_SIZE
+from project_schema import DEFAULT_SCHEMA_TTL, ProjectSchemaCache
+from projects import add_issue_to_project, find_date_fields, update_project_item_date
 
-def list_projects(owner: str, owner_type: str) -> List[Dict]:
-    """사용 가능한 Projects 목록을 가져옵니다."""
-    projects = []
+def refresh_mirror(mirror: GitHubMirror, project_id: str,
+                   page_size: int = DEFAULT_PAGE_SIZE) -> None:
+    """로컬 미러의 Issues와 Project Items를 증분 갱신합니다. (실패하면 미러의 마지막 상태를 사용)"""
     try:
-        if owner_type == 'organization':
-            query = f"""
-            {{
-              organization(login: "{owner}") {{
-                projectsV2(first: 20) {{
-                  nodes {{
-                    id
-                    number
-                    title
-                    url
-                  }}
-                }}
-              }}
-            }}
-            """
-        else:
-            query = f"""
-            {{
-              user(login: "{owner}") {{
-                projectsV2(first: 20) {{
-                  nodes {{
-                    id
-                    number
-                    title
-                    url
-                  }}
-                }}
-              }}
-            }}
-            """
-        
-        result = subprocess.run(
-            ['gh', 'api', 'graphql', '-f', f'query={query}'],
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='ignore',
-            check=True
-        )
-        
-        data = json.loads(result.stdout)
-        if owner_type == 'organization':
-            projects_data = data.get('data', {}).get('organization', {}).get('projectsV2', {}).get('nodes', [])
-        else:
-            projects_data = data.get('data', {}).get('user', {}).get('projectsV2', {}).get('nodes', [])
-        
-        for project in projects_data:
-            projects.append({
-                'id': project['id'],
-                'number': project['number'],
-                'title': project['title'],
-                'url': project['url']
-            })
+        mirror.refresh_issues(page_size)
     except Exception as e:
-        print(f"⚠️  Projects 조회 실패: {e}")
-    
-    return projects
-
-def get_project_fields(project_id: str) -> Dict[str, str]:
-    """Project의 필드 목록을 가져옵니다 (특히 Date 필드)."""
-    fields = {}
+        print(f"⚠️  Issues 조회 실패 (미러의 마지막 상태 사용): {e}")
     try:
-        query = f"""
-        {{
-          node(id: "{project_id}") {{
-            ... on ProjectV2 {{
-              fields(first: 20) {{
-                nodes {{
-                  ... on ProjectV2Field {{
-                    id
-                    name
-                    dataType
-                  }}
-                  ... on ProjectV2IterationField {{
-                    id
-                    name
-                    dataType
-                  }}
-                  ... on ProjectV2SingleSelectField {{
-                    id
-                    name
-                    dataType
-                  }}
-                }}
-              }}
-            }}
-          }}
-        }}
-        """
-        
-        result = subprocess.run(
-            ['gh', 'api', 'graphql', '-f', f'query={query}'],
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='ignore',
-            check=True
-        )
-        
-        data = json.loads(result.stdout)
-        field_nodes = data.get('data', {}).get('node', {}).get('fields', {}).get('nodes', [])
-        
-        for field in field_nodes:
-            if field.get('dataType') == 'DATE':
-                fields[field['name'].lower()] = field['id']
+        mirror.refresh_project(project_id, page_size)
     except Exception as e:
-        print(f"⚠️  필드 조회 실패: {e}")
-    
-    return fields
+        print(f"⚠️  Project Items 조회 실패 (미러의 마지막 상태 사용): {e}")
 
-def get_issues_with_label(owner: str, repo: str, label: str) -> List[Dict]:
-    """특정 라벨이 있는 Issues를 가져옵니다."""
-    issues = []
-    try:
-        result = subprocess.run(
-            ['gh', 'issue', 'list', '--repo', f'{owner}/{repo}',
-             '--label', label, '--state', 'all', '--limit', '100',
-             '--json', 'number,title,id,body'],
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='ignore',
-            check=True
-        )
-        if result.stdout:
-            issues = json.loads(result.stdout)
-    except Exception as e:
-        print(f"⚠️  Issues 조회 실패: {e}")
-    return issues
+def item_in_sync(item: Optional[Dict], issue: Dict, start_field_id: Optional[str],
+                 end_field_id: Optional[str]) -> bool:
+    """미러의 Project Item이 있고 날짜 필드가 Issue 본문의 날짜와 같은지 확인합니다."""
+    if item is None:
+        return False
+    start_date, end_date = extract_dates_from_body(issue.get('body') or '')
+    expected = {start_field_id: start_date, end_field_id: end_date}
+    return all(item['values'].get(field_id) == value
+               for field_id, value in expected.items() if field_id and value)
 
 def extract_dates_from_body(body: str) -> Tuple[Optional[str], Optional[str]]:
     """Issue 본문에서 날짜 정보를 추출합니다."""
@@ -191,125 +55,149 @@ def extract_dates_from_body(body: str) -> Tuple[Optional[str], Optional[str]]:
     return start_date, end_date
 
 def get_issue_node_id(owner: str, repo: str, issue_number: int) -> Optional[str]:
-    """Issue의 Node ID를 가져옵니다."""
-    try:
-        query = f"""
-        {{
-          repository(owner: "{owner}", name: "{repo}") {{
-            issue(number: {issue_number}) {{
-              id
-            }}
-          }}
-        }}
-        """
-        
-        result = subprocess.run(
-            ['gh', 'api', 'graphql', '-f', f'query={query}'],
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='ignore',
-            check=True
-        )
-        
-        data = json.loads(result.stdout)
-        issue_id = data.get('data', {}).get('repository', {}).get('issue', {}).get('id')
-        return issue_id
-    except Exception as e:
-        print(f"   ⚠️  Issue Node ID 조회 실패: {e}")
-        return None
+    """Issue의 Node ID를 가져옵니다. (디스크 매핑 우선)"""
+    resolver = NodeIdResolver(owner, repo)
+    node_id = resolver.resolve([issue_number]).get(issue_number)
+    resolver.save()
+    return node_id
 
-def add_issue_to_project(project_id: str, issue_id: str) -> Optional[str]:
-    """Issue를 Project에 추가합니다."""
-    try:
-        mutation = f"""
-        mutation {{
-          addProjectV2ItemById(input: {{
-            projectId: "{project_id}",
-            contentId: "{issue_id}"
-          }}) {{
-            item {{
-              id
-            }}
-          }}
-        }}
-        """
-        
-        result = subprocess.run(
-            ['gh', 'api', 'graphql', '-f', f'query={mutation}'],
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='ignore',
-            check=True
-        )
+def add_issues_to_project_batch(project_id: str, node_ids: Dict[int, str],
+                                batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[int, BatchResult]:
+    """여러 Issue를 별칭 mutation 문서로 묶어 Project에 추가합니다. (Issue 번호별 결과)"""
+    operations = [
+        (number,
+         f"addProjectV2ItemById(input: {{projectId: {gql_value(project_id)}, "
+         f"contentId: {gql_value(node_id)}}}) {{ item {{ id }} }}")
+        for number, node_id in node_ids.items()
+    ]
+    return execute_aliased(operations, batch_size=batch_size)
+
+def update_project_item_dates_batch(project_id: str, updates: List[Tuple[Tuple, str, str, str]],
+                                    batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[Tuple, BatchResult]:
+    """(key, item_id, field_id, 날짜) 목록의 날짜 필드를 배치로 업데이트합니다."""
+    operations = [
+        (key,
+         f"updateProjectV2ItemFieldValue(input: {{projectId: {gql_value(project_id)}, "
+         f"itemId: {gql_value(item_id)}, fieldId: {gql_value(field_id)}, "
+         f"value: {{date: {gql_value(date_value)}}}}}) {{ projectV2Item {{ id }} }}")
+        for key, item_id, field_id, date_value in updates
+    ]
+    return execute_aliased(operations, batch_size=batch_size)
+
+def sync_issues_batch(project_id: str, issues: List[Dict], node_ids: Dict[int, str],
+                      start_field_id: Optional[str], end_field_id: Optional[str],
+                      batch_size: int) -> Tuple[int, int, int, int]:
+    """배치 모드: Project 추가와 날짜 설정을 별칭 mutation으로 묶어 처리합니다.
+    
+    Returns:
+        (추가, 날짜 업데이트, 이미 추가됨, 실패) 개수
+    """
+    added_count = 0
+    updated_count = 0
+    skipped_count = 0
+    failed_count = 0
+    
+    # 1단계: Node ID 확인 (NodeIdResolver로 미리 해석됨)
+    for issue in issues:
+        if issue['number'] not in node_ids:
+            print(f"   ❌ Issue #{issue['number']}: Node ID를 가져올 수 없습니다.")
+            failed_count += 1
+    
+    # 2단계: Project 추가
+    print(f"\n📦 Project 추가: {len(node_ids)}개 (문서당 최대 {batch_size}개)")
+    add_results = add_issues_to_project_batch(
+        project_id, {i['number']: node_ids[i['number']] for i in issues if i['number'] in node_ids},
+        batch_size
+    )
+    
+    date_updates = []
+    for issue in issues:
+        number = issue['number']
+        result = add_results.get(number)
+        if result is None:
+            continue
+        if not result.ok:
+            if 'already' in result.error.lower():
+                print(f"   ⏭️  #{number}: 이미 Project에 추가되어 있습니다.")
+                skipped_count += 1
+            else:
+                print(f"   ❌ #{number}: Project 추가 실패 - {result.error}")
+                failed_count += 1
+            continue
+        item_id = (result.data.get('item') or {}).get('id')
+        added_count += 1
         
-        data = json.loads(result.stdout)
-        item_id = data.get('data', {}).get('addProjectV2ItemById', {}).get('item', {}).get('id')
-        return item_id
-    except Exception as e:
-        error_msg = str(e)
-        if 'already exists' in error_msg.lower() or 'already added' in error_msg.lower():
-            return 'exists'  # 이미 추가됨
-        return None
+        start_date, end_date = extract_dates_from_body(issue.get('body') or '')
+        if start_date and start_field_id:
+            date_updates.append(((number, 'start'), item_id, start_field_id, start_date))
+        if end_date and end_field_id:
+            date_updates.append(((number, 'end'), item_id, end_field_id, end_date))
+    
+    # 3단계: 날짜 필드 업데이트
+    if date_updates:
+        print(f"📅 날짜 필드 업데이트: {len(date_updates)}건")
+        date_results = update_project_item_dates_batch(project_id, date_updates, batch_size)
+        for (number, kind), result in date_results.items():
+            if not result.ok:
+                label = '시작일' if kind == 'start' else '종료일'
+                print(f"   ⚠️  #{number}: {label} 업데이트 실패 - {result.error}")
+            elif kind == 'start':
+                updated_count += 1
+    
+    return added_count, updated_count, skipped_count, failed_count
 
-def update_project_item_date(item_id: str, field_id: str, date_value: str) -> bool:
-    """Project Item의 날짜 필드를 업데이트합니다."""
-    try:
-        mutation = f"""
-        mutation {{
-          updateProjectV2ItemFieldValue(input: {{
-            projectId: "{item_id.split('/')[0]}",
-            itemId: "{item_id}",
-            fieldId: "{field_id}",
-            value: {{
-              date: "{date_value}"
-            }}
-          }}) {{
-            projectV2Item {{
-              id
-            }}
-          }}
-        }}
-        """
+def sync_issues_sequential(project_id: str, issues: List[Dict], node_ids: Dict[int, str],
+                           start_field_id: Optional[str],
+                           end_field_id: Optional[str]) -> Tuple[int, int, int, int]:
+    """순차 모드: Issue마다 Project 추가와 날짜 설정을 요청합니다.
+    
+    Returns:
+        (추가, 날짜 업데이트, 이미 추가됨, 실패) 개수
+    """
+    added_count = 0
+    updated_count = 0
+    skipped_count = 0
+    failed_count = 0
+    
+    for issue in issues:
+        print(f"\n📝 Issue #{issue['number']}: {issue['title']}")
         
-        # Project ID와 Item ID 분리
-        parts = item_id.split('_')
-        if len(parts) >= 2:
-            project_node_id = '_'.join(parts[:-1])
-            item_node_id = item_id
-        else:
-            return False
+        # Issue Node ID 가져오기
+        issue_node_id = node_ids.get(issue['number'])
+        if not issue_node_id:
+            print(f"   ❌ Issue Node ID를 가져올 수 없습니다.")
+            failed_count += 1
+            continue
         
-        mutation = f"""
-        mutation {{
-          updateProjectV2ItemFieldValue(input: {{
-            itemId: "{item_id}",
-            fieldId: "{field_id}",
-            value: {{
-              date: "{date_value}"
-            }}
-          }}) {{
-            projectV2Item {{
-              id
-            }}
-          }}
-        }}
-        """
+        # Project에 추가
+        item_id = add_issue_to_project(project_id, issue_node_id)
         
-        result = subprocess.run(
-            ['gh', 'api', 'graphql', '-f', f'query={mutation}'],
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='ignore',
-            check=True
-        )
+        if item_id == 'exists':
+            print(f"   ⏭️  이미 Project에 추가되어 있습니다.")
+            skipped_count += 1
+            item_id = None  # 날짜 업데이트는 시도하지 않음
+        elif item_id:
+            print(f"   ✅ Project에 추가 완료")
+            added_count += 1
+        else:
+            print(f"   ❌ Project 추가 실패")
+            failed_count += 1
+            continue
         
-        return True
-    except Exception as e:
-        print(f"   ⚠️  날짜 필드 업데이트 실패: {e}")
-        return False
+        # 날짜 필드 업데이트
+        if item_id:
+            start_date, end_date = extract_dates_from_body(issue.get('body') or '')
+            
+            if start_date and start_field_id:
+                if update_project_item_date(project_id, item_id, start_field_id, start_date):
+                    print(f"   📅 시작일 설정: {start_date}")
+                    updated_count += 1
+            
+            if end_date and end_field_id:
+                if update_project_item_date(project_id, item_id, end_field_id, end_date):
+                    print(f"   📅 종료일 설정: {end_date}")
+    
+    return added_count, updated_count, skipped_count, failed_count
 
 def main():
     """메인 함수"""
@@ -324,14 +212,16 @@ def main():
     owner, repo = repo_info
     print(f"📦 리포지토리: {owner}/{repo}")
     
-    # Owner 타입 확인
+    # Owner 타입 / Projects 목록 (스키마 캐시 TTL 이내면 API 호출 없음)
+    # --schema-ttl 초: 캐시 유효 시간, --refresh-schema: 캐시 무시하고 다시 조회
+    schema_cache = ProjectSchemaCache(owner, ttl=get_int_option('--schema-ttl', DEFAULT_SCHEMA_TTL),
+                                      refresh=has_flag('--refresh-schema'))
     print(f"\n👤 Owner 타입 확인 중...")
-    owner_type = get_owner_type(owner)
+    owner_type = schema_cache.owner_type()
     print(f"   타입: {owner_type}")
     
-    # Projects 목록 조회
     print(f"\n📊 Projects 목록 조회 중...")
-    projects = list_projects(owner, owner_type)
+    projects = schema_cache.projects()
     
     if not projects:
         print("❌ Projects를 찾을 수 없습니다.")
@@ -373,17 +263,17 @@ def main():
     
     # Project 필드 조회
     print(f"\n🔍 Project 필드 조회 중...")
-    fields = get_project_fields(project_id)
-    
-    start_field_id = None
-    end_field_id = None
+    try:
+        with telemetry.phase('schema'):
+            fields = schema_cache.schema(project_number, project_id).date_fields()
+    except Exception as e:
+        print(f"⚠️  필드 조회 실패: {e}")
+        fields = {}
+    finally:
+        schema_cache.save()
     
     # Date 필드 찾기
-    for field_name, field_id in fields.items():
-        if 'start' in field_name or '시작' in field_name:
-            start_field_id = field_id
-        elif 'end' in field_name or 'due' in field_name or '마감' in field_name or '종료' in field_name:
-            end_field_id = field_id
+    start_field_id, end_field_id = find_date_fields(fields)
     
     if not start_field_id or not end_field_id:
         print("⚠️  시작일/종료일 필드를 찾을 수 없습니다.")
@@ -396,80 +286,99 @@ def main():
         print(f"   - 종료일 필드 ID: {end_field_id}")
         use_fields = True
     
-    # Issues 조회
+    # 실행 옵션
+    auto_yes = has_flag('--yes', '-y')
+    batch_size = get_int_option('--batch-size', DEFAULT_BATCH_SIZE)
+    batch_mode = has_flag('--batch') or get_option('--batch-size') is not None
+    page_size = get_int_option('--page-size', DEFAULT_PAGE_SIZE)
+    
+    # Issues / Project Items 조회 (로컬 미러를 증분 갱신한 뒤 인덱스로 조회)
     print(f"\n🔍 'Issue Automation' 라벨이 있는 Issues 조회 중...")
-    issues = get_issues_with_label(owner, repo, 'Issue Automation')
+    mirror = GitHubMirror(owner, repo)
+    with telemetry.phase('mirror'):
+        refresh_mirror(mirror, project_id, page_size)
+    
+    # 이미 Project에 있고 날짜 필드도 같은 Issue는 요청하지 않음 (번호만 모아 두고 본문은 다시 읽음)
+    issue_count = 0
+    pending: Set[int] = set()
+    for issue in mirror.issues_with_label('Issue Automation'):
+        issue_count += 1
+        if not item_in_sync(mirror.project_item(project_id, issue['number']), issue,
+                            start_field_id if use_fields else None,
+                            end_field_id if use_fields else None):
+            pending.add(issue['number'])
     
-    if not issues:
+    if not issue_count:
+        mirror.close()
         print("❌ 해당 라벨이 있는 Issues를 찾을 수 없습니다.")
         return
-    
-    print(f"📋 총 {len(issues)}개의 Issues 발견")
+    in_sync_count = issue_count - len(pending)
+    total_count = len(pending)
+    print(f"📋 총 {issue_count}개의 Issues 발견 (Project와 일치: {in_sync_count}개)")
+    if not pending:
+        mirror.close()
+        print("\n✅ 모든 Issue가 이미 Project에 반영되어 있습니다.")
+        return
     
     # 사용자 확인 (자동 모드 옵션)
-    import sys
-    auto_yes = '--yes' in sys.argv or '-y' in sys.argv
-    
     if not auto_yes:
-        response = input(f"\n{len(issues)}개의 Issues를 Project에 추가하시겠습니까? (y/N): ")
+        response = input(f"\n{total_count}개의 Issues를 Project에 추가하시겠습니까? (y/N): ")
         if response.lower() != 'y':
+            mirror.close()
             print("취소되었습니다.")
             return
     else:
-        print(f"\n🚀 자동 모드: {len(issues)}개의 Issues를 Project에 추가합니다...")
+        print(f"\n🚀 자동 모드: {total_count}개의 Issues를 Project에 추가합니다...")
     
     # Issues를 Project에 추가
     print(f"\n🔄 Issues를 Project에 추가 중...")
     print("=" * 60)
     
-    added_count = 0
-    updated_count = 0
-    skipped_count = 0
-    failed_count = 0
+    totals = [0, 0, 0, 0]  # 추가, 날짜 업데이트, 이미 추가됨, 실패
+    resolver = NodeIdResolver(owner, repo)
     
-    for issue in issues:
-        print(f"\n📝 Issue #{issue['number']}: {issue['title']}")
-        
-        # Issue Node ID 가져오기
-        issue_node_id = get_issue_node_id(owner, repo, issue['number'])
-        if not issue_node_id:
-            print(f"   ❌ Issue Node ID를 가져올 수 없습니다.")
-            failed_count += 1
-            continue
-        
-        # Project에 추가
-        item_id = add_issue_to_project(project_id, issue_node_id)
-        
-        if item_id == 'exists':
-            print(f"   ⏭️  이미 Project에 추가되어 있습니다.")
-            skipped_count += 1
-            item_id = None  # 날짜 업데이트는 시도하지 않음
-        elif item_id:
-            print(f"   ✅ Project에 추가 완료")
-            added_count += 1
-        else:
-            print(f"   ❌ Project 추가 실패")
-            failed_count += 1
-            continue
-        
-        # 날짜 필드 업데이트
-        if use_fields and item_id:
-            start_date, end_date = extract_dates_from_body(issue.get('body', ''))
+    try:
+        # 미러에서 --page-size개씩 읽어 처리 (전체 목록을 메모리에 모으지 않음)
+        pending_issues = (issue for issue in mirror.issues_with_label('Issue Automation')
+                          if issue['number'] in pending)
+        while True:
+            issues = list(islice(pending_issues, page_size))
+            if not issues:
+                break
             
-            if start_date and start_field_id:
-                if update_project_item_date(item_id, start_field_id, start_date):
-                    print(f"   📅 시작일 설정: {start_date}")
-                    updated_count += 1
+            # Issue Node ID 일괄 해석 (목록의 id → 디스크 매핑 → 누락분만 별칭 query)
+            with telemetry.phase('resolve_node_ids', issues=len(issues)):
+                resolver.remember(issues)
+                node_ids = resolver.resolve(issue['number'] for issue in issues)
             
-            if end_date and end_field_id:
-                if update_project_item_date(item_id, end_field_id, end_date):
-                    print(f"   📅 종료일 설정: {end_date}")
+            with telemetry.phase('sync', issues=len(issues), batch=batch_mode):
+                if batch_mode:
+                    counts = sync_issues_batch(
+                        project_id, issues, node_ids,
+                        start_field_id if use_fields else None,
+                        end_field_id if use_fields else None,
+                        batch_size
+                    )
+                else:
+                    counts = sync_issues_sequential(
+                        project_id, issues, node_ids,
+                        start_field_id if use_fields else None,
+                        end_field_id if use_fields else None
+                    )
+            totals = [a + b for a, b in zip(totals, counts)]
+    except Exception as e:
+        print(f"⚠️  Issues 조회 실패: {e}")
+    finally:
+        resolver.save()
+        mirror.close()
+    
+    added_count, updated_count, skipped_count, failed_count = totals
     
     print("\n" + "=" * 60)
     print(f"✅ 완료!")
     print(f"   - Project에 추가: {added_count}개")
     print(f"   - 날짜 필드 업데이트: {updated_count}개")
-    print(f"   - 이미 추가됨: {skipped_count}개")
+    print(f"   - 이미 추가됨: {skipped_count + in_sync_count}개")
     print(f"   - 실패: {failed_count}개")
     print(f"\n🔗 Project에서 확인: {selected_project['url']}")
 
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Frontmatter 파서 벤치마크
+합성 Task 파일 N개를 만들어 기존 방식(전체 읽기 + yaml.safe_load)과
+frontmatter 모듈(헤더만 읽기 + fast path)의 처리량을 비교합니다.
+
+사용법:
+    python scripts/benchmarks/bench_frontmatter.py [--files 100000] [--body-lines 40] [--json]
+"""
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import frontmatter  # noqa: E402
+from cli_args import get_int_option, has_flag  # noqa: E402
+
+TASK_TEMPLATE = """---
+title: "Task {n:03d}: 합성 작업 {n} (Benchmark)"
+epic: "EPIC-{epic} (BENCHMARK)"
+source: "6. Task추출결과.md"
+start-date: 2025-12-24
+target-date: 2025-12-31
+due-date: 2025-12-31
+priority: "{priority}"
+status: "To Do"
+---
+
+# Task {n:03d}: 합성 작업 {n} (Benchmark)
+
+## 설명
+{body}
+"""
+
+
+def generate_corpus(root: Path, count: int, body_lines: int) -> List[Path]:
+    """합성 Task 파일을 생성합니다."""
+    priorities = ['High', 'Medium', 'Low']
+    body = '\n'.join(f"- 세부 항목 {i}: 본문 내용은 파서가 읽지 않아도 되는 부분입니다."
+                     for i in range(body_lines))
+    paths = []
+    for n in range(count):
+        folder = root / f"Priority_{n % 3 + 1}"
+        folder.mkdir(exist_ok=True)
+        path = folder / f"{n:06d}_Task.md"
+        path.write_text(TASK_TEMPLATE.format(n=n, epic=n % 10, priority=priorities[n % 3],
+                                             body=body), encoding='utf-8')
+        paths.append(path)
+    return paths
+
+
+def legacy_read(path: Path):
+    """기존 스크립트 방식: 파일 전체를 읽고 split 후 yaml.safe_load"""
+    content = path.read_text(encoding='utf-8')
+    parts = content.split('---', 2)
+    return yaml.safe_load(parts[1]), parts[2].strip()
+
+
+def yaml_only_read(path: Path):
+    """헤더만 읽되 fast path 없이 항상 yaml(CSafeLoader)로 파싱"""
+    with open(path, 'rb') as f:
+        f.readline()
+        lines = []
+        for line in f:
+            if line.rstrip() == b'---':
+                break
+            lines.append(line)
+    return yaml.load(b''.join(lines).decode('utf-8'), Loader=frontmatter._safe_loader())
+
+
+def header_only_read(path: Path):
+    """본문은 읽지 않는 지연 로딩 (load_document)"""
+    return frontmatter.load_document(path).frontmatter
+
+
+def run(name: str, func: Callable, paths: List[Path]) -> Dict:
+    start = time.perf_counter()
+    results = [func(p) for p in paths]
+    elapsed = time.perf_counter() - start
+    return {'name': name, 'seconds': round(elapsed, 4),
+            'files_per_sec': round(len(paths) / elapsed, 1) if elapsed else None,
+            'results': results}
+
+
+def main():
+    count = get_int_option('--files', 100000)
+    body_lines = get_int_option('--body-lines', 40)
+    as_json = has_flag('--json')
+
+    with tempfile.TemporaryDirectory(prefix='bench-frontmatter-') as tmp:
+        if not as_json:
+            print(f"📝 합성 Task 파일 {count}개 생성 중...")
+        paths = generate_corpus(Path(tmp), count, body_lines)
+
+        runs = [
+            run('legacy (read + yaml.safe_load)', legacy_read, paths),
+            run('yaml CSafeLoader (header only)', yaml_only_read, paths),
+            run('read_frontmatter (fast path)', frontmatter.read_frontmatter, paths),
+            run('load_document (no body)', header_only_read, paths),
+        ]
+
+    # 결과 일치 확인
+    baseline = runs[0]['results']
+    ok = (runs[2]['results'] == baseline
+          and runs[1]['results'] == [fm for fm, _ in baseline]
+          and runs[3]['results'] == [fm for fm, _ in baseline])
+    for r in runs:
+        del r['results']
+
+    legacy_seconds = runs[0]['seconds']
+    for r in runs:
+        r['speedup'] = round(legacy_seconds / r['seconds'], 2) if r['seconds'] else None
+
+    if as_json:
+        print(json.dumps({'files': count, 'body_lines': body_lines, 'identical': ok,
+                          'runs': runs}, ensure_ascii=False, indent=2))
+    else:
+        print(f"\n{'방식':<34}{'시간(초)':>10}{'파일/초':>12}{'배속':>8}")
+        for r in runs:
+            print(f"{r['name']:<34}{r['seconds']:>10}{r['files_per_sec']:>12}{r['speedup']:>8}")
+        print(f"\n{'✅ 결과 일치' if ok else '❌ 결과 불일치'}")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Task 파일 수집(ingestion) 벤치마크
+합성 Task 파일 N개를 만들어 process_task_files의 처리량을 작업 프로세스 수별로 측정합니다.
+
+사용법:
+    python scripts/benchmarks/bench_ingest.py [--files 100000] [--workers 1,2,4,8] [--json]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_frontmatter import generate_corpus  # noqa: E402
+from cli_args import get_int_option, get_option, has_flag  # noqa: E402
+from concurrency import default_process_workers  # noqa: E402
+from create_issues_from_tasks import process_task_files  # noqa: E402
+
+
+def main():
+    count = get_int_option('--files', 100000)
+    as_json = has_flag('--json')
+    cores = default_process_workers()
+    worker_option = get_option('--workers')
+    if worker_option:
+        worker_counts = [int(w) for w in worker_option.split(',') if w.strip()]
+    else:
+        worker_counts = sorted({1, 2, 4, cores} & set(range(1, cores + 1)))
+
+    runs = []
+    with tempfile.TemporaryDirectory(prefix='bench-ingest-') as tmp:
+        tasks_dir = Path(tmp) / 'Tasks'
+        tasks_dir.mkdir()
+        if not as_json:
+            print(f"📝 합성 Task 파일 {count}개 생성 중... (CPU {cores}개)")
+        generate_corpus(tasks_dir, count, body_lines=40)
+
+        baseline = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            with open(os.devnull, 'w', encoding='utf-8') as devnull, redirect_stdout(devnull):
+                issues = process_task_files(tasks_dir, workers=workers)
+            elapsed = time.perf_counter() - start
+            if baseline is None:
+                baseline = issues
+            runs.append({'workers': workers, 'seconds': round(elapsed, 4),
+                         'files_per_sec': round(count / elapsed, 1),
+                         'identical': issues == baseline})
+
+    for r in runs:
+        r['speedup'] = round(runs[0]['seconds'] / r['seconds'], 2)
+
+    if as_json:
+        print(json.dumps({'files': count, 'cpu_count': cores, 'runs': runs}, indent=2))
+    else:
+        print(f"\n{'workers':>8}{'시간(초)':>12}{'파일/초':>12}{'배속':>8}  결과")
+        for r in runs:
+            print(f"{r['workers']:>8}{r['seconds']:>12}{r['files_per_sec']:>12}{r['speedup']:>8}  "
+                  f"{'✅' if r['identical'] else '❌'}")
+    if not all(r['identical'] for r in runs):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
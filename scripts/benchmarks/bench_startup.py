@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+시작 시간 벤치마크
+create_issues_from_tasks.py를 새 프로세스로 실행하여 첫 네트워크 요청 전까지 걸리는 시간을 측정합니다.
+(watch 훅/pre-commit처럼 짧게 자주 실행하는 경우 import와 리포지토리 확인 비용이 대부분)
+
+측정 항목:
+- 인터프리터 기본 시작 시간 (`python -c pass`)
+- 변경 없는 실행의 전체 시간 (네트워크 요청 없이 종료)
+- 파일 하나를 바꾼 실행에서 프로세스 생성 → 가짜 GitHub(fake_github.py)가 첫 요청을 받기까지의 시간
+- `python -X importtime`의 누적 import 시간 상위 모듈
+- 지연 로딩 대상 모듈(yaml, http.client 등)이 변경 없는 실행에서 로드되었는지 여부
+- 스크립트 경로 실행과 `python -m` 실행(캐시된 bytecode 사용)을 각각 측정
+
+인터프리터 시작 시간을 뺀 "첫 요청까지" 시간이 --target-ms(기본 50)를 넘거나
+지연 로딩 대상 모듈이 로드되면 종료 코드 1
+
+사용법:
+    python scripts/benchmarks/bench_startup.py [--runs 10] [--files 50] [--target-ms 50]
+        [--top 10] [--json]
+"""
+
+import compileall
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_frontmatter import generate_corpus  # noqa: E402
+from cli_args import get_int_option, has_flag  # noqa: E402
+from fake_github import FakeGitHub  # noqa: E402
+
+SCRIPT = SCRIPTS_DIR / 'create_issues_from_tasks.py'
+MODULE = 'create_issues_from_tasks'
+# 변경 없는 실행(네트워크 불필요)에서 로드되면 안 되는 모듈
+DEFERRED_MODULES = ('yaml', 'http.client', 'ssl', 'sqlite3', 'subprocess', 'tempfile',
+                    'multiprocessing', 'concurrent.futures', 'hashlib', 'ctypes')
+GIT_CONFIG = """[core]
+\trepositoryformatversion = 0
+[remote "origin"]
+\turl = git@github.com:bench/bench.git
+\tfetch = +refs/heads/*:refs/remotes/origin/*
+"""
+
+
+def make_project(root: Path, files: int) -> Tuple[Path, List[Path]]:
+    """`.git/config`(GitHub origin)와 합성 Tasks/ 트리를 가진 작업 디렉토리를 만듭니다."""
+    project = root / 'project'
+    (project / '.git').mkdir(parents=True)
+    (project / 'Tasks').mkdir()
+    (project / '.git' / 'config').write_text(GIT_CONFIG, encoding='utf-8')
+    paths = generate_corpus(project / 'Tasks', files, body_lines=10)
+    return project, paths
+
+
+def invocation(module: bool) -> List[str]:
+    if module:
+        return [sys.executable, '-m', MODULE, '--yes']
+    return [sys.executable, str(SCRIPT), '--yes']
+
+
+def wall_ms(command: List[str], cwd: Path, env: Dict[str, str]) -> float:
+    start = time.perf_counter()
+    subprocess.run(command, cwd=cwd, env=env, stdout=subprocess.DEVNULL,
+                   stderr=subprocess.DEVNULL, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def first_request_ms(server: FakeGitHub, command: List[str], cwd: Path, env: Dict[str, str],
+                     path: Path, n: int) -> Optional[float]:
+    """Task 파일 하나의 본문을 바꾸고 실행하여 첫 요청을 받기까지의 시간을 잽니다."""
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(f"\n- 시작 시간 측정 {n}\n")
+    with server.lock:
+        server.first_request_at = None
+    started = time.time()
+    subprocess.run(command, cwd=cwd, env=env, stdout=subprocess.DEVNULL,
+                   stderr=subprocess.DEVNULL, check=True)
+    if server.first_request_at is None:
+        return None
+    return (server.first_request_at - started) * 1000
+
+
+def import_profile(command: List[str], cwd: Path, env: Dict[str, str], top: int) -> Dict:
+    """`-X importtime` 출력에서 전체 import 시간, 누적 상위 모듈, 로드된 지연 로딩 대상을 모읍니다."""
+    result = subprocess.run([command[0], '-X', 'importtime'] + command[1:], cwd=cwd, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+                            check=True)
+    modules = []
+    for line in result.stderr.splitlines():
+        fields = line[len('import time:'):].split('|')
+        if not line.startswith('import time:') or len(fields) != 3 or \
+                not fields[0].strip().isdigit():
+            continue  # 머리글 또는 스크립트 출력
+        self_us, cumulative_us, name = fields
+        # 최상위 import는 이름 앞 공백 1칸, 한 단계 중첩될 때마다 2칸씩 추가
+        modules.append({'module': name.strip(), 'top_level': len(name) - len(name.lstrip()) == 1,
+                        'self_ms': int(self_us) / 1000,
+                        'cumulative_ms': int(cumulative_us) / 1000})
+    top_level = sorted((m for m in modules if m['top_level']), key=lambda m: -m['cumulative_ms'])
+    loaded = {m['module'] for m in modules}
+    return {
+        'total_ms': round(sum(m['cumulative_ms'] for m in top_level), 2),
+        'top': [{'module': m['module'], 'cumulative_ms': round(m['cumulative_ms'], 2),
+                 'self_ms': round(m['self_ms'], 2)} for m in top_level[:top]],
+        'deferred_loaded': [name for name in DEFERRED_MODULES if name in loaded],
+    }
+
+
+def summarize(samples: List[Optional[float]]) -> Dict:
+    values = [v for v in samples if v is not None]
+    if not values:
+        return {'median_ms': None, 'min_ms': None}
+    return {'median_ms': round(statistics.median(values), 2), 'min_ms': round(min(values), 2)}
+
+
+def measure(server: FakeGitHub, module: bool, project: Path, changed: Path, env: Dict[str, str],
+            runs: int, top: int, baseline_ms: float) -> Dict:
+    """한 가지 실행 방식(스크립트 경로 / -m)의 시작 시간을 측정합니다."""
+    command = invocation(module)
+    no_change = summarize([wall_ms(command, project, env) for _ in range(runs)])
+    profile = import_profile(command, project, env, top)
+    first = summarize([first_request_ms(server, command, project, env, changed, n)
+                       for n in range(runs)])
+    startup = None
+    if first['median_ms'] is not None:
+        startup = round(first['median_ms'] - baseline_ms, 2)
+    return {
+        'command': ' '.join(['python'] + command[1:]),
+        'no_change': no_change,
+        'first_request': first,
+        'startup_ms': startup,  # 첫 요청까지 (인터프리터 기본 시작 시간 제외, 중앙값)
+        'imports': profile,
+    }
+
+
+def main():
+    runs = max(1, get_int_option('--runs', 10))
+    files = get_int_option('--files', 50)
+    target_ms = get_int_option('--target-ms', 50)
+    top = get_int_option('--top', 10)
+    as_json = has_flag('--json')
+
+    # PYTHONDONTWRITEBYTECODE 환경에서도 -m 실행이 캐시된 bytecode를 쓰도록 미리 컴파일
+    compileall.compile_dir(str(SCRIPTS_DIR), maxlevels=0, quiet=1)
+    server = FakeGitHub().start()
+    try:
+        with tempfile.TemporaryDirectory(prefix='bench-startup-') as tmp:
+            project, paths = make_project(Path(tmp), files)
+            env = dict(os.environ)
+            env.update({
+                'GITHUB_API_URL': server.url,
+                'GITHUB_TOKEN': 'bench',
+                'GITHUB_HTTP_CACHE': '0',
+                'GITHUB_SYNC_CACHE_DIR': str(Path(tmp) / 'cache'),
+                'PYTHONPATH': os.pathsep.join(filter(None, [str(SCRIPTS_DIR),
+                                                            env.get('PYTHONPATH')])),
+            })
+            env.pop('GITHUB_GRAPHQL_URL', None)
+            if not as_json:
+                print(f"📝 Task 파일 {files}개로 초기 동기화 중... (측정 {runs}회)")
+            # 매니페스트/라벨/리포지토리 캐시를 채워 두어 이후 실행은 변경분만 처리
+            subprocess.run(invocation(False), cwd=project, env=env, stdout=subprocess.DEVNULL,
+                           stderr=subprocess.DEVNULL, check=True)
+            baseline = summarize([wall_ms([sys.executable, '-c', 'pass'], project, env)
+                                  for _ in range(runs)])
+            results = {
+                'script': measure(server, False, project, paths[0], env, runs, top,
+                                  baseline['median_ms']),
+                'module': measure(server, True, project, paths[0], env, runs, top,
+                                  baseline['median_ms']),
+            }
+    finally:
+        server.stop()
+
+    over_target = [name for name, r in results.items()
+                   if r['startup_ms'] is None or r['startup_ms'] > target_ms]
+    deferred = sorted({m for r in results.values() for m in r['imports']['deferred_loaded']})
+
+    if as_json:
+        print(json.dumps({'files': files, 'runs': runs, 'target_ms': target_ms,
+                          'interpreter': baseline, 'results': results,
+                          'over_target': over_target}, indent=2, ensure_ascii=False))
+    else:
+        print(f"\n⏱️  인터프리터 기본 시작 (python -c pass): {baseline['median_ms']}ms")
+        print(f"\n{'':<28}{'스크립트 경로':>14}{'python -m':>14}")
+        rows = [
+            ('변경 없음 실행 (전체)', lambda r: r['no_change']['median_ms']),
+            ('첫 요청까지 (전체)', lambda r: r['first_request']['median_ms']),
+            ('첫 요청까지 (인터프리터 제외)', lambda r: r['startup_ms']),
+            ('import 합계 (-X importtime)', lambda r: r['imports']['total_ms']),
+        ]
+        for label, value in rows:
+            print(f"{label:<28}" + ''.join(f"{str(value(results[k])) + 'ms':>14}"
+                                           for k in ('script', 'module')))
+        print(f"\n📦 누적 import 시간 상위 {top}개 (스크립트 경로 실행)")
+        for m in results['script']['imports']['top']:
+            print(f"   {m['cumulative_ms']:>8.2f}ms  {m['module']}")
+        print()
+        for name in ('script', 'module'):
+            r = results[name]
+            mark = '❌' if name in over_target else '✅'
+            print(f"{mark} {r['command']}: 첫 요청까지 {r['startup_ms']}ms (목표 {target_ms}ms)")
+        if deferred:
+            print(f"❌ 변경 없는 실행에서 지연 로딩 대상 모듈이 로드됨: {', '.join(deferred)}")
+    if over_target or deferred:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
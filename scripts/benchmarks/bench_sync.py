@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Task 동기화 파이프라인 벤치마크
+합성 Tasks/Priority_N/*.md 트리를 크기별로 만들고, 로컬 가짜 GitHub API(fake_github.py)를 상대로
+동기화 단계별 시간을 측정합니다.
+
+단계: discovery → parse_frontmatter → extract_issue_content → dedupe → labels
+      → create → project_add → date_update
+- API 단계(dedupe 이후)는 파일 중 앞의 --api-items개만 처리 (기본 1000, 0이면 전체)
+- 결과는 JSON으로 저장하고 --baseline 결과와 비교하여 느려진 단계가 있으면 종료 코드 1
+
+사용법:
+    python scripts/benchmarks/bench_sync.py [--sizes 100,1000,10000,100000] [--latency-ms 20]
+        [--concurrency 4] [--api-items 1000] [--body-lines 40] [--out result.json] [--json]
+        [--baseline previous.json] [--threshold 0.2]
+"""
+
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_frontmatter import generate_corpus  # noqa: E402
+from cli_args import get_int_option, get_option, has_flag  # noqa: E402
+from concurrency import run_ordered  # noqa: E402
+from create_issues_from_tasks import discover_task_files, extract_issue_content  # noqa: E402
+from fake_github import FakeGitHub  # noqa: E402
+from frontmatter import read_frontmatter  # noqa: E402
+from issue_batch import create_issues_batch  # noqa: E402
+from issue_markers import IssueKeyIndex  # noqa: E402
+from labels import AUTOMATION_LABEL, LabelRegistry  # noqa: E402
+from projects import add_issue_to_project, update_project_item_date  # noqa: E402
+
+OWNER = 'bench'
+REPO = 'bench'
+PROJECT_ID = 'PVT_bench'
+START_FIELD_ID = 'PVTF_start'
+END_FIELD_ID = 'PVTF_end'
+DEFAULT_SIZES = '100,1000,10000'
+
+
+def timed(phases: Dict[str, Dict], name: str, items: int, func: Callable):
+    """func 실행 시간을 phases[name]에 기록하고 결과를 반환합니다."""
+    start = time.perf_counter()
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, redirect_stdout(devnull):
+        result = func()
+    elapsed = time.perf_counter() - start
+    phases[name] = {
+        'seconds': round(elapsed, 4),
+        'items': items,
+        'per_item_ms': round(elapsed * 1000 / items, 4) if items else 0.0,
+    }
+    return result
+
+
+def run_size(server: FakeGitHub, files: int, body_lines: int, api_items: int,
+             concurrency: int) -> Dict:
+    """Task 파일 files개에 대해 모든 단계를 측정합니다."""
+    server.reset()
+    phases: Dict[str, Dict] = {}
+    with tempfile.TemporaryDirectory(prefix='bench-sync-') as tmp:
+        os.environ['GITHUB_SYNC_CACHE_DIR'] = str(Path(tmp) / 'cache')
+        tasks_dir = Path(tmp) / 'Tasks'
+        tasks_dir.mkdir()
+        generate_corpus(tasks_dir, files, body_lines)
+
+        paths = timed(phases, 'discovery', files, lambda: discover_task_files(tasks_dir))
+        parsed = timed(phases, 'parse_frontmatter', len(paths),
+                       lambda: [(path, *read_frontmatter(path)) for path in paths])
+        issues = timed(phases, 'extract_issue_content', len(parsed),
+                       lambda: [extract_issue_content(fm, body, path) for path, fm, body in parsed])
+
+        api_issues = issues[:api_items] if api_items else issues
+        key_index = IssueKeyIndex(OWNER, REPO)
+        timed(phases, 'dedupe', len(api_issues),
+              lambda: key_index.lookup((i['task_key'], i['title']) for i in api_issues))
+
+        registry = LabelRegistry(OWNER, REPO)
+        needed = {AUTOMATION_LABEL}
+        for issue in api_issues:
+            needed.update(issue['labels'])
+        timed(phases, 'labels', len(needed), lambda: registry.ensure(needed))
+
+        created = timed(phases, 'create', len(api_issues), lambda: [
+            c for c in create_issues_batch(OWNER, REPO, api_issues, registry,
+                                           concurrency=concurrency) if c])
+
+        item_ids = timed(phases, 'project_add', len(created), lambda: [
+            item for _, item in run_ordered(lambda c: add_issue_to_project(PROJECT_ID, c['node_id']),
+                                            created, concurrency) if item])
+
+        date_writes = [(item, field) for item in item_ids for field in (START_FIELD_ID, END_FIELD_ID)]
+        timed(phases, 'date_update', len(date_writes), lambda: list(run_ordered(
+            lambda w: update_project_item_date(PROJECT_ID, w[0], w[1], '2025-12-31'),
+            date_writes, concurrency)))
+
+    return {'files': files, 'api_items': len(api_issues), 'phases': phases,
+            'requests': dict(sorted(server.counts.items()))}
+
+
+def compare(result: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """baseline보다 per_item_ms가 threshold 비율 이상 느려진 단계를 찾습니다."""
+    regressions = []
+    previous = {run['files']: run for run in baseline.get('runs', [])}
+    for run in result['runs']:
+        base = previous.get(run['files'])
+        if not base:
+            continue
+        for name, phase in run['phases'].items():
+            old = base['phases'].get(name, {}).get('per_item_ms')
+            if old and phase['per_item_ms'] > old * (1 + threshold):
+                regressions.append(f"{run['files']}개 {name}: {old}ms → {phase['per_item_ms']}ms")
+    return regressions
+
+
+def main():
+    sizes = [int(s) for s in (get_option('--sizes') or DEFAULT_SIZES).split(',') if s.strip()]
+    latency_ms = float(get_option('--latency-ms') or 0)
+    concurrency = get_int_option('--concurrency', 4)
+    api_items = get_int_option('--api-items', 1000)
+    body_lines = get_int_option('--body-lines', 40)
+    out_path = get_option('--out')
+    baseline_path = get_option('--baseline')
+    threshold = float(get_option('--threshold') or 0.2)
+    as_json = has_flag('--json')
+
+    server = FakeGitHub(latency_ms=latency_ms).start()
+    os.environ['GITHUB_API_URL'] = server.url
+    os.environ.pop('GITHUB_GRAPHQL_URL', None)
+    os.environ['GITHUB_TOKEN'] = 'bench'
+    os.environ['GITHUB_HTTP_CACHE'] = '0'
+
+    runs = []
+    try:
+        for files in sizes:
+            if not as_json:
+                print(f"📝 Task 파일 {files}개 측정 중... (API 지연 {latency_ms}ms)")
+            runs.append(run_size(server, files, body_lines, api_items, concurrency))
+    finally:
+        server.stop()
+
+    result = {
+        'benchmark': 'sync',
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'python': platform.python_version(),
+        'cpu_count': os.cpu_count(),
+        'latency_ms': latency_ms,
+        'concurrency': concurrency,
+        'body_lines': body_lines,
+        'runs': runs,
+    }
+    if out_path:
+        with open(out_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    if as_json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        for run in runs:
+            print(f"\n📊 Task 파일 {run['files']}개 (API 단계 {run['api_items']}개)")
+            print(f"{'단계':<24}{'시간(초)':>12}{'항목':>10}{'항목당(ms)':>14}")
+            for name, phase in run['phases'].items():
+                print(f"{name:<24}{phase['seconds']:>12}{phase['items']:>10}"
+                      f"{phase['per_item_ms']:>14}")
+            print(f"   요청 수: {run['requests']}")
+
+    if baseline_path:
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            regressions = compare(result, json.load(f), threshold)
+        if regressions:
+            print(f"\n❌ 기준 대비 {threshold:.0%} 이상 느려진 단계:", file=sys.stderr)
+            for line in regressions:
+                print(f"   - {line}", file=sys.stderr)
+            sys.exit(1)
+        if not as_json:
+            print(f"\n✅ 기준 대비 느려진 단계 없음 (허용 {threshold:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,330 @@
+"""
+벤치마크용 로컬 GitHub API 대역(stand-in)
+동기화 스크립트가 사용하는 REST/GraphQL 엔드포인트만 결정적으로 흉내 내는 HTTP 서버입니다.
+- Issue 번호/node ID는 생성 순서대로 부여 (같은 입력이면 같은 결과)
+- 모든 요청에 고정 지연(latency_ms)을 넣어 네트워크 왕복 시간을 재현
+- 별칭 createIssue mutation 문서(일괄 생성)는 별칭 순서대로 Issue 생성
+- 요청 수를 엔드포인트 종류별로 집계하고 첫 요청을 받은 시각을 기록 (시작 시간 측정용)
+- 라벨 목록 GET은 ETag를 붙이고 If-None-Match가 같으면 304로 응답
+- inject()로 다음 요청에 장애를 주입: 'drop'(응답 없이 연결 끊기), 'rate_limit'(429 + Retry-After)
+- `--check`로 실행하면 github_client의 재시도/끊긴 연결 처리/ETag 재검증 동작을 확인
+
+사용 예:
+    server = FakeGitHub(latency_ms=20).start()
+    os.environ['GITHUB_API_URL'] = server.url
+
+    python scripts/benchmarks/fake_github.py --check
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+_ALIAS_RE = re.compile(r'^\s*(op\d+):\s*(\w+)', re.MULTILINE)
+_TITLE_RE = re.compile(r'\btitle: ("(?:[^"\\]|\\.)*")')
+_BODY_RE = re.compile(r'\bbody: ("(?:[^"\\]|\\.)*")')
+_LABEL_IDS_RE = re.compile(r'\blabelIds: \[([^\]]*)\]')
+_ISSUE_PATH_RE = re.compile(r'/repos/[^/]+/[^/]+/issues/(\d+)(/labels(/.*)?)?$')
+
+
+class FakeGitHub:
+    """스레드에서 실행되는 가짜 GitHub API 서버"""
+
+    def __init__(self, latency_ms: float = 0.0, host: str = '127.0.0.1', port: int = 0):
+        self.latency = latency_ms / 1000.0
+        self.lock = threading.Lock()
+        self.issues: List[Dict] = []
+        self.labels: Dict[str, Dict] = {}
+        self.items: Dict[str, str] = {}
+        self.counts: Dict[str, int] = {}
+        self.first_request_at: Optional[float] = None  # time.time()
+        self.faults: List[str] = []
+        self._server = ThreadingHTTPServer((host, port), _handler(self))
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'FakeGitHub':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset(self) -> None:
+        """저장된 Issue/라벨/Project Item과 요청 집계를 비웁니다."""
+        with self.lock:
+            self.issues.clear()
+            self.labels.clear()
+            self.items.clear()
+            self.counts.clear()
+            self.first_request_at = None
+            self.faults.clear()
+
+    def inject(self, *faults: str) -> None:
+        """다음 요청들에 차례로 장애를 주입합니다. ('drop' 또는 'rate_limit')"""
+        with self.lock:
+            self.faults.extend(faults)
+
+    def next_fault(self) -> Optional[str]:
+        with self.lock:
+            return self.faults.pop(0) if self.faults else None
+
+    def count(self, kind: str) -> None:
+        with self.lock:
+            if self.first_request_at is None:
+                self.first_request_at = time.time()
+            self.counts[kind] = self.counts.get(kind, 0) + 1
+
+    # REST
+
+    def create_issue(self, data: Dict) -> Dict:
+        with self.lock:
+            number = len(self.issues) + 1
+            issue = {'number': number, 'node_id': f"I_{number}", 'id': number,
+                     'html_url': f"https://github.com/bench/bench/issues/{number}",
+                     'title': data.get('title'), 'body': data.get('body'), 'state': 'open',
+                     'labels': [{'name': l} for l in data.get('labels') or []]}
+            self.issues.append(issue)
+            return issue
+
+    def get_issue(self, number: int) -> Optional[Dict]:
+        with self.lock:
+            return self.issues[number - 1] if 0 < number <= len(self.issues) else None
+
+    def create_label(self, data: Dict) -> Optional[Dict]:
+        with self.lock:
+            if data['name'].lower() in self.labels:
+                return None
+            label = {'name': data['name'], 'node_id': f"LA_{len(self.labels) + 1}",
+                     'color': data.get('color')}
+            self.labels[data['name'].lower()] = label
+            return label
+
+    # GraphQL
+
+    def graphql(self, body: Dict) -> Dict:
+        query = body.get('query', '')
+        variables = body.get('variables') or {}
+        if 'addProjectV2ItemById' in query:
+            with self.lock:
+                item_id = self.items.setdefault(variables['contentId'],
+                                                f"PVTI_{len(self.items) + 1}")
+            return {'data': {'addProjectV2ItemById': {'item': {'id': item_id}}}}
+        if 'updateProjectV2ItemFieldValue' in query:
+            return {'data': {'updateProjectV2ItemFieldValue': {
+                'projectV2Item': {'id': variables.get('itemId')}}}}
+        aliases = _ALIAS_RE.findall(query)
+        if aliases and all(field == 'createIssue' for _, field in aliases):
+            return {'data': self._create_issues(query)}
+        if aliases:
+            # 별칭 search query: 새 리포지토리이므로 항상 결과 없음
+            return {'data': {alias: {'nodes': []} for alias, _ in aliases}}
+        if 'repository(owner:' in query:
+            return {'data': {'repository': {'id': 'R_bench'}}}
+        return {'data': {}}
+
+    def _create_issues(self, query: str) -> Dict:
+        """별칭 createIssue mutation 문서의 Issue를 순서대로 생성합니다."""
+        result = {}
+        for line in query.splitlines():
+            match = _ALIAS_RE.match(line)
+            if not match:
+                continue
+            title = json.loads(_TITLE_RE.search(line).group(1))
+            body = json.loads(_BODY_RE.search(line).group(1))
+            label_ids = _LABEL_IDS_RE.search(line)
+            ids = set(json.loads('[' + label_ids.group(1) + ']')) if label_ids else set()
+            with self.lock:
+                names = [l['name'] for l in self.labels.values() if l['node_id'] in ids]
+            issue = self.create_issue({'title': title, 'body': body, 'labels': names})
+            result[match.group(1)] = {'issue': {'id': issue['node_id'], 'number': issue['number'],
+                                                'url': issue['html_url']}}
+        return result
+
+
+def _handler(api: FakeGitHub):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # 헤더와 본문을 따로 쓰므로 Nagle + delayed ACK 지연(약 40ms)이 측정에 섞이지 않게 함
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status: int, payload, headers: Optional[Dict[str, str]] = None) -> None:
+            body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _fault(self) -> bool:
+            """주입된 장애가 있으면 처리하고 True를 반환합니다."""
+            fault = api.next_fault()
+            if fault is None:
+                return False
+            api.count(fault)
+            self._body()  # 요청 본문은 읽어서 버림
+            if fault == 'drop':
+                # 서버가 유휴 keep-alive 연결을 닫은 상황: 응답 없이 연결 종료
+                self.close_connection = True
+            else:
+                self._send(429, {'message': 'API rate limit exceeded'}, {'Retry-After': '0'})
+            return True
+
+        def _body(self) -> Dict:
+            length = int(self.headers.get('Content-Length') or 0)
+            return json.loads(self.rfile.read(length)) if length else {}
+
+        def _begin(self, kind: str) -> None:
+            api.count(kind)
+            if api.latency:
+                time.sleep(api.latency)
+
+        def do_GET(self):
+            if self._fault():
+                return
+            url = urlsplit(self.path)
+            if url.path.endswith('/labels'):
+                self._begin('rest_get')
+                page = int(parse_qs(url.query).get('page', ['1'])[0])
+                with api.lock:
+                    labels = list(api.labels.values())[(page - 1) * 100:page * 100]
+                etag = '"%s"' % hashlib.sha1(json.dumps(labels).encode('utf-8')).hexdigest()
+                if self.headers.get('If-None-Match') == etag:
+                    api.count('not_modified')
+                    return self._send(304, None, {'ETag': etag})
+                return self._send(200, labels, {'ETag': etag})
+            match = _ISSUE_PATH_RE.search(url.path)
+            if match and not match.group(2):
+                self._begin('rest_get')
+                issue = api.get_issue(int(match.group(1)))
+                return self._send(200 if issue else 404, issue or {'message': 'Not Found'})
+            if url.path.startswith('/users/'):
+                self._begin('rest_get')
+                return self._send(200, {'type': 'User'})
+            self._begin('rest_get')
+            self._send(404, {'message': 'Not Found'})
+
+        def do_POST(self):
+            if self._fault():
+                return
+            url = urlsplit(self.path)
+            data = self._body()
+            if url.path.endswith('/graphql'):
+                self._begin('graphql')
+                return self._send(200, api.graphql(data))
+            self._begin('rest_write')
+            match = _ISSUE_PATH_RE.search(url.path)
+            if match and match.group(2):
+                return self._send(200, [{'name': l} for l in data.get('labels', [])])
+            if url.path.endswith('/labels'):
+                label = api.create_label(data)
+                return self._send(201 if label else 422, label or {'message': 'already_exists'})
+            if url.path.endswith('/issues'):
+                return self._send(201, api.create_issue(data))
+            self._send(404, {'message': 'Not Found'})
+
+        def do_PATCH(self):
+            if self._fault():
+                return
+            data = self._body()
+            self._begin('rest_write')
+            match = _ISSUE_PATH_RE.search(urlsplit(self.path).path)
+            issue = api.get_issue(int(match.group(1))) if match else None
+            if issue is None:
+                return self._send(404, {'message': 'Not Found'})
+            with api.lock:
+                issue.update({k: v for k, v in data.items() if k in ('title', 'body', 'state')})
+            self._send(200, issue)
+
+        def do_DELETE(self):
+            if self._fault():
+                return
+            self._begin('rest_write')
+            self._send(200, [])
+
+    return Handler
+
+
+def check() -> int:
+    """github_client를 이 서버에 연결하여 재시도/끊긴 연결/ETag 동작을 확인합니다. 실패 수를 반환합니다."""
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    os.environ['GITHUB_SYNC_CACHE_DIR'] = tempfile.mkdtemp(prefix='fake-github-check-')
+    from github_client import GitHubAPIError, GitHubClient
+    from http_cache import ResponseCache
+
+    server = FakeGitHub().start()
+    client = GitHubClient(api_url=server.url, token='check', response_cache=ResponseCache())
+    failures = 0
+
+    def expect(name: str, ok: bool, detail: str = '') -> None:
+        nonlocal failures
+        failures += 0 if ok else 1
+        print(f"{'✅' if ok else '❌'} {name}{f' ({detail})' if detail and not ok else ''}")
+
+    try:
+        client.rest('POST', 'repos/o/r/labels', {'name': 'bug', 'color': 'd73a4a'})
+
+        # 1. 429 + Retry-After → 같은 요청을 다시 보내 성공
+        server.reset()
+        server.inject('rate_limit', 'rate_limit')
+        response = client.request('POST', 'repos/o/r/issues', {'title': 'retry'})
+        expect('rate limit 응답 후 재시도', response.status == 201 and response.attempts == 3
+               and server.counts.get('rest_write') == 1, f"{response.status}, {server.counts}")
+
+        # 2. 유휴 연결이 끊긴 GET → 새 연결로 1회 재시도
+        server.reset()
+        client.request('GET', 'users/o')  # 연결을 풀에 반환
+        server.inject('drop')
+        response = client.request('GET', 'users/o')
+        expect('끊긴 유휴 연결의 GET 재시도', response.status == 200
+               and server.counts.get('rest_get') == 2, str(server.counts))
+
+        # 3. 요청을 보낸 뒤 끊긴 POST → 다시 보내지 않음 (Issue 중복 생성 방지)
+        server.reset()
+        client.request('GET', 'users/o')
+        server.inject('drop')
+        try:
+            client.request('POST', 'repos/o/r/issues', {'title': 'once'})
+            expect('끊긴 연결의 POST 재전송 안 함', False, '예외가 발생하지 않음')
+        except GitHubAPIError:
+            expect('끊긴 연결의 POST 재전송 안 함', not server.issues, f"Issue {len(server.issues)}개")
+
+        # 4. ETag 재검증: 두 번째 GET은 304 + 캐시된 본문
+        server.reset()
+        server.labels['bug'] = {'name': 'bug', 'node_id': 'LA_1', 'color': 'd73a4a'}
+        first = client.rest('GET', 'repos/o/r/labels', params={'page': 1})
+        second = client.rest('GET', 'repos/o/r/labels', params={'page': 1})
+        expect('ETag 재검증(304)', first == second and server.counts.get('not_modified') == 1
+               and client.response_cache.hits == 1, str(server.counts))
+    finally:
+        client.close()
+        server.stop()
+    return failures
+
+
+if __name__ == "__main__":
+    if '--check' not in sys.argv[1:]:
+        print("사용법: python scripts/benchmarks/fake_github.py --check")
+        sys.exit(2)
+    sys.exit(1 if check() else 0)
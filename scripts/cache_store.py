@@ -0,0 +1,54 @@
+"""
+로컬 캐시 저장소 모듈
+스크립트 실행 간에 유지할 JSON 캐시 파일의 위치와 읽기/쓰기를 담당합니다.
+- 기본 위치: 현재 디렉토리의 `.github-sync-cache/` (GITHUB_SYNC_CACHE_DIR로 변경 가능)
+- 쓰기는 임시 파일 + rename으로 원자적으로 처리
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR_ENV = 'GITHUB_SYNC_CACHE_DIR'
+DEFAULT_CACHE_DIR = '.github-sync-cache'
+
+
+def get_cache_dir() -> Path:
+    """캐시 디렉토리 경로를 반환합니다. (없으면 생성)"""
+    cache_dir = Path(os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def cache_key(*parts: Any) -> str:
+    """owner/repo 등을 파일 이름으로 쓸 수 있는 키로 변환합니다."""
+    return '__'.join(str(p).replace('/', '_').replace('\\', '_') for p in parts)
+
+
+def load_json(name: str, default: Any = None) -> Any:
+    """캐시 파일을 읽습니다. 없거나 손상된 경우 default를 반환합니다."""
+    path = get_cache_dir() / name
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def save_json(name: str, data: Any) -> None:
+    """캐시 파일을 원자적으로 저장합니다."""
+    path = get_cache_dir() / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    import tempfile
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,71 @@
+"""
+명령줄 인자 헬퍼 모듈
+스크립트들이 공통으로 사용하는 간단한 `--flag` / `--option 값` 파싱을 제공합니다.
+"""
+
+import sys
+from typing import List, Optional, Sequence
+
+# 모든 스크립트에서 공통으로 읽는 값 옵션 (telemetry, github_client)
+COMMON_VALUE_OPTIONS = ('--trace-json', '--metrics-prom', '--http-cache-mb')
+
+
+def has_flag(*names: str, argv: Optional[List[str]] = None) -> bool:
+    """플래그 중 하나라도 주어졌는지 확인합니다."""
+    argv = sys.argv if argv is None else argv
+    return any(name in argv for name in names)
+
+
+def get_option(name: str, default: Optional[str] = None,
+               argv: Optional[List[str]] = None) -> Optional[str]:
+    """`--name 값` 또는 `--name=값` 형식의 옵션 값을 반환합니다."""
+    argv = sys.argv if argv is None else argv
+    for i, arg in enumerate(argv):
+        if arg == name and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith(name + '='):
+            return arg[len(name) + 1:]
+    return default
+
+
+def get_int_option(name: str, default: int, argv: Optional[List[str]] = None) -> int:
+    """정수 옵션 값을 반환합니다. 값이 올바르지 않으면 경고 후 기본값을 사용합니다."""
+    value = get_option(name, argv=argv)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        print(f"⚠️  {name} 값이 올바르지 않습니다. 기본값 {default}을 사용합니다.")
+        return default
+
+
+def get_options(name: str, argv: Optional[List[str]] = None) -> List[str]:
+    """여러 번 주어진 `--name 값` 옵션의 값을 순서대로 모두 반환합니다. (쉼표로 구분한 값도 나눔)"""
+    argv = sys.argv if argv is None else argv
+    values = []
+    for i, arg in enumerate(argv):
+        if arg == name and i + 1 < len(argv):
+            values.append(argv[i + 1])
+        elif arg.startswith(name + '='):
+            values.append(arg[len(name) + 1:])
+    return [v.strip() for value in values for v in value.split(',') if v.strip()]
+
+
+def get_positionals(value_options: Sequence[str] = (), argv: Optional[List[str]] = None) -> List[str]:
+    """옵션과 옵션 값을 뺀 위치 인자를 순서대로 반환합니다. (스크립트 이름 제외)
+
+    value_options는 값을 받는 옵션(`--name 값`) 이름이며, 공통 값 옵션은 항상 포함합니다.
+    """
+    argv = sys.argv if argv is None else argv
+    takes_value = set(value_options) | set(COMMON_VALUE_OPTIONS)
+    positionals = []
+    skip = False
+    for arg in argv[1:]:
+        if skip:
+            skip = False
+        elif arg.startswith('-'):
+            skip = arg in takes_value
+        else:
+            positionals.append(arg)
+    return positionals
@@ -0,0 +1,131 @@
+"""
+동시 실행 모듈
+작업을 스레드 풀로 동시에 실행하면서 결과와 출력(print)은 입력 순서대로 내보냅니다.
+- 작업 스레드의 print 출력은 작업별로 버퍼링했다가 순서대로 출력
+- workers <= 1이면 기존과 동일하게 순차 실행
+- 중첩해서 호출해도(대상별 동시 실행 안의 Issue별 동시 실행) 출력은 바깥 작업 단위로 묶임
+- CPU 작업(파일 파싱 등)은 map_processes로 프로세스 풀에 청크 단위로 분산
+"""
+
+import contextvars
+import io
+import os
+import sys
+import threading
+import time
+from contextlib import redirect_stdout
+from functools import partial
+from typing import Callable, Iterable, Iterator, Optional, Tuple, TypeVar
+
+import telemetry
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+class ThreadOutputRouter(io.TextIOBase):
+    """버퍼가 등록된 스레드의 출력은 버퍼로, 나머지는 원래 stdout으로 보냅니다."""
+
+    def __init__(self, target):
+        self.target = target
+        self._local = threading.local()
+
+    def capture(self, buffer: Optional[io.StringIO]) -> None:
+        self._local.buffer = buffer
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is not None:
+            return buffer.write(text)
+        return self.target.write(text)
+
+    def flush(self) -> None:
+        self.target.flush()
+
+
+def run_ordered(func: Callable[[T], R], items: Iterable[T],
+                workers: int = 1) -> Iterator[Tuple[T, R]]:
+    """func(item)을 최대 workers개 동시에 실행하고 (item, 결과)를 입력 순서대로 yield합니다."""
+    items = list(items)
+    if workers <= 1 or len(items) <= 1:
+        for item in items:
+            yield item, func(item)
+        return
+
+    original_stdout = sys.stdout
+    # 중첩 실행(작업 안의 run_ordered)이면 바깥 router를 그대로 사용 (sys.stdout 교체 경쟁 방지)
+    nested = isinstance(original_stdout, ThreadOutputRouter)
+    router = original_stdout if nested else ThreadOutputRouter(original_stdout)
+
+    def run(item: T, context: contextvars.Context) -> Tuple[R, str]:
+        buffer = io.StringIO()
+        router.capture(buffer)
+        try:
+            # 호출한 스레드의 context(예: 대상별 API 사용량 집계)를 작업 스레드에서도 유지
+            return context.run(func, item), buffer.getvalue()
+        finally:
+            router.capture(None)
+
+    from concurrent.futures import ThreadPoolExecutor
+    sys.stdout = router
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            contexts = [contextvars.copy_context() for _ in items]
+            for item, (result, output) in zip(items, executor.map(run, items, contexts)):
+                original_stdout.write(output)
+                original_stdout.flush()
+                yield item, result
+    finally:
+        sys.stdout = original_stdout
+
+
+# 파일 수가 이보다 적으면 프로세스 풀 시작 비용이 더 크므로 현재 프로세스에서 처리
+PROCESS_POOL_MIN_ITEMS = 256
+PROCESS_POOL_MAX_CHUNK = 256
+
+
+def _call_captured(func: Callable[[T], R], item: T) -> Tuple[R, str]:
+    """작업 프로세스에서 func(item)을 실행하고 (결과, print 출력)을 반환합니다."""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        result = func(item)
+    return result, buffer.getvalue()
+
+
+def default_process_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def map_processes(func: Callable[[T], R], items: Iterable[T], workers: Optional[int] = None,
+                  min_items: int = PROCESS_POOL_MIN_ITEMS,
+                  chunk_size: Optional[int] = None) -> Iterator[Tuple[T, R]]:
+    """func(item)을 프로세스 풀에서 실행하고 (item, 결과)를 입력 순서대로 yield합니다.
+
+    func와 item은 pickle 가능해야 합니다 (모듈 최상위 함수).
+    항목 수가 min_items보다 적거나 workers <= 1이면 현재 프로세스에서 순차 실행합니다.
+    """
+    items = list(items)
+    workers = default_process_workers() if workers is None else workers
+    if workers <= 1 or len(items) < max(2, min_items):
+        for item in items:
+            yield item, func(item)
+        return
+
+    if chunk_size is None:
+        # 작업자당 약 4개의 청크로 나눠 부하를 고르게 분산
+        chunk_size = max(1, min(PROCESS_POOL_MAX_CHUNK, len(items) // (workers * 4)))
+    # generator 안이라 phase 컨텍스트 대신 시작/첫 결과/종료 시각을 직접 기록
+    started_ns = time.time_ns()
+    first_result_ns = None
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(partial(_call_captured, func), items, chunksize=chunk_size)
+        for item, (result, output) in zip(items, results):
+            if first_result_ns is None:
+                first_result_ns = time.time_ns()
+            if output:
+                sys.stdout.write(output)
+            yield item, result
+    telemetry.record_phase('process_pool', started_ns, time.time_ns(), workers=workers,
+                           items=len(items), chunk_size=chunk_size,
+                           first_result_seconds=((first_result_ns or started_ns) - started_ns) / 1e9)
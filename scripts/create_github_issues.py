@@ -5,128 +5,128 @@ Tasks 폴더의 마크다운 파일을 읽어서 GitHub Issues를 자동 생성
 """
 
 import os
-import re
-import yaml
-import subprocess
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
-def parse_frontmatter(content: str) -> tuple[Optional[Dict], str]:
-    """마크다운 파일에서 YAML frontmatter를 파싱합니다."""
-    if not content.startswith('---'):
-        return None, content
-    
-    parts = content.split('---', 2)
-    if len(parts) < 3:
-        return None, content
-    
-    try:
-        frontmatter = yaml.safe_load(parts[1])
-        body = parts[2].strip()
-        return frontmatter, body
-    except yaml.YAMLError:
-        return None, content
+import git_repo
+from cli_args import get_int_option, has_flag
+from concurrency import map_processes
+from frontmatter import read_frontmatter
+from github_client import GitHubAPIError, get_client
+from pipeline import Stage, run_pipeline
 
 def get_github_repo() -> Optional[str]:
-    """현재 Git 리포지토리 정보를 가져옵니다."""
-    try:
-        result = subprocess.run(
-            ['git', 'remote', 'get-url', 'origin'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        url = result.stdout.strip()
-        # git@github.com:user/repo.git 또는 https://github.com/user/repo.git 형식
-        match = re.search(r'github\.com[:/]([^/]+/[^/]+?)(?:\.git)?$', url)
-        if match:
-            return match.group(1)
-    except subprocess.CalledProcessError:
-        pass
-    return None
+    """현재 Git 리포지토리 정보를 가져옵니다. (`owner/repo`, .git/config에서 읽음)"""
+    repo_info = git_repo.get_github_repo(offline=True)
+    return '/'.join(repo_info) if repo_info else None
+
+def get_project_node_id(owner: str, project_number: int) -> Optional[str]:
+    """Owner(User/Organization)의 Project 번호로 Project Node ID를 가져옵니다."""
+    query = """
+    query($login: String!, $number: Int!) {
+      repositoryOwner(login: $login) {
+        ... on ProjectV2Owner {
+          projectV2(number: $number) {
+            id
+          }
+        }
+      }
+    }
+    """
+    data = get_client().graphql(query, {'login': owner, 'number': project_number})
+    return ((data.get('repositoryOwner') or {}).get('projectV2') or {}).get('id')
 
-def create_issue_using_gh_cli(title: str, body: str, labels: List[str] = None, 
-                               project: str = None, start_date: str = None, 
-                               due_date: str = None) -> bool:
-    """GitHub CLI를 사용하여 Issue를 생성합니다."""
-    cmd = ['gh', 'issue', 'create', '--title', title, '--body', body]
+def create_issue_via_api(repo: str, title: str, body: str, labels: List[str] = None, 
+                         project: str = None, start_date: str = None, 
+                         due_date: str = None) -> bool:
+    """GitHub API를 사용하여 Issue를 생성합니다."""
+    issue_data = {'title': title, 'body': body}
     
     if labels:
-        cmd.extend(['--label', ','.join(labels)])
+        issue_data['labels'] = labels
     
+    client = get_client()
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        issue_url = result.stdout.strip()
+        issue = client.rest('POST', f'repos/{repo}/issues', issue_data)
+        issue_url = issue['html_url']
         print(f"✅ Issue 생성 완료: {issue_url}")
         
-        # Projects에 추가 (GitHub CLI v2.0+)
+        # Projects에 추가 (Projects v2 API)
         if project:
-            issue_number = issue_url.split('/')[-1]
             try:
-                subprocess.run(
-                    ['gh', 'project', 'item-add', project, '--owner', issue_url.split('/')[3], 
-                     '--repo', issue_url.split('/')[4], '--url', issue_url],
-                    check=True
+                project_id = get_project_node_id(repo.split('/')[0], int(project))
+                if not project_id:
+                    raise GitHubAPIError(f"Project {project}를 찾을 수 없습니다.")
+                client.graphql(
+                    """
+                    mutation($projectId: ID!, $contentId: ID!) {
+                      addProjectV2ItemById(input: {projectId: $projectId, contentId: $contentId}) {
+                        item { id }
+                      }
+                    }
+                    """,
+                    {'projectId': project_id, 'contentId': issue['node_id']}
                 )
                 print(f"✅ Project에 추가 완료: {project}")
-            except subprocess.CalledProcessError:
+            except (GitHubAPIError, ValueError):
                 print(f"⚠️  Project 추가 실패 (수동으로 추가해주세요)")
         
         # 날짜 필드 설정 (GitHub Projects v2 API 사용)
         if start_date or due_date:
-            issue_number = issue_url.split('/')[-1]
             print(f"📅 날짜 정보: 시작일={start_date}, 마감일={due_date}")
             print(f"   (GitHub Projects에서 수동으로 날짜를 설정해주세요)")
         
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Issue 생성 실패: {e.stderr}")
-        return False
-    except FileNotFoundError:
-        print("❌ GitHub CLI (gh)가 설치되어 있지 않습니다.")
-        print("   설치 방법: https://cli.github.com/")
+    except GitHubAPIError as e:
+        print(f"❌ Issue 생성 실패: {e}")
         return False
 
-def process_task_files(tasks_dir: Path) -> List[Dict]:
+def parse_task_file(md_file: Path, tasks_dir: Path) -> Optional[Dict]:
+    """Task 파일 하나를 파싱합니다. (프로세스 풀 작업 단위)"""
+    print(f"\n📄 처리 중: {md_file.relative_to(tasks_dir.parent)}")
+    
+    frontmatter, body = read_frontmatter(md_file)
+    
+    if not frontmatter:
+        print(f"⚠️  Frontmatter가 없습니다. 건너뜁니다.")
+        return None
+    
+    # 라벨 생성
+    labels = []
+    if frontmatter.get('priority'):
+        labels.append(frontmatter['priority'].lower())
+    if frontmatter.get('epic'):
+        labels.append(frontmatter['epic'].replace(' ', '-').lower())
+    if frontmatter.get('status'):
+        labels.append(frontmatter['status'].replace(' ', '-').lower())
+    
+    return {
+        'title': frontmatter.get('title', md_file.stem),
+        'body': body,
+        'labels': labels,
+        'start_date': frontmatter.get('start-date'),
+        'due_date': frontmatter.get('due-date') or frontmatter.get('target-date'),
+        'epic': frontmatter.get('epic'),
+        'priority': frontmatter.get('priority'),
+        'file': md_file
+    }
+
+def discover_task_files(tasks_dir: Path) -> List[Path]:
+    """Tasks 폴더의 마크다운 파일 목록을 찾습니다."""
+    return [f for f in sorted(tasks_dir.rglob('*.md')) if not f.name.startswith('.')]
+
+def iter_task_issues(tasks_dir: Path, files: List[Path],
+                     workers: Optional[int] = None) -> Iterator[Dict]:
+    """Task 파일을 파싱한 결과를 파싱되는 대로 yield합니다. (파일이 많으면 프로세스 풀에서 병렬 파싱)"""
+    parse = partial(parse_task_file, tasks_dir=tasks_dir)
+    for _, issue in map_processes(parse, files, workers):
+        if issue:
+            yield issue
+
+def process_task_files(tasks_dir: Path, workers: Optional[int] = None) -> List[Dict]:
     """Tasks 폴더의 모든 마크다운 파일을 처리합니다."""
-    issues = []
-    
-    for md_file in sorted(tasks_dir.rglob('*.md')):
-        if md_file.name.startswith('.'):
-            continue
-        
-        print(f"\n📄 처리 중: {md_file.relative_to(tasks_dir.parent)}")
-        
-        with open(md_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        frontmatter, body = parse_frontmatter(content)
-        
-        if not frontmatter:
-            print(f"⚠️  Frontmatter가 없습니다. 건너뜁니다.")
-            continue
-        
-        # 라벨 생성
-        labels = []
-        if frontmatter.get('priority'):
-            labels.append(frontmatter['priority'].lower())
-        if frontmatter.get('epic'):
-            labels.append(frontmatter['epic'].replace(' ', '-').lower())
-        if frontmatter.get('status'):
-            labels.append(frontmatter['status'].replace(' ', '-').lower())
-        
-        issues.append({
-            'title': frontmatter.get('title', md_file.stem),
-            'body': body,
-            'labels': labels,
-            'start_date': frontmatter.get('start-date'),
-            'due_date': frontmatter.get('due-date') or frontmatter.get('target-date'),
-            'epic': frontmatter.get('epic'),
-            'priority': frontmatter.get('priority'),
-            'file': md_file
-        })
-    
-    return issues
+    return list(iter_task_issues(tasks_dir, discover_task_files(tasks_dir), workers))
 
 def main():
     """메인 함수"""
@@ -148,28 +148,26 @@ def main():
         print(f"❌ Tasks 디렉토리를 찾을 수 없습니다.")
         return
     
-    # 마크다운 파일 처리
-    issues = process_task_files(tasks_dir)
-    
-    if not issues:
+    files = discover_task_files(tasks_dir)
+    if not files:
         print("\n❌ 처리할 파일이 없습니다.")
         return
     
-    print(f"\n📊 총 {len(issues)}개의 Issue를 생성할 예정입니다.")
+    print(f"\n📊 Task 파일 {len(files)}개를 처리하여 Issue를 생성할 예정입니다.")
     
     # 사용자 확인
-    response = input("\n계속하시겠습니까? (y/N): ")
-    if response.lower() != 'y':
-        print("취소되었습니다.")
-        return
+    if not has_flag('--yes', '-y'):
+        response = input("\n계속하시겠습니까? (y/N): ")
+        if response.lower() != 'y':
+            print("취소되었습니다.")
+            return
     
     # Issue 생성
     print("\n" + "=" * 50)
     print("GitHub Issues 생성 중...")
     print("=" * 50)
     
-    created_count = 0
-    for issue in issues:
+    def create(issue: Dict) -> bool:
         print(f"\n📝 Issue: {issue['title']}")
         
         # Body에 메타데이터 추가
@@ -183,19 +181,30 @@ def main():
 
 {issue['body']}"""
         
-        success = create_issue_using_gh_cli(
+        return create_issue_via_api(
+            repo=repo,
             title=issue['title'],
             body=body_with_meta,
             labels=issue['labels'],
             start_date=issue['start_date'],
             due_date=issue['due_date']
         )
-        
+    
+    # 파싱 → 생성을 파이프라인으로 연결하여 첫 번째 파일이 파싱되는 즉시 생성 시작
+    # (--concurrency N: N개씩 동시 생성)
+    stages = [Stage('create', lambda issue: (issue, create(issue)),
+                    get_int_option('--concurrency', 1))]
+    source = iter_task_issues(tasks_dir, files, get_int_option('--parse-workers', 0) or None)
+    
+    processed_count = 0
+    created_count = 0
+    for issue, success in run_pipeline(source, stages):
+        processed_count += 1
         if success:
             created_count += 1
     
     print("\n" + "=" * 50)
-    print(f"✅ 완료! {created_count}/{len(issues)}개의 Issue가 생성되었습니다.")
+    print(f"✅ 완료! {created_count}/{processed_count}개의 Issue가 생성되었습니다.")
     print("\n💡 다음 단계:")
     print("   1. GitHub Projects에서 Issues를 확인하세요")
     print("   2. 로드맵 뷰에서 날짜를 수동으로 설정하세요")
@@ -2,192 +2,116 @@
 """
 GitHub Issues 및 Projects 연동 스크립트 (고급 버전)
 GitHub Projects API를 사용하여 Issues를 생성하고 Projects에 자동으로 추가합니다.
+- 파싱 → 중복 확인 → 생성 → Project 추가 → 날짜 설정을 스트리밍 파이프라인으로 처리
+- 생성 단계는 Issue를 최대 25개씩 묶어 createIssue 별칭 mutation 하나로 전송
 """
 
 import os
-import re
-import yaml
-import json
-import subprocess
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Set
 from datetime import datetime
 
-def parse_frontmatter(content: str) -> tuple[Optional[Dict], str]:
-    """마크다운 파일에서 YAML frontmatter를 파싱합니다."""
-    if not content.startswith('---'):
-        return None, content
-    
-    parts = content.split('---', 2)
-    if len(parts) < 3:
-        return None, content
-    
-    try:
-        frontmatter = yaml.safe_load(parts[1])
-        body = parts[2].strip()
-        return frontmatter, body
-    except yaml.YAMLError:
-        return None, content
-
-def get_github_repo() -> Optional[tuple[str, str]]:
-    """현재 Git 리포지토리 정보를 가져옵니다. (owner, repo)"""
-    try:
-        result = subprocess.run(
-            ['git', 'remote', 'get-url', 'origin'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        url = result.stdout.strip()
-        match = re.search(r'github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?$', url)
-        if match:
-            return match.group(1), match.group(2)
-    except subprocess.CalledProcessError:
-        pass
-    return None
-
-def create_issue_via_api(owner: str, repo: str, title: str, body: str, 
-                        labels: List[str] = None) -> Optional[str]:
-    """GitHub API를 사용하여 Issue를 생성합니다."""
-    issue_data = {
-        'title': title,
-        'body': body
-    }
-    
-    if labels:
-        issue_data['labels'] = labels
-    
-    try:
-        result = subprocess.run(
-            ['gh', 'api', 'repos', owner, repo, 'issues', 
-             '--method', 'POST', '--input', '-'],
-            input=json.dumps(issue_data),
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        issue = json.loads(result.stdout)
-        issue_number = issue['number']
-        issue_url = issue['html_url']
-        print(f"✅ Issue #{issue_number} 생성 완료: {issue_url}")
-        return str(issue['id'])  # Node ID 반환
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Issue 생성 실패: {e.stderr}")
-        return None
+from cli_args import get_int_option, has_flag
+from concurrency import map_processes
+from frontmatter import read_frontmatter
+from git_repo import get_github_repo
+from github_client import GitHubAPIError, get_client
+from github_mirror import GitHubMirror
+from issue_batch import ISSUE_CREATE_BATCH_SIZE, create_issues_batch
+from labels import LabelRegistry
+from pipeline import Stage, run_pipeline
+from project_schema import ProjectSchemaCache
+from projects import add_issue_to_project, find_date_fields, update_project_item_date
 
 def get_project_id(owner: str, project_number: int) -> Optional[str]:
     """GitHub Project의 Node ID를 가져옵니다."""
     try:
         # GitHub Projects v2 API 사용
-        query = f"""
-        {{
-          organization(login: "{owner}") {{
-            projectV2(number: {project_number}) {{
+        query = """
+        query($login: String!, $number: Int!) {
+          organization(login: $login) {
+            projectV2(number: $number) {
               id
               title
-            }}
-          }}
-        }}
+            }
+          }
+        }
         """
         
-        result = subprocess.run(
-            ['gh', 'api', 'graphql', '-f', f'query={query}'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        data = json.loads(result.stdout)
-        project = data.get('data', {}).get('organization', {}).get('projectV2')
+        data = get_client().graphql(query, {'login': owner, 'number': project_number})
+        project = (data.get('organization') or {}).get('projectV2')
         if project:
             print(f"📊 Project 찾음: {project['title']} (ID: {project['id']})")
             return project['id']
-    except subprocess.CalledProcessError as e:
-        print(f"⚠️  Project 조회 실패: {e.stderr}")
+    except GitHubAPIError as e:
+        print(f"⚠️  Project 조회 실패: {e}")
     
     return None
 
-def add_issue_to_project(project_id: str, issue_id: str, 
-                        start_date: str = None, due_date: str = None) -> bool:
-    """Issue를 Project에 추가하고 날짜 필드를 설정합니다."""
-    try:
-        # Issue를 Project에 추가
-        mutation = f"""
-        mutation {{
-          addProjectV2ItemById(input: {{
-            projectId: "{project_id}",
-            contentId: "{issue_id}"
-          }}) {{
-            item {{
-              id
-            }}
-          }}
-        }}
-        """
-        
-        result = subprocess.run(
-            ['gh', 'api', 'graphql', '-f', f'query={mutation}'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        data = json.loads(result.stdout)
-        item_id = data.get('data', {}).get('addProjectV2ItemById', {}).get('item', {}).get('id')
-        
-        if item_id:
-            print(f"✅ Project에 추가 완료 (Item ID: {item_id})")
-            
-            # 날짜 필드 설정 (Project에 Date 필드가 있는 경우)
-            if start_date or due_date:
-                print(f"📅 날짜 정보: 시작일={start_date}, 마감일={due_date}")
-                print(f"   (Project에서 Date 필드를 수동으로 설정해주세요)")
-            
-            return True
-    except subprocess.CalledProcessError as e:
-        print(f"⚠️  Project 추가 실패: {e.stderr}")
-        return False
-    
-    return False
+def get_existing_titles(owner: str, repo: str) -> Set[str]:
+    """기존 Issues의 제목 목록을 가져옵니다. (로컬 미러를 증분 갱신한 뒤 조회)"""
+    with GitHubMirror(owner, repo) as mirror:
+        try:
+            mirror.refresh_issues()
+        except GitHubAPIError as e:
+            print(f"⚠️  기존 Issues 조회 실패 (미러의 마지막 상태로 계속 진행): {str(e)}")
+        titles = set(mirror.title_numbers())
+    print(f"📋 기존 Issues {len(titles)}개 발견")
+    return titles
 
-def process_task_files(tasks_dir: Path) -> List[Dict]:
-    """Tasks 폴더의 모든 마크다운 파일을 처리합니다."""
-    issues = []
+def parse_task_file(md_file: Path, tasks_dir: Path) -> Optional[Dict]:
+    """Task 파일 하나를 파싱합니다. (프로세스 풀 작업 단위)"""
+    print(f"\n📄 처리 중: {md_file.relative_to(tasks_dir.parent)}")
     
-    for md_file in sorted(tasks_dir.rglob('*.md')):
-        if md_file.name.startswith('.'):
-            continue
-        
-        print(f"\n📄 처리 중: {md_file.relative_to(tasks_dir.parent)}")
-        
-        with open(md_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        frontmatter, body = parse_frontmatter(content)
-        
-        if not frontmatter:
-            print(f"⚠️  Frontmatter가 없습니다. 건너뜁니다.")
-            continue
-        
-        labels = []
-        if frontmatter.get('priority'):
-            labels.append(frontmatter['priority'].lower())
-        if frontmatter.get('epic'):
-            labels.append(frontmatter['epic'].replace(' ', '-').lower())
-        
-        issues.append({
-            'title': frontmatter.get('title', md_file.stem),
-            'body': body,
-            'labels': labels,
-            'start_date': frontmatter.get('start-date'),
-            'due_date': frontmatter.get('due-date') or frontmatter.get('target-date'),
-            'epic': frontmatter.get('epic'),
-            'priority': frontmatter.get('priority'),
-            'file': md_file
-        })
+    frontmatter, body = read_frontmatter(md_file)
     
-    return issues
+    if not frontmatter:
+        print(f"⚠️  Frontmatter가 없습니다. 건너뜁니다.")
+        return None
+    
+    labels = []
+    if frontmatter.get('priority'):
+        labels.append(frontmatter['priority'].lower())
+    if frontmatter.get('epic'):
+        labels.append(frontmatter['epic'].replace(' ', '-').lower())
+    
+    return {
+        'title': frontmatter.get('title', md_file.stem),
+        'body': body,
+        'labels': labels,
+        'start_date': frontmatter.get('start-date'),
+        'due_date': frontmatter.get('due-date') or frontmatter.get('target-date'),
+        'epic': frontmatter.get('epic'),
+        'priority': frontmatter.get('priority'),
+        'file': md_file
+    }
+
+def discover_task_files(tasks_dir: Path) -> List[Path]:
+    """Tasks 폴더의 마크다운 파일 목록을 찾습니다."""
+    return [f for f in sorted(tasks_dir.rglob('*.md')) if not f.name.startswith('.')]
+
+def iter_task_issues(tasks_dir: Path, files: List[Path],
+                     workers: Optional[int] = None) -> Iterator[Dict]:
+    """Task 파일을 파싱한 결과를 파싱되는 대로 yield합니다. (파일이 많으면 프로세스 풀에서 병렬 파싱)"""
+    parse = partial(parse_task_file, tasks_dir=tasks_dir)
+    for _, issue in map_processes(parse, files, workers):
+        if issue:
+            yield issue
+
+def process_task_files(tasks_dir: Path, workers: Optional[int] = None) -> List[Dict]:
+    """Tasks 폴더의 모든 마크다운 파일을 처리합니다."""
+    return list(iter_task_issues(tasks_dir, discover_task_files(tasks_dir), workers))
+
+def build_issue_body(issue: Dict) -> str:
+    """일정 정보를 포함한 Issue 본문을 만듭니다."""
+    return f"""## 📅 일정 정보
+- **시작일**: {issue['start_date'] or '미정'}
+- **마감일**: {issue['due_date'] or '미정'}
+
+## 📋 상세 내용
+
+{issue['body']}"""
 
 def main():
     """메인 함수"""
@@ -195,7 +119,7 @@ def main():
     print("=" * 60)
     
     # 리포지토리 확인
-    repo_info = get_github_repo()
+    repo_info = get_github_repo(offline=True)
     if not repo_info:
         print("❌ Git 리포지토리를 찾을 수 없습니다.")
         return
@@ -218,66 +142,116 @@ def main():
         print("   Project 번호를 확인하거나 Organization/User 이름을 확인해주세요.")
         return
     
+    # Date 필드 조회 (시작일/마감일 설정용)
+    schema_cache = ProjectSchemaCache(owner)
+    try:
+        fields = schema_cache.schema(project_number, project_id).date_fields()
+    except GitHubAPIError as e:
+        print(f"⚠️  필드 조회 실패: {e}")
+        fields = {}
+    finally:
+        schema_cache.save()
+    start_field_id, end_field_id = find_date_fields(fields)
+    if not start_field_id and not end_field_id:
+        print("⚠️  Date 필드가 없습니다. 날짜는 Project에서 수동으로 설정해주세요.")
+    
     # Tasks 디렉토리 확인
     tasks_dir = Path('Tasks')
     if not tasks_dir.exists():
         print(f"❌ Tasks 디렉토리를 찾을 수 없습니다.")
         return
     
-    # 마크다운 파일 처리
-    issues = process_task_files(tasks_dir)
-    
-    if not issues:
+    files = discover_task_files(tasks_dir)
+    if not files:
         print("\n❌ 처리할 파일이 없습니다.")
         return
     
-    print(f"\n📊 총 {len(issues)}개의 Issue를 생성할 예정입니다.")
+    print(f"\n📊 Task 파일 {len(files)}개를 처리하여 Issue를 생성할 예정입니다.")
     
     # 사용자 확인
-    response = input("\n계속하시겠습니까? (y/N): ")
-    if response.lower() != 'y':
-        print("취소되었습니다.")
-        return
+    if not has_flag('--yes', '-y'):
+        response = input("\n계속하시겠습니까? (y/N): ")
+        if response.lower() != 'y':
+            print("취소되었습니다.")
+            return
     
     # Issue 생성 및 Project 추가
     print("\n" + "=" * 60)
     print("GitHub Issues 생성 및 Projects 연동 중...")
     print("=" * 60)
     
+    # 파싱 → 중복 확인 → 생성 → Project 추가 → 날짜 설정을 파이프라인으로 연결하여
+    # 첫 번째 파일이 파싱되는 즉시 생성이 시작됨 (API 단계는 --concurrency개씩 동시 실행)
+    concurrency = get_int_option('--concurrency', 1)
+    existing_titles: Optional[Set[str]] = None
+    skipped_count = 0
+    
+    def dedupe(issue: Dict) -> Optional[Dict]:
+        nonlocal existing_titles, skipped_count
+        if existing_titles is None:
+            existing_titles = get_existing_titles(owner, repo)
+        title = issue['title'].strip()
+        if title in existing_titles:
+            print(f"⏭️  이미 존재함: {title}")
+            skipped_count += 1
+            return None
+        existing_titles.add(title)
+        return issue
+    
+    registry = LabelRegistry(owner, repo)
+    
+    def create(batch: List[Dict]) -> List[Dict]:
+        # 묶음의 라벨을 준비한 뒤 createIssue 별칭 mutation 하나로 생성 (Node ID는 Project 추가에 사용)
+        try:
+            registry.ensure({label for issue in batch for label in issue['labels']})
+        except GitHubAPIError as e:
+            print(f"⚠️  라벨 목록 조회 실패 (라벨 없이 진행): {e}")
+        results = create_issues_batch(owner, repo,
+                                      [dict(issue, body=build_issue_body(issue)) for issue in batch],
+                                      registry)
+        for issue, created in zip(batch, results):
+            issue['node_id'] = (created or {}).get('node_id')
+        return batch
+    
+    def add_to_project(issue: Dict) -> Dict:
+        if not issue['node_id']:
+            return issue
+        issue['item_id'] = add_issue_to_project(project_id, issue['node_id'])
+        if issue['item_id']:
+            print(f"✅ Project에 추가 완료: {issue['title']}")
+        else:
+            print(f"⚠️  Project 추가 실패: {issue['title']}")
+        return issue
+    
+    def set_dates(issue: Dict) -> Dict:
+        item_id = issue.get('item_id')
+        if not item_id or item_id == 'exists':
+            return issue
+        for field_id, date_value in ((start_field_id, issue['start_date']),
+                                     (end_field_id, issue['due_date'])):
+            if field_id and date_value:
+                update_project_item_date(project_id, item_id, field_id, str(date_value))
+        return issue
+    
+    stages = [
+        Stage('dedupe', dedupe),
+        Stage('create', create, concurrency, batch_size=ISSUE_CREATE_BATCH_SIZE),
+        Stage('add-to-project', add_to_project, concurrency),
+        Stage('set-dates', set_dates, concurrency),
+    ]
+    source = iter_task_issues(tasks_dir, files, get_int_option('--parse-workers', 0) or None)
+    
+    processed_count = 0
     created_count = 0
-    for issue in issues:
-        print(f"\n📝 Issue: {issue['title']}")
-        
-        # Body에 메타데이터 추가
-        body_with_meta = f"""## 📅 일정 정보
-- **시작일**: {issue['start_date'] or '미정'}
-- **마감일**: {issue['due_date'] or '미정'}
-
-## 📋 상세 내용
-
-{issue['body']}"""
-        
-        # Issue 생성
-        issue_id = create_issue_via_api(
-            owner=owner,
-            repo=repo,
-            title=issue['title'],
-            body=body_with_meta,
-            labels=issue['labels']
-        )
-        
-        if issue_id:
-            # Project에 추가
-            add_issue_to_project(
-                project_id=project_id,
-                issue_id=issue_id,
-                start_date=issue['start_date'],
-                due_date=issue['due_date']
-            )
+    for issue in run_pipeline(source, stages):
+        processed_count += 1
+        if issue['node_id'] and issue.get('item_id'):
             created_count += 1
     
     print("\n" + "=" * 60)
-    print(f"✅ 완료! {created_count}/{len(issues)}개의 Issue가 생성되고 Project에 추가되었습니다.")
+    print(f"✅ 완료! {created_count}/{processed_count}개의 Issue가 생성되고 Project에 추가되었습니다.")
+    if skipped_count:
+        print(f"⏭️  이미 존재하여 건너뜀: {skipped_count}개")
     print(f"\n🔗 GitHub에서 확인: https://github.com/{owner}/{repo}/projects/{project_number}")
 
 if __name__ == '__main__':
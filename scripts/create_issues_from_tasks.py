@@ -2,204 +2,189 @@
 """
 GitHub Issues 생성 스크립트
 Tasks 폴더의 마크다운 파일을 읽어서 GitHub Issues를 자동 생성합니다.
-- 중복 체크 기능 포함
+- 중복 체크 기능 포함 (Issue 본문의 숨은 Task 키 마커 기준)
 - 'Issue Automation' 라벨 자동 추가
+- 매니페스트 기반 증분 동기화 (변경된 Task 파일만 처리, --full로 전체 처리)
+- plan: 로컬 캐시만으로 변경 계획(JSON/NDJSON)과 예상 API 비용을 계산 (네트워크 사용 안 함)
+- apply: plan으로 저장한 계획을 그대로 실행
+- schedule: 일정이 바뀐 Task의 후행 Task(depends-on) 날짜를 다시 계산하여 frontmatter에 반영
+- 새 Issue는 depends-on 의존성 순서(위상 정렬 wave)대로 생성하고 "blocked by" 관계로 연결
+- watch: Tasks/ 변경을 감시하여 바뀐 파일만 바로 동기화 (연결 풀/라벨/Project 스키마를 메모리에 유지)
+- pull: 마지막 pull 이후 바뀐 Issue 상태/Project Item 필드를 Task frontmatter에 반영 (역방향)
+- mirror: Issue/라벨/Project Item 로컬 미러(SQLite)를 만들거나 증분 갱신
+- resume: 중단된 동기화에서 끝나지 않은 작업만 작업 저널로 다시 실행 (목록 재조회 없음)
+- fanout: 같은 Task 트리를 여러 리포지토리/Project에 동시에 동기화 (파싱 1회, 연결 풀 공유)
 """
 
 import os
 import re
-import yaml
-import json
-import subprocess
+import sys
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import quote
 
-def parse_frontmatter(content: str) -> tuple[Optional[Dict], str]:
-    """마크다운 파일에서 YAML frontmatter를 파싱합니다."""
-    if not content.startswith('---'):
-        return None, content
-    
-    parts = content.split('---', 2)
-    if len(parts) < 3:
-        return None, content
-    
-    try:
-        frontmatter = yaml.safe_load(parts[1])
-        body = parts[2].strip()
-        return frontmatter, body
-    except yaml.YAMLError:
-        return None, content
-
-def get_github_repo() -> Optional[tuple[str, str]]:
-    """현재 Git 리포지토리 정보를 가져옵니다. (owner, repo)"""
-    try:
-        result = subprocess.run(
-            ['gh', 'repo', 'view', '--json', 'nameWithOwner'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        repo_info = json.loads(result.stdout)
-        owner, repo = repo_info['nameWithOwner'].split('/')
-        return owner, repo
-    except (subprocess.CalledProcessError, json.JSONDecodeError, ValueError):
-        # 대체 방법: git remote 사용
+import telemetry
+from add_issues_to_project_roadmap import add_issues_to_project_batch, update_project_item_dates_batch
+from cli_args import get_int_option, get_option, get_options, get_positionals, has_flag
+from concurrency import map_processes, run_ordered
+from frontmatter import read_frontmatter, update_fields
+from git_repo import get_github_repo
+from github_client import GitHubAPIError, get_client, track_usage
+from github_mirror import GitHubMirror
+from issue_batch import create_issues_batch
+from issue_markers import (DuplicateTaskKeyError, IssueKeyIndex, check_unique_keys, marker,
+                           task_identity, task_key)
+from labels import AUTOMATION_LABEL, LabelRegistry
+from node_ids import NodeIdResolver
+from project_schema import ProjectSchema, ProjectSchemaCache
+from projects import add_issue_to_project, find_date_fields, update_project_item_date
+from sync_journal import JournalOp, SyncJournal
+from sync_plan import format_estimate, make_header, read_plan, write_plan
+from task_graph import DependencyCycleError, TaskGraph, graph_fields, link_dependencies
+from task_manifest import ChangedFile, ScanResult, TaskManifest, file_state, hash_bytes
+from task_pull import PullState, frontmatter_updates, issue_changes, item_changes, merge_events
+from task_watcher import DEFAULT_DEBOUNCE, DEFAULT_POLL_INTERVAL, open_watcher, wait_for_changes
+
+# 동기화 대상 Task 파일이 있는 폴더 (Tasks/ 아래, 루트의 다른 파일 제외)
+PRIORITY_DIRS = ('Priority_1', 'Priority_2', 'Priority_3')
+
+def get_existing_issue_numbers(owner: str, repo: str) -> Dict[str, int]:
+    """기존 Issues의 제목 → 번호 매핑을 가져옵니다. (로컬 미러를 증분 갱신한 뒤 조회)"""
+    with GitHubMirror(owner, repo) as mirror:
         try:
-            result = subprocess.run(
-                ['git', 'remote', 'get-url', 'origin'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            url = result.stdout.strip()
-            match = re.search(r'github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?$', url)
-            if match:
-                return match.group(1), match.group(2)
-        except subprocess.CalledProcessError:
-            pass
-    return None
+            mirror.refresh_issues()
+        except GitHubAPIError as e:
+            print(f"⚠️  기존 Issues 조회 실패 (미러의 마지막 상태로 계속 진행): {str(e)}")
+        existing = mirror.title_numbers()
+    print(f"📋 기존 Issues {len(existing)}개 발견")
+    return existing
 
 def get_existing_issues(owner: str, repo: str) -> Set[str]:
     """기존 Issues의 제목 목록을 가져옵니다."""
-    existing_titles = set()
-    try:
-        # 모든 열린 이슈 가져오기
-        result = subprocess.run(
-            ['gh', 'issue', 'list', '--repo', f'{owner}/{repo}', 
-             '--state', 'all', '--limit', '1000', '--json', 'title,number'],
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='ignore',
-            check=True
-        )
-        if result.stdout:
-            issues = json.loads(result.stdout)
-            for issue in issues:
-                existing_titles.add(issue['title'].strip())
-            print(f"📋 기존 Issues {len(existing_titles)}개 발견")
-    except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
-        print(f"⚠️  기존 Issues 조회 실패 (계속 진행): {str(e)}")
-    return existing_titles
+    return set(get_existing_issue_numbers(owner, repo))
 
 def ensure_label_exists(owner: str, repo: str, label: str, color: str = "0E8A16") -> bool:
     """라벨이 존재하는지 확인하고 없으면 생성합니다."""
     try:
-        # 라벨 목록 확인
-        result = subprocess.run(
-            ['gh', 'label', 'list', '--repo', f'{owner}/{repo}', '--json', 'name'],
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='ignore',
-            check=True
-        )
-        if result.stdout:
-            labels = json.loads(result.stdout)
-            label_names = [l['name'] for l in labels]
-            
-            if label in label_names:
-                print(f"✅ 라벨 '{label}' 이미 존재함")
-                return True
+        registry = LabelRegistry(owner, repo).load()
+        if label in registry:
+            print(f"✅ 라벨 '{label}' 이미 존재함")
+            return True
         
         # 라벨 생성
-        subprocess.run(
-            ['gh', 'label', 'create', label, '--repo', f'{owner}/{repo}', 
-             '--color', color, '--description', 'Automatically created issues'],
-            capture_output=True,
-            encoding='utf-8',
-            errors='ignore',
-            check=True
-        )
-        print(f"✅ 라벨 '{label}' 생성 완료")
+        if not registry.ensure([label]):
+            print(f"✅ 라벨 '{label}' 생성 완료")
         return True
-    except subprocess.CalledProcessError as e:
+    except GitHubAPIError:
         # 라벨이 이미 존재할 수도 있음 (에러 무시)
         print(f"⚠️  라벨 '{label}' 처리 중 경고 (계속 진행)")
         return True  # 계속 진행
-    except json.JSONDecodeError:
-        # JSON 파싱 실패 시에도 계속 진행
-        print(f"⚠️  라벨 목록 파싱 실패 (계속 진행)")
-        return True
 
-def ensure_labels_exist(owner: str, repo: str, labels: List[str]) -> List[str]:
+def ensure_labels_exist(owner: str, repo: str, labels: List[str],
+                        registry: Optional[LabelRegistry] = None) -> List[str]:
     """라벨들이 존재하는지 확인하고 없으면 생성합니다."""
-    valid_labels = []
-    
-    # 한 번에 모든 라벨 조회
-    existing_labels = set()
+    registry = registry or LabelRegistry(owner, repo)
     try:
-        result = subprocess.run(
-            ['gh', 'label', 'list', '--repo', f'{owner}/{repo}', '--json', 'name'],
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='ignore',
-            check=True
-        )
-        if result.stdout:
-            existing_labels = {l['name'] for l in json.loads(result.stdout)}
-    except (subprocess.CalledProcessError, json.JSONDecodeError):
-        pass
-    
-    # 각 라벨 확인 및 생성
-    for label in labels:
-        if label in existing_labels:
-            valid_labels.append(label)
-        else:
-            # 라벨 생성 시도
-            try:
-                color = "0E8A16" if label == "Issue Automation" else "0052CC"
-                subprocess.run(
-                    ['gh', 'label', 'create', label, '--repo', f'{owner}/{repo}', 
-                     '--color', color, '--description', 'Auto-created label'],
-                    capture_output=True,
-                    encoding='utf-8',
-                    errors='ignore',
-                    check=True
-                )
-                valid_labels.append(label)
-                existing_labels.add(label)  # 캐시 업데이트
-                print(f"   ✅ 라벨 '{label}' 생성됨")
-            except subprocess.CalledProcessError:
-                print(f"   ⚠️  라벨 '{label}' 생성 실패 (건너뜀)")
-    
-    return valid_labels
+        registry.ensure(labels)
+    except GitHubAPIError as e:
+        print(f"   ⚠️  라벨 목록 조회 실패 (라벨 없이 진행): {e}")
+    return registry.valid(labels)
 
 def create_issue(owner: str, repo: str, title: str, body: str, 
-                labels: List[str] = None) -> Optional[str]:
-    """GitHub CLI를 사용하여 Issue를 생성합니다."""
+                labels: List[str] = None,
+                registry: Optional[LabelRegistry] = None) -> Optional[Dict]:
+    """GitHub API를 사용하여 Issue를 생성합니다.
+    
+    registry가 주어지면 미리 준비된 라벨 목록에서 조회만 하고,
+    없으면 라벨 목록을 조회하여 누락된 라벨을 생성합니다.
+    
+    Returns:
+        생성된 Issue 정보 (number, html_url, node_id 등). 실패 시 None
+    """
     # 라벨 확인 및 생성
     valid_labels = []
     if labels:
-        valid_labels = ensure_labels_exist(owner, repo, labels)
-    
-    cmd = ['gh', 'issue', 'create', '--repo', f'{owner}/{repo}', 
-           '--title', title, '--body', body]
+        if registry is not None:
+            valid_labels = registry.valid(labels)
+        else:
+            valid_labels = ensure_labels_exist(owner, repo, labels)
     
+    issue_data = {'title': title, 'body': body}
     if valid_labels:
-        cmd.extend(['--label', ','.join(valid_labels)])
+        issue_data['labels'] = valid_labels
     
     try:
-        result = subprocess.run(
-            cmd, 
-            capture_output=True, 
-            text=True, 
-            encoding='utf-8',
-            errors='ignore',
-            check=True
-        )
-        issue_url = result.stdout.strip()
-        issue_number = re.search(r'/(\d+)$', issue_url)
-        if issue_number:
-            label_info = f" (라벨: {', '.join(valid_labels)})" if valid_labels else ""
-            print(f"✅ Issue #{issue_number.group(1)} 생성 완료: {issue_url}{label_info}")
-            return issue_url
-    except subprocess.CalledProcessError as e:
-        error_msg = e.stderr if e.stderr else str(e)
-        print(f"❌ Issue 생성 실패: {error_msg}")
+        issue = get_client().rest('POST', f'repos/{owner}/{repo}/issues', issue_data)
+        issue_url = issue['html_url']
+        label_info = f" (라벨: {', '.join(valid_labels)})" if valid_labels else ""
+        print(f"✅ Issue #{issue['number']} 생성 완료: {issue_url}{label_info}")
+        return issue
+    except GitHubAPIError as e:
+        print(f"❌ Issue 생성 실패: {e}")
         return None
-    return None
+
+def update_issue(owner: str, repo: str, number: int, title: str, body: str,
+                 labels: List[str] = None, previous_labels: List[str] = None,
+                 registry: Optional[LabelRegistry] = None) -> bool:
+    """Task 파일이 수정된 경우 기존 Issue의 제목/본문과 라벨 변경분을 반영합니다.
+    
+    라벨은 이전 동기화 때의 라벨(previous_labels)과 비교하여 추가/제거된 것만 반영하므로
+    Issue에 수동으로 붙인 라벨은 유지됩니다.
+    """
+    client = get_client()
+    try:
+        client.rest('PATCH', f'repos/{owner}/{repo}/issues/{number}',
+                    {'title': title, 'body': body})
+        
+        if labels is not None and previous_labels is not None:
+            if registry is not None:
+                labels = registry.valid(labels)
+            added = [l for l in labels if l not in previous_labels]
+            removed = [l for l in previous_labels if l not in labels]
+            if added:
+                client.rest('POST', f'repos/{owner}/{repo}/issues/{number}/labels',
+                            {'labels': added})
+            for label in removed:
+                try:
+                    client.rest('DELETE',
+                                f'repos/{owner}/{repo}/issues/{number}/labels/{quote(label)}')
+                except GitHubAPIError as e:
+                    if e.status != 404:  # 이미 제거된 라벨
+                        raise
+        print(f"✅ Issue #{number} 업데이트 완료")
+        return True
+    except GitHubAPIError as e:
+        print(f"❌ Issue #{number} 업데이트 실패: {e}")
+        return False
+
+def close_issue(owner: str, repo: str, number: int) -> bool:
+    """Task 파일이 삭제된 Issue를 닫습니다."""
+    try:
+        get_client().rest('PATCH', f'repos/{owner}/{repo}/issues/{number}',
+                          {'state': 'closed', 'state_reason': 'not_planned'})
+        print(f"✅ Issue #{number} 닫기 완료")
+        return True
+    except GitHubAPIError as e:
+        print(f"❌ Issue #{number} 닫기 실패: {e}")
+        return False
+
+def render_schedule_section(start_date=None, due_date=None, target_date=None) -> str:
+    """Issue 본문의 일정 섹션. 없는 날짜는 줄을 생략하고, 날짜가 하나도 없으면 빈 문자열
+    
+    update_issue_dates.py도 같은 형식으로 섹션을 교체하도록 이 함수를 사용합니다.
+    """
+    if not (start_date or due_date or target_date):
+        return ''
+    lines = ["## 📅 일정 정보\n"]
+    if start_date:
+        lines.append(f"- **시작일**: {start_date}\n")
+    if due_date:
+        lines.append(f"- **마감일**: {due_date}\n")
+    elif target_date:
+        lines.append(f"- **목표일**: {target_date}\n")
+    lines.append("\n")
+    return ''.join(lines)
 
 def extract_issue_content(frontmatter: Dict, body: str, file_path: Path) -> Dict:
     """마크다운 파일에서 Issue 내용을 추출합니다."""
@@ -223,15 +208,9 @@ def extract_issue_content(frontmatter: Dict, body: str, file_path: Path) -> Dict
         issue_body_parts.append("\n")
     
     # 일정 정보
-    if frontmatter.get('start-date') or frontmatter.get('due-date') or frontmatter.get('target-date'):
-        issue_body_parts.append("## 📅 일정 정보\n")
-        if frontmatter.get('start-date'):
-            issue_body_parts.append(f"- **시작일**: {frontmatter['start-date']}\n")
-        if frontmatter.get('due-date'):
-            issue_body_parts.append(f"- **마감일**: {frontmatter['due-date']}\n")
-        elif frontmatter.get('target-date'):
-            issue_body_parts.append(f"- **목표일**: {frontmatter['target-date']}\n")
-        issue_body_parts.append("\n")
+    issue_body_parts.append(render_schedule_section(frontmatter.get('start-date'),
+                                                    frontmatter.get('due-date'),
+                                                    frontmatter.get('target-date')))
     
     # 원본 본문 추가
     issue_body_parts.append("## 📝 상세 내용\n\n")
@@ -245,6 +224,10 @@ def extract_issue_content(frontmatter: Dict, body: str, file_path: Path) -> Dict
         relative_path = file_path
     issue_body_parts.append(f"\n\n---\n*원본 파일: `{relative_path}`*")
     
+    # 중복 확인용 숨은 마커 (Task ID/경로 기반, 제목이 바뀌어도 유지)
+    key = task_key(task_identity(frontmatter, file_path))
+    issue_body_parts.append(f"\n{marker(key)}")
+    
     issue_body = ''.join(issue_body_parts)
     
     # 라벨 구성
@@ -256,59 +239,98 @@ def extract_issue_content(frontmatter: Dict, body: str, file_path: Path) -> Dict
         epic_label = frontmatter['epic'].replace(' ', '-').replace('(', '').replace(')', '').lower()
         labels.append(epic_label)
     
+    # Project 날짜 필드용 일정 (plan의 set_date 작업)
+    end_date = frontmatter.get('due-date') or frontmatter.get('target-date')
+    dates = {
+        'start': str(frontmatter['start-date']) if frontmatter.get('start-date') else None,
+        'end': str(end_date) if end_date else None
+    }
+    
     return {
         'title': title,
         'body': issue_body,
-        'labels': labels
+        'labels': labels,
+        'task_key': key,
+        'dates': dates,
+        # 의존성 그래프용 (다른 Task가 가리킬 수 있는 키, depends-on 키)
+        **graph_fields(frontmatter, file_path)
     }
 
-def process_task_files(tasks_dir: Path) -> List[Dict]:
-    """Tasks 폴더의 모든 마크다운 파일을 처리합니다."""
-    issues = []
+def discover_task_files(tasks_dir: Path) -> List[Path]:
+    """Tasks 폴더에서 동기화 대상 마크다운 파일 목록을 찾습니다."""
+    files = []
     
     # Priority 폴더의 파일들만 처리 (루트의 다른 파일 제외)
-    priority_dirs = ['Priority_1', 'Priority_2', 'Priority_3']
-    
-    for priority_dir in priority_dirs:
+    for priority_dir in PRIORITY_DIRS:
         priority_path = tasks_dir / priority_dir
         if not priority_path.exists():
             continue
+        files.extend(sorted(priority_path.glob('*.md')))
+    
+    return files
+
+def is_task_file(path: Path, tasks_dir: Path) -> bool:
+    """discover_task_files가 찾는 위치(Tasks/Priority_N/*.md)의 파일인지 확인합니다."""
+    return path.suffix == '.md' and path.parent.name in PRIORITY_DIRS \
+        and path.parent.parent == tasks_dir
+
+def parse_task_file(md_file: Path) -> Optional[Dict]:
+    """Task 파일 하나를 파싱해 Issue 내용을 만듭니다. (프로세스 풀 작업 단위)"""
+    try:
+        rel_path = str(md_file).replace(str(Path.cwd()), '').lstrip('\\/').replace('\\', '/')
+        print(f"\n📄 처리 중: {rel_path}")
         
-        for md_file in sorted(priority_path.glob('*.md')):
-            try:
-                rel_path = str(md_file).replace(str(Path.cwd()), '').lstrip('\\/').replace('\\', '/')
-                print(f"\n📄 처리 중: {rel_path}")
-                
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                frontmatter, body = parse_frontmatter(content)
-                
-                if not frontmatter:
-                    print(f"⚠️  Frontmatter가 없습니다. 건너뜁니다.")
-                    continue
-                
-                issue_content = extract_issue_content(frontmatter, body, md_file)
-                issue_content['file'] = md_file
-                issues.append(issue_content)
-            except Exception as e:
-                print(f"❌ 파일 처리 중 오류 발생: {md_file} - {e}")
-                continue
+        frontmatter, body = read_frontmatter(md_file)
+        
+        if not frontmatter:
+            print(f"⚠️  Frontmatter가 없습니다. 건너뜁니다.")
+            return None
+        
+        issue_content = extract_issue_content(frontmatter, body, md_file)
+        issue_content['file'] = md_file
+        return issue_content
+    except Exception as e:
+        print(f"❌ 파일 처리 중 오류 발생: {md_file} - {e}")
+        return None
+
+def process_task_files(tasks_dir: Path, files: Optional[List[Path]] = None,
+                       workers: Optional[int] = None) -> List[Dict]:
+    """Tasks 폴더의 마크다운 파일을 처리합니다. (files가 주어지면 해당 파일만)
     
-    return issues
+    파일이 많으면 프로세스 풀(workers개, 기본: CPU 수)에서 병렬로 파싱합니다.
+    """
+    if files is None:
+        files = discover_task_files(tasks_dir)
+    
+    return [issue for _, issue in map_processes(parse_task_file, files, workers) if issue]
 
 def main():
-    """메인 함수"""
-    import sys
-    
+    """메인 함수 (하위 명령: plan, apply, schedule, watch, pull, mirror, resume, fanout. 없으면 바로 동기화)"""
+    command = sys.argv[1] if len(sys.argv) > 1 and \
+        sys.argv[1] in ('plan', 'apply', 'schedule', 'watch', 'pull', 'mirror', 'resume',
+                        'fanout') else 'sync'
     # 자동 실행 옵션 확인
-    auto_yes = '--yes' in sys.argv or '-y' in sys.argv
+    auto_yes = has_flag('--yes', '-y')
+    concurrency = get_int_option('--concurrency', 1)
+    # --parse-workers N: Task 파일 파싱 프로세스 수 (기본: CPU 수, 파일이 적으면 단일 프로세스)
+    parse_workers = get_int_option('--parse-workers', 0) or None
+    full_sync = has_flag('--full')
+    close_deleted = has_flag('--close-deleted')
     
     print("🚀 GitHub Issues 생성 스크립트")
     print("=" * 60)
     
-    # 리포지토리 확인
-    repo_info = get_github_repo()
+    if command == 'fanout':
+        # 대상 리포지토리는 --target으로 지정 (현재 리포지토리 확인 생략)
+        tasks_dir = Path('Tasks')
+        if not tasks_dir.exists():
+            print(f"❌ Tasks 디렉토리를 찾을 수 없습니다.")
+            return
+        fanout_main(tasks_dir)
+        return
+    
+    # 리포지토리 확인 (plan, schedule은 네트워크 없이 git remote만 사용)
+    repo_info = get_github_repo(offline=command in ('plan', 'schedule'))
     if not repo_info:
         print("❌ Git 리포지토리를 찾을 수 없습니다.")
         print("   현재 디렉토리가 Git 리포지토리인지 확인해주세요.")
@@ -317,14 +339,17 @@ def main():
     owner, repo = repo_info
     print(f"📦 리포지토리: {owner}/{repo}")
     
-    # 'Issue Automation' 라벨 확인/생성
-    print("\n🏷️  라벨 확인 중...")
-    ensure_label_exists(owner, repo, 'Issue Automation')
-    print("   (추가 라벨은 Issue 생성 시 자동으로 생성됩니다)")
+    if command == 'apply':
+        apply_main(owner, repo)
+        return
     
-    # 기존 Issues 조회
-    print("\n🔍 기존 Issues 확인 중...")
-    existing_titles = get_existing_issues(owner, repo)
+    if command == 'mirror':
+        mirror_main(owner, repo)
+        return
+    
+    if command == 'resume':
+        resume_main(owner, repo)
+        return
     
     # Tasks 디렉토리 확인
     tasks_dir = Path('Tasks')
@@ -332,41 +357,337 @@ def main():
         print(f"❌ Tasks 디렉토리를 찾을 수 없습니다.")
         return
     
-    # 마크다운 파일 처리
+    if command == 'plan':
+        plan_main(owner, repo, tasks_dir)
+        return
+    
+    if command == 'schedule':
+        schedule_main(owner, repo, tasks_dir)
+        return
+    
+    if command == 'watch':
+        watch_main(owner, repo, tasks_dir)
+        return
+    
+    if command == 'pull':
+        pull_main(owner, repo)
+        return
+    
+    # 매니페스트와 비교하여 변경된 파일만 선별 (변경 없는 파일은 stat 1회)
+    manifest = TaskManifest(owner, repo)
+    key_index = IssueKeyIndex(owner, repo)
+    journal = SyncJournal(owner, repo)
+    try:
+        pending = recover_journal(journal, manifest, key_index)
+        if pending:
+            print(f"⚠️  중단된 작업 {len(pending)}개가 있습니다. "
+                  f"(`resume`으로 목록 조회 없이 이어서 실행할 수 있습니다)")
+        with telemetry.phase('discover'):
+            task_files = discover_task_files(tasks_dir)
+        with telemetry.phase('scan', files=len(task_files)):
+            scan = manifest.scan(task_files, force=full_sync)
+        print(f"\n📂 Task 파일 {len(task_files)}개: 변경 {len(scan.changed)}개, "
+              f"변경 없음 {len(scan.unchanged)}개, 삭제 {len(scan.deleted)}개")
+        
+        to_close = deleted_to_close(manifest, scan, close_deleted)
+        
+        if not scan.changed and not to_close:
+            print("\n✅ 변경된 Task 파일이 없습니다.")
+            return
+        
+        sync_changes(owner, repo, tasks_dir, manifest, key_index, scan, to_close, auto_yes,
+                     concurrency, parse_workers, journal=journal)
+    finally:
+        manifest.save()
+        key_index.save()
+        journal.checkpoint()
+
+def deleted_to_close(manifest: TaskManifest, scan: ScanResult,
+                     close_deleted: bool) -> List[Tuple[str, Dict]]:
+    """삭제된 Task 파일 중 닫을 Issue (--close-deleted, 다른 파일이 같은 Issue를 쓰면 제외)"""
+    if not close_deleted:
+        return []
+    live_numbers = {e.get('number') for k, e in manifest.entries.items() if k not in scan.deleted}
+    return [(key, entry) for key, entry in scan.deleted.items()
+            if entry.get('number') and entry['number'] not in live_numbers]
+
+def task_fields(issue: Dict) -> Dict:
+    """매니페스트에 기록할 Issue 정보와 의존성 그래프 정보"""
+    return {
+        'title': issue['title'],
+        'labels': issue['labels'],
+        'task_key': issue['task_key'],
+        'aliases': issue.get('aliases'),
+        'depends_on': issue.get('depends_on'),
+        'schedule': issue.get('schedule') or issue.get('dates'),
+    }
+
+def task_step(changed: ChangedFile, issue: Dict, **extra) -> Tuple[str, Dict]:
+    """Issue 생성/업데이트 작업의 저널 (대상, 데이터). 데이터만으로 다시 실행하고 매니페스트를 복구할 수 있음"""
+    return (f"task:{TaskManifest.key(changed.path)}",
+            dict(file=file_state(changed), fields=task_fields(issue), body=issue['body'], **extra))
+
+def apply_journal_op(manifest: TaskManifest, key_index: IssueKeyIndex, op: JournalOp) -> None:
+    """완료된 저널 작업을 매니페스트와 키 인덱스에 반영합니다. (실행 중 기록과 복구에 공통)"""
+    data, result = op.data, op.result
+    if op.kind in ('create', 'update'):
+        fields = data['fields']
+        number = result.get('number') or data.get('number')
+        manifest.record_file(data['file'], number=number, node_id=result.get('node_id'), **fields)
+        key_index.add(fields['task_key'], number, fields['title'])
+    elif op.kind == 'close':
+        manifest.remove(data['path'])
+        if data.get('task_key'):
+            key_index.forget(data['task_key'])
+    elif op.kind == 'item':
+        manifest.update(data['path'], item_id=result.get('item_id'))
+    elif op.kind == 'dates' and data['path'] in manifest.entries:
+        dates = dict(manifest.entries[data['path']].get('dates') or {})
+        dates[data['name']] = data['value']
+        manifest.update(data['path'], dates=dates)
+
+def recover_journal(journal: SyncJournal, manifest: TaskManifest,
+                    key_index: IssueKeyIndex) -> List[JournalOp]:
+    """지난 실행이 저장하지 못한 완료 작업을 매니페스트에 반영하고, 끝나지 않은 작업을 반환합니다."""
+    ops = journal.load()
+    finished = [op for op in ops if op.finished]
+    for op in finished:
+        apply_journal_op(manifest, key_index, op)
+    if finished:
+        print(f"🧾 작업 저널에서 완료된 작업 {len(finished)}개를 매니페스트에 복구했습니다.")
+    return journal.pending(ops)
+
+def build_task_graph(manifest: TaskManifest, issues: List[Dict], skip=()) -> TaskGraph:
+    """이번에 파싱한 Task와 매니페스트의 나머지 Task로 의존성 그래프를 만듭니다. (파일을 다시 읽지 않음)
+    
+    두 Task 파일이 같은 마커 키를 가지면 DuplicateTaskKeyError를 발생시킵니다.
+    """
+    parsed = {TaskManifest.key(issue['file']): issue for issue in issues}
+    others = {path: entry for path, entry in manifest.entries.items()
+              if path not in parsed and path not in skip}
+    check_unique_keys([(path, issue['task_key']) for path, issue in parsed.items()] +
+                      [(path, entry.get('task_key')) for path, entry in others.items()])
+    nodes = [task_fields(issue) for issue in issues] + list(others.values())
+    return TaskGraph.build(nodes)
+
+def task_waves(graph: TaskGraph, issues: List[Dict]) -> List[List[Dict]]:
+    """Issue 목록을 의존성 순서의 wave로 나눕니다. (같은 wave끼리는 서로 의존하지 않음)"""
+    by_key: Dict[str, List[Dict]] = {}
+    for issue in issues:
+        by_key.setdefault(issue['task_key'], []).append(issue)
+    return [[issue for key in wave for issue in by_key[key]] for wave in graph.waves(by_key)]
+
+def describe_tasks(keys: List[str], manifest: TaskManifest, issues: List[Dict]) -> str:
+    """마커 키 목록을 Task 제목 경로로 표시합니다. (순환 오류 출력용)"""
+    titles = {e.get('task_key'): e.get('title') or path for path, e in manifest.entries.items()}
+    titles.update({issue['task_key']: issue['title'] for issue in issues})
+    return ' → '.join(str(titles.get(key, key)) for key in keys + keys[:1])
+
+def print_duplicate_tasks(error: DuplicateTaskKeyError) -> None:
+    print("\n❌ 같은 Task 번호로 식별되는 파일이 여러 개입니다 (서로의 Issue를 덮어쓰게 됨):")
+    for path in error.paths:
+        print(f"   - {path}")
+    print("   각 파일의 frontmatter에 서로 다른 id를 지정한 뒤 다시 실행하세요.")
+
+def link_task_dependencies(owner: str, repo: str, manifest: TaskManifest,
+                           graph: TaskGraph) -> Tuple[int, int]:
+    """그래프의 의존 관계를 Issue "blocked by" 관계로 맞춥니다.
+    
+    매니페스트의 blocked_by(이미 연결한 선행 Task 키)와 비교하여 바뀐 관계만 별칭 mutation으로 보냅니다.
+    
+    Returns:
+        (반영 수, 실패 수)
+    """
+    entries = {e['task_key']: (path, e) for path, e in manifest.entries.items()
+               if e.get('task_key') and e.get('number')}
+    adds: List[Tuple[str, str]] = []
+    removes: List[Tuple[str, str]] = []
+    for key, (path, entry) in entries.items():
+        desired = [dep for dep in graph.predecessors.get(key, []) if dep in entries]
+        linked = entry.get('blocked_by') or []
+        adds += [(key, dep) for dep in desired if dep not in linked]
+        removes += [(key, dep) for dep in linked if dep not in desired and dep in entries]
+        # 선행 Task의 Issue가 없어짐 (닫힘/삭제) - 기록만 정리 (여러 개여도 한 번에)
+        kept = [dep for dep in linked if dep in desired or dep in entries]
+        if len(kept) != len(linked):
+            manifest.update(path, blocked_by=kept)
+    if not adds and not removes:
+        return 0, 0
+    
+    print(f"\n🔗 의존 관계 반영 중... (추가 {len(adds)}개, 제거 {len(removes)}개)")
+    resolver = NodeIdResolver(owner, repo)
+    resolver.remember({'number': e['number'], 'node_id': e.get('node_id')} for _, e in entries.values())
+    node_ids = resolver.resolve({entries[k][1]['number'] for pair in adds + removes for k in pair})
+    resolver.save()
+    
+    def node_id(key: str) -> Optional[str]:
+        return node_ids.get(entries[key][1]['number'])
+    
+    pending = {}
+    for op, pairs in (('add', adds), ('remove', removes)):
+        for key, dep in pairs:
+            if node_id(key) and node_id(dep):
+                pending[(op, node_id(key), node_id(dep))] = (key, dep)
+    results = link_dependencies([(i, b) for op, i, b in pending if op == 'add'],
+                                [(i, b) for op, i, b in pending if op == 'remove'])
+    
+    done = failed = 0
+    for (op, issue_id, blocking_id), (key, dep) in pending.items():
+        error = results.get((op, issue_id, blocking_id), '결과 없음')
+        path, entry = entries[key]
+        if error:
+            failed += 1
+            print(f"   ❌ #{entry['number']} ← #{entries[dep][1]['number']} 의존 관계 반영 실패: {error}")
+            continue
+        linked = [d for d in entry.get('blocked_by') or [] if d != dep]
+        manifest.update(path, blocked_by=linked + [dep] if op == 'add' else linked)
+        done += 1
+    failed += len(adds) + len(removes) - len(pending)
+    return done, failed
+
+def sync_changes(owner: str, repo: str, tasks_dir: Path, manifest: TaskManifest,
+                 key_index: IssueKeyIndex, scan: ScanResult, to_close: List[Tuple[str, Dict]],
+                 auto_yes: bool, concurrency: int,
+                 parse_workers: Optional[int] = None,
+                 registry: Optional[LabelRegistry] = None,
+                 journal: Optional[SyncJournal] = None,
+                 parsed: Optional[Dict[Path, Dict]] = None) -> Optional[Dict[str, int]]:
+    """변경된 Task 파일을 Issue 생성/업데이트로, 삭제된 파일을 Issue 닫기로 반영합니다.
+    
+    registry가 주어지면 이미 조회한 라벨 목록을 재사용합니다. (watch 모드)
+    parsed(경로 → 파싱 결과)가 주어지면 파일을 다시 파싱하지 않습니다. (fanout)
+    각 작업은 실행 전후로 journal에 기록하고, 매니페스트는 완료 기록으로만 갱신합니다.
+    실행했으면 결과 집계(created, updated, closed, failed, skipped)를 반환합니다.
+    """
+    journal = journal or SyncJournal(owner, repo)
+    # 마크다운 파일 처리 (변경된 파일만)
     print("\n📚 Task 파일 처리 중...")
-    issues = process_task_files(tasks_dir)
+    changed_by_path = {c.path: c for c in scan.changed}
+    if parsed is None:
+        with telemetry.phase('parse', files=len(changed_by_path)):
+            issues = process_task_files(tasks_dir, list(changed_by_path), parse_workers)
+    else:
+        # 다른 대상과 공유하는 파싱 결과이므로 복사본에 Issue 번호 등을 기록
+        issues = [dict(parsed[path]) for path in changed_by_path if path in parsed]
     
-    if not issues:
-        print("\n❌ 처리할 파일이 없습니다.")
+    # Frontmatter가 없는 파일도 해시를 기록하여 다음 실행에서 다시 읽지 않음
+    parsed_paths = {issue['file'] for issue in issues}
+    for path, changed in changed_by_path.items():
+        if path not in parsed_paths:
+            manifest.record(changed)
+    
+    # 의존성 그래프 (변경 없는 Task는 매니페스트에 기록된 depends-on 사용)
+    # 마커 키가 겹치는 Task가 있으면 중복 확인 전에 중단
+    try:
+        with telemetry.phase('graph'):
+            graph = build_task_graph(manifest, issues, skip=scan.deleted)
+            graph.waves()
+    except DependencyCycleError as e:
+        print(f"\n❌ Task 의존성(depends-on)에 순환이 있습니다: {describe_tasks(e.cycle, manifest, issues)}")
         return
+    except DuplicateTaskKeyError as e:
+        print_duplicate_tasks(e)
+        return
+    for issue in issues:
+        if graph.unresolved.get(issue['task_key']):
+            print(f"⚠️  depends-on의 Task를 찾을 수 없습니다 (무시): {issue['title']}")
+    
+    # 이미 Issue와 연결된 파일은 업데이트, 나머지는 마커 키로 중복 확인
+    updated_issues = []
+    candidate_issues = []
+    for issue in issues:
+        number = changed_by_path[issue['file']].issue_number
+        if number:
+            issue['number'] = number
+            updated_issues.append(issue)
+        else:
+            candidate_issues.append(issue)
+    
+    new_issues = []
+    skipped_issues = []
+    if candidate_issues:
+        print("\n🔍 기존 Issues 확인 중... (마커 키 인덱스/검색)")
+        try:
+            with telemetry.phase('dedupe', tasks=len(candidate_issues)):
+                found = key_index.lookup((i['task_key'], i['title']) for i in candidate_issues)
+        except GitHubAPIError as e:
+            print(f"⚠️  기존 Issues 검색 실패 (계속 진행): {e}")
+            found = {}
+        print(f"📋 기존 Issues {len(found)}개 발견")
+        for issue in candidate_issues:
+            match = found.get(issue['task_key'])
+            if not match:
+                new_issues.append(issue)
+                continue
+            existing, by_key = match
+            if by_key:
+                # 마커로 찾은 Task - 파일이 바뀌었으므로 기존 Issue를 업데이트
+                # (매니페스트 연결은 업데이트 완료 기록으로만 반영)
+                issue['number'] = existing['number']
+                updated_issues.append(issue)
+            else:
+                # 마커 없는 예전 Issue를 매니페스트에 연결 (다음 수정부터는 업데이트로 처리)
+                manifest.record(changed_by_path[issue['file']], number=existing['number'],
+                                **task_fields(issue))
+                skipped_issues.append(issue)
+        
+        # 이름이 바뀐 Task 파일: 이전 경로의 항목은 제거하고 해당 Issue는 닫지 않음
+        adopted = {i['number'] for i in updated_issues} | \
+            {manifest.get(i['file'])['number'] for i in skipped_issues}
+        for key, entry in scan.deleted.items():
+            if entry.get('number') in adopted:
+                manifest.remove(key)
+        to_close = [(key, entry) for key, entry in to_close if entry['number'] not in adopted]
     
-    # 중복 제거
-    new_issues = [issue for issue in issues if issue['title'] not in existing_titles]
-    skipped_issues = [issue for issue in issues if issue['title'] in existing_titles]
+    with telemetry.phase('graph'):
+        waves = task_waves(graph, new_issues)
     
     print(f"\n📊 통계:")
-    print(f"   - 총 Task 파일: {len(issues)}개")
+    print(f"   - 변경된 Task 파일: {len(issues)}개")
     print(f"   - 새로 생성할 Issues: {len(new_issues)}개")
+    print(f"   - 업데이트할 Issues: {len(updated_issues)}개")
     print(f"   - 이미 존재하는 Issues: {len(skipped_issues)}개")
+    if to_close:
+        print(f"   - 닫을 Issues (Task 파일 삭제됨): {len(to_close)}개")
+    if len(waves) > 1:
+        print(f"   - 생성 순서 (depends-on): {len(waves)}단계 wave")
     
     if skipped_issues:
         print(f"\n⏭️  건너뛸 Issues:")
         for issue in skipped_issues:
             print(f"   - {issue['title']}")
     
-    if not new_issues:
+    total = len(new_issues) + len(updated_issues) + len(to_close)
+    if not total:
         print("\n✅ 모든 Issues가 이미 존재합니다.")
-        return
+        return {'created': 0, 'updated': 0, 'closed': 0, 'failed': 0,
+                'skipped': len(skipped_issues)}
     
     # 사용자 확인
     if not auto_yes:
-        print(f"\n⚠️  {len(new_issues)}개의 Issue를 생성하시겠습니까?")
+        print(f"\n⚠️  {total}개의 Issue를 생성/업데이트/닫기 하시겠습니까?")
         response = input("계속하시겠습니까? (y/N): ")
         if response.lower() != 'y':
             print("취소되었습니다.")
             return
     else:
-        print(f"\n🚀 자동 모드: {len(new_issues)}개의 Issue를 생성합니다...")
+        print(f"\n🚀 자동 모드: {total}개의 Issue를 처리합니다...")
+    if concurrency > 1:
+        print(f"   (동시 실행: {concurrency}개)")
+    
+    # 필요한 라벨을 한 번에 확인/생성 (이후 Issue 생성 시에는 조회만 수행)
+    registry = registry or LabelRegistry(owner, repo)
+    if new_issues or updated_issues:
+        print("\n🏷️  라벨 확인 중...")
+        needed_labels = {AUTOMATION_LABEL}
+        for issue in new_issues + updated_issues:
+            needed_labels.update(issue['labels'])
+        try:
+            with telemetry.phase('labels'):
+                failed_labels = registry.ensure(needed_labels)
+            print(f"   ✅ 라벨 {len(needed_labels) - len(failed_labels)}개 준비 완료")
+        except GitHubAPIError as e:
+            print(f"⚠️  라벨 목록 조회 실패 (라벨 없이 진행): {e}")
     
     # Issue 생성
     print("\n" + "=" * 60)
@@ -374,31 +695,1117 @@ def main():
     print("=" * 60)
     
     created_count = 0
+    updated_count = 0
+    closed_count = 0
     failed_count = 0
     
-    for issue in new_issues:
-        print(f"\n📝 Issue: {issue['title']}")
-        
-        success = create_issue(
+    def update(issue: Dict) -> bool:
+        entry = changed_by_path[issue['file']].entry or {}
+        print(f"\n✏️  Issue #{issue['number']}: {issue['title']}")
+        return update_issue(
             owner=owner,
             repo=repo,
+            number=issue['number'],
             title=issue['title'],
             body=issue['body'],
-            labels=issue['labels']
+            labels=issue['labels'],
+            previous_labels=entry.get('labels'),
+            registry=registry
         )
-        
-        if success:
-            created_count += 1
-        else:
-            failed_count += 1
+    
+    def close(item: Tuple[str, Dict]) -> bool:
+        key, entry = item
+        print(f"\n🗑️  Issue #{entry['number']}: {key} (파일 삭제됨)")
+        return close_issue(owner, repo, entry['number'])
+    
+    # 의존성 wave 순서로 생성 (wave 안에서는 createIssue 별칭 mutation으로 묶어 문서 단위로 전송,
+    # 문서는 --concurrency N개씩 동시 처리, 출력과 집계는 입력 순서 유지)
+    with telemetry.phase('create', items=len(new_issues)):
+        for wave_number, wave in enumerate(waves, 1):
+            if len(waves) > 1:
+                print(f"\n🌊 Wave {wave_number}/{len(waves)}: {len(wave)}개")
+            ops = journal.intend('create', [task_step(changed_by_path[i['file']], i)
+                                            for i in wave])
+            results = create_issues_batch(owner, repo, wave, registry, concurrency=concurrency)
+            for op, created in zip(ops, results):
+                if created:
+                    apply_journal_op(manifest, key_index, journal.done(
+                        op, number=created['number'], node_id=created.get('node_id')))
+                    created_count += 1
+                else:
+                    journal.failed(op)
+                    failed_count += 1
+    
+    with telemetry.phase('update', items=len(updated_issues)):
+        ops = journal.intend('update', [
+            task_step(changed_by_path[i['file']], i, number=i['number'],
+                      previous_labels=(changed_by_path[i['file']].entry or {}).get('labels'))
+            for i in updated_issues])
+        for op, (issue, success) in zip(ops, run_ordered(update, updated_issues, concurrency)):
+            if success:
+                apply_journal_op(manifest, key_index, journal.done(op))
+                updated_count += 1
+            else:
+                journal.failed(op)
+                failed_count += 1
+    
+    with telemetry.phase('close', items=len(to_close)):
+        ops = journal.intend('close', [
+            (f"task:{key}", {'path': key, 'number': entry['number'], 'task_key': entry.get('task_key')})
+            for key, entry in to_close])
+        for op, (_, success) in zip(ops, run_ordered(close, to_close, concurrency)):
+            if success:
+                apply_journal_op(manifest, key_index, journal.done(op))
+                closed_count += 1
+            else:
+                journal.failed(op)
+                failed_count += 1
+    
+    # depends-on을 Issue "blocked by" 관계로 반영 (바뀐 관계만 일괄 mutation)
+    with telemetry.phase('link'):
+        linked_count, link_failed = link_task_dependencies(owner, repo, manifest, graph)
     
     print("\n" + "=" * 60)
     print(f"✅ 완료!")
     print(f"   - 성공: {created_count}개")
+    print(f"   - 업데이트: {updated_count}개")
+    if to_close:
+        print(f"   - 닫힘: {closed_count}개")
+    if linked_count or link_failed:
+        print(f"   - 의존 관계 반영: {linked_count}개 (실패 {link_failed}개)")
     print(f"   - 실패: {failed_count}개")
     print(f"   - 건너뜀: {len(skipped_issues)}개")
     print(f"\n🔗 GitHub에서 확인: https://github.com/{owner}/{repo}/issues")
+    return {'created': created_count, 'updated': updated_count, 'closed': closed_count,
+            'failed': failed_count, 'skipped': len(skipped_issues)}
+
+def build_sync_plan(owner: str, repo: str, tasks_dir: Path, manifest: TaskManifest,
+                    key_index: IssueKeyIndex, scan: ScanResult, to_close: List[Tuple[str, Dict]],
+                    parse_workers: Optional[int] = None,
+                    project: Optional[ProjectSchema] = None) -> List[Dict]:
+    """변경된 Task 파일과 로컬 캐시만으로 동기화 작업 목록을 만듭니다. (API 호출 없음)
+    
+    중복 확인은 로컬 키 인덱스만 사용하므로, 인덱스에 없는 Task는 생성 작업이 됩니다.
+    """
+    changed_by_path = {c.path: c for c in scan.changed}
+    with telemetry.phase('parse', files=len(changed_by_path)):
+        issues = process_task_files(tasks_dir, list(changed_by_path), parse_workers)
+    
+    creates: List[Dict] = []
+    updates: List[Dict] = []
+    records: List[Dict] = []
+    
+    def file_action(op: str, issue: Dict, **fields) -> Dict:
+        changed = changed_by_path[issue['file']]
+        action = {'op': op, 'path': TaskManifest.key(changed.path), 'hash': changed.content_hash,
+                  'title': issue['title'], 'labels': issue['labels'], 'task_key': issue['task_key'],
+                  'aliases': issue['aliases'], 'depends_on': issue['depends_on'],
+                  'schedule': issue['dates']}
+        action.update(fields)
+        return action
+    
+    # Frontmatter가 없는 파일도 해시만 기록
+    parsed_paths = {issue['file'] for issue in issues}
+    for path, changed in changed_by_path.items():
+        if path not in parsed_paths:
+            records.append({'op': 'record', 'path': TaskManifest.key(path),
+                            'hash': changed.content_hash})
+    
+    candidates = [i for i in issues if not changed_by_path[i['file']].issue_number]
+    found = key_index.lookup(((i['task_key'], i['title']) for i in candidates), offline=True)
+    for issue in issues:
+        entry = changed_by_path[issue['file']].entry or {}
+        number = entry.get('number')
+        if not number and issue['task_key'] in found:
+            existing, by_key = found[issue['task_key']]
+            if not by_key:
+                records.append(file_action('record', issue, number=existing['number']))
+                continue
+            number = existing['number']
+            entry = {}
+        if not number:
+            creates.append(file_action('create', issue, body=issue['body'],
+                                       dates=issue['dates']))
+            continue
+        previous = entry.get('labels')
+        updates.append(file_action(
+            'update', issue, number=number, body=issue['body'], dates=issue['dates'],
+            previous_labels=previous,
+            labels_added=[l for l in issue['labels'] if previous is not None and l not in previous],
+            labels_removed=[l for l in previous or [] if l not in issue['labels']]))
+    
+    # 생성은 depends-on 순서의 wave 번호를 붙여 apply에서 wave별로 실행
+    # (순환이면 DependencyCycleError, 마커 키가 겹치면 DuplicateTaskKeyError)
+    graph = build_task_graph(manifest, issues, skip=scan.deleted)
+    graph.waves()
+    creates = [dict(action, wave=number)
+               for number, wave in enumerate(task_waves(graph, creates), 1) for action in wave]
+    
+    # 이름이 바뀐 Task 파일: 이전 경로의 항목은 지우고 해당 Issue는 닫지 않음
+    adopted = {a['number'] for a in updates + records if a.get('number')}
+    forgets = [{'op': 'forget', 'path': key, 'number': entry['number']}
+               for key, entry in scan.deleted.items() if entry.get('number') in adopted]
+    closes = [{'op': 'close', 'path': key, 'number': entry['number'],
+               'task_key': entry.get('task_key')}
+              for key, entry in to_close if entry['number'] not in adopted]
+    
+    actions: List[Dict] = []
+    if creates or updates:
+        needed = {AUTOMATION_LABEL}
+        for action in creates + updates:
+            needed.update(action['labels'])
+        known = LabelRegistry.cached_names(owner, repo)
+        actions.append({'op': 'ensure_labels', 'labels': sorted(needed),
+                        'missing': sorted(l for l in needed
+                                          if known is None or l.lower() not in known)})
+    actions += creates + updates + records + forgets + closes
+    
+    # Project Item 추가와 날짜 필드 설정 (캐시된 스키마 기준)
+    if project is not None:
+        start_field_id, end_field_id = find_date_fields(project.date_fields())
+        fields = {'start': start_field_id, 'end': end_field_id}
+        project_actions: List[Dict] = []
+        date_actions: List[Dict] = []
+        for action in creates + updates:
+            entry = manifest.entries.get(action['path']) or {}
+            item_id = entry.get('item_id')
+            if not item_id:
+                project_actions.append({
+                    'op': 'add_to_project', 'path': action['path'], 'hash': action['hash'],
+                    'needs_node_id': action['op'] == 'update' and not entry.get('node_id')})
+            synced_dates = entry.get('dates') or {}
+            for name, field_id in fields.items():
+                value = action['dates'].get(name)
+                if field_id and value and (not item_id or synced_dates.get(name) != value):
+                    date_actions.append({'op': 'set_date', 'path': action['path'],
+                                         'hash': action['hash'], 'field': name,
+                                         'field_id': field_id, 'date': value})
+        actions += project_actions + date_actions
+    return actions
+
+def plan_main(owner: str, repo: str, tasks_dir: Path) -> None:
+    """plan: 로컬 캐시 기준 변경 계획을 파일로 저장합니다. (네트워크 사용 안 함)"""
+    out_path = Path(get_option('--out', 'sync-plan.json'))
+    ndjson = has_flag('--ndjson') or out_path.suffix == '.ndjson'
+    parse_workers = get_int_option('--parse-workers', 0) or None
+    project_number = get_int_option('--project', 0)
+    
+    started = time.perf_counter()
+    manifest = TaskManifest(owner, repo)
+    key_index = IssueKeyIndex(owner, repo)
+    with telemetry.phase('discover'):
+        task_files = discover_task_files(tasks_dir)
+    with telemetry.phase('scan', files=len(task_files)):
+        scan = manifest.scan(task_files, force=has_flag('--full'))
+    print(f"\n📂 Task 파일 {len(task_files)}개: 변경 {len(scan.changed)}개, "
+          f"변경 없음 {len(scan.unchanged)}개, 삭제 {len(scan.deleted)}개")
+    
+    live_numbers = {e.get('number') for k, e in manifest.entries.items() if k not in scan.deleted}
+    to_close = [(key, entry) for key, entry in scan.deleted.items()
+                if has_flag('--close-deleted') and entry.get('number')
+                and entry['number'] not in live_numbers]
+    
+    project = None
+    project_info = None
+    if project_number:
+        project = ProjectSchemaCache(owner).cached(project_number)
+        if project is None:
+            print(f"❌ Project #{project_number}의 캐시된 스키마가 없습니다.")
+            print("   로드맵 스크립트를 한 번 실행하여 스키마 캐시를 만든 뒤 다시 시도하세요.")
+            return
+        project_info = {'number': project_number, 'id': project.id}
+    
+    try:
+        actions = build_sync_plan(owner, repo, tasks_dir, manifest, key_index, scan, to_close,
+                                  parse_workers, project)
+    except DependencyCycleError as e:
+        print(f"\n❌ Task 의존성(depends-on)에 순환이 있습니다: {describe_tasks(e.cycle, manifest, [])}")
+        return
+    except DuplicateTaskKeyError as e:
+        print_duplicate_tasks(e)
+        return
+    header = make_header(owner, repo, actions, project=project_info, snapshot={
+        'manifest_entries': len(manifest.entries),
+        'labels_cached': LabelRegistry.cached_names(owner, repo) is not None,
+    })
+    write_plan(out_path, header, actions, ndjson)
+    
+    print(f"\n📝 계획 저장: {out_path} ({len(actions)}개 작업, "
+          f"{time.perf_counter() - started:.2f}초)")
+    for line in format_estimate(header):
+        print(line)
+    if not manifest.entries:
+        print("⚠️  매니페스트가 비어 있어 중복 확인은 로컬 키 인덱스만 사용했습니다. "
+              "기존 Issue가 있다면 먼저 일반 동기화를 실행하세요.")
+    print(f"\n▶️  실행: python scripts/create_issues_from_tasks.py apply {out_path}")
+
+def schedule_main(owner: str, repo: str, tasks_dir: Path) -> None:
+    """schedule: 일정이 바뀐 Task의 후행 Task 날짜를 다시 계산하여 frontmatter에 씁니다.
+    
+    마지막 동기화 이후 바뀐 파일만 파싱하고 나머지는 매니페스트의 depends-on/일정을 사용하며,
+    바뀐 Task에서 영향을 받는 후행 Task만 다시 계산합니다. (네트워크 사용 안 함)
+    --dry-run이면 파일을 고치지 않고 결과만 출력합니다.
+    """
+    dry_run = has_flag('--dry-run')
+    parse_workers = get_int_option('--parse-workers', 0) or None
+    
+    manifest = TaskManifest(owner, repo)
+    with telemetry.phase('discover'):
+        task_files = discover_task_files(tasks_dir)
+    with telemetry.phase('scan', files=len(task_files)):
+        scan = manifest.scan(task_files, force=has_flag('--full'))
+    with telemetry.phase('parse', files=len(scan.changed)):
+        issues = process_task_files(tasks_dir, [c.path for c in scan.changed], parse_workers)
+    
+    try:
+        graph = build_task_graph(manifest, issues, skip=scan.deleted)
+        graph.waves()
+    except DependencyCycleError as e:
+        print(f"\n❌ Task 의존성(depends-on)에 순환이 있습니다: {describe_tasks(e.cycle, manifest, issues)}")
+        return
+    except DuplicateTaskKeyError as e:
+        print_duplicate_tasks(e)
+        return
+    
+    # 마지막 동기화 때와 일정이 다른 Task에서 시작
+    changed = [issue['task_key'] for issue in issues
+               if (manifest.get(issue['file']) or {}).get('schedule') != issue['dates']]
+    # 바뀐 Task 자체도 선행 Task 종료일과 비교하도록 선행 Task에서부터 전파
+    seeds = changed + [dep for key in changed for dep in graph.predecessors.get(key, [])]
+    with telemetry.phase('reschedule', changed=len(changed)):
+        shifted = graph.reschedule(seeds)
+    
+    print(f"\n📅 일정이 바뀐 Task {len(changed)}개 → 밀리는 후행 Task {len(shifted)}개")
+    paths = {e.get('task_key'): Path(path) for path, e in manifest.entries.items()}
+    paths.update({issue['task_key']: issue['file'] for issue in issues})
+    titles = {e.get('task_key'): e.get('title') for e in manifest.entries.values()}
+    titles.update({issue['task_key']: issue['title'] for issue in issues})
+    written = 0
+    for key, dates in shifted.items():
+        path = paths[key]
+        print(f"   - {titles.get(key) or path}: {dates['start']} ~ {dates['end'] or '미정'}")
+        if dry_run:
+            continue
+        try:
+            frontmatter, _ = read_frontmatter(path)
+            fields = {'start-date': dates['start']}
+            if dates['end']:
+                # 마감일 필드는 파일에 있는 것을 고침 (둘 다 없으면 due-date 추가)
+                for name in ('due-date', 'target-date'):
+                    if (frontmatter or {}).get(name):
+                        fields[name] = dates['end']
+                if len(fields) == 1:
+                    fields['due-date'] = dates['end']
+            if update_fields(path, fields):
+                written += 1
+        except (OSError, ValueError) as e:
+            print(f"   ❌ 파일 수정 실패: {path} - {e}")
+    
+    critical = graph.critical_path()
+    if len(critical) > 1:
+        print(f"\n🧭 Critical path: {' → '.join(str(titles.get(k, k)) for k in critical)}")
+    if shifted and not dry_run:
+        print(f"\n✏️  Task 파일 {written}개 수정. 동기화를 실행하면 Issue에 반영됩니다.")
+
+def load_roadmap(owner: str, project_number: int) -> Optional[Dict]:
+    """Project ID와 시작일/종료일 필드 ID를 조회합니다. (스키마 캐시 사용)"""
+    schema_cache = ProjectSchemaCache(owner)
+    try:
+        project = next((p for p in schema_cache.projects() if p['number'] == project_number), None)
+        if project is None:
+            print(f"❌ Project #{project_number}를 찾을 수 없습니다.")
+            return None
+        start_field_id, end_field_id = find_date_fields(
+            schema_cache.schema(project_number, project['id']).date_fields())
+    except GitHubAPIError as e:
+        print(f"❌ Project #{project_number} 조회 실패: {e}")
+        return None
+    finally:
+        schema_cache.save()
+    return {'id': project['id'], 'title': project.get('title'),
+            'fields': {'start': start_field_id, 'end': end_field_id}}
+
+def sync_roadmap_items(roadmap: Dict, manifest: TaskManifest, resolver: NodeIdResolver,
+                       paths: List[Path], journal: SyncJournal,
+                       key_index: IssueKeyIndex) -> None:
+    """동기화한 Task의 Issue를 Project에 추가하고 날짜 필드를 일정과 맞춥니다.
+    
+    매니페스트의 item_id/dates와 비교하여 필요한 추가와 날짜 변경만 별칭 mutation으로 보냅니다.
+    추가/날짜 작업도 journal에 기록하므로 중간에 중단되면 resume으로 이어서 실행합니다.
+    """
+    entries = {}
+    for path in paths:
+        key = TaskManifest.key(path)
+        entry = manifest.entries.get(key)
+        if entry and entry.get('number'):
+            entries[key] = entry
+    
+    missing = {key: e for key, e in entries.items() if not e.get('item_id')}
+    if missing:
+        resolver.remember({'number': e['number'], 'node_id': e.get('node_id')}
+                          for e in missing.values())
+        ops = {e['number']: op for e, op in zip(missing.values(), journal.intend('item', [
+            (f"item:{roadmap['id']}:{key}", {'path': key, 'number': e['number'], 'roadmap': roadmap})
+            for key, e in missing.items()]))}
+        node_ids = resolver.resolve(e['number'] for e in missing.values())
+        results = add_issues_to_project_batch(
+            roadmap['id'], {n: i for n, i in node_ids.items() if n in ops})
+        for number, op in ops.items():
+            result = results.get(number)
+            item_id = ((result.data or {}).get('item') or {}).get('id') \
+                if result is not None and result.ok else None
+            if item_id:
+                apply_journal_op(manifest, key_index, journal.done(op, item_id=item_id))
+                print(f"   ✅ Issue #{number} Project 추가")
+            else:
+                error = result.error if result is not None else 'Node ID 없음'
+                journal.failed(op, error)
+                print(f"   ❌ Issue #{number} Project 추가 실패: {error}")
+    
+    updates = []
+    for key, entry in entries.items():
+        item_id = manifest.entries[key].get('item_id')
+        synced = entry.get('dates') or {}
+        for name, field_id in roadmap['fields'].items():
+            value = (entry.get('schedule') or {}).get(name)
+            if item_id and field_id and value and synced.get(name) != value:
+                updates.append(((key, name), item_id, field_id, value))
+    if updates:
+        ops = dict(zip((u[0] for u in updates), journal.intend('dates', [
+            (f"dates:{roadmap['id']}:{key}:{name}",
+             {'path': key, 'name': name, 'value': value, 'roadmap': roadmap})
+            for (key, name), _, _, value in updates])))
+        results = update_project_item_dates_batch(roadmap['id'], updates)
+        for (key, name), result in results.items():
+            if result.ok:
+                apply_journal_op(manifest, key_index, journal.done(ops[(key, name)]))
+            else:
+                journal.failed(ops[(key, name)], result.error)
+                print(f"   ⚠️  Issue #{entries[key]['number']} 날짜 필드 업데이트 실패: {result.error}")
+        print(f"   📅 Project 날짜 필드 {len(updates)}건 반영")
+
+def watch_main(owner: str, repo: str, tasks_dir: Path) -> None:
+    """watch: Tasks/ 변경을 감시하여 바뀐 파일만 바로 동기화합니다. (Ctrl+C로 종료)
+    
+    HTTP 연결 풀, 매니페스트, 키 인덱스, 라벨 목록, Node ID, Project 스키마를 실행 동안
+    메모리에 유지하므로 이벤트마다 다시 조회하지 않습니다. 이벤트가 없으면 select에서 대기합니다.
+    """
+    concurrency = get_int_option('--concurrency', 4)
+    parse_workers = get_int_option('--parse-workers', 0) or None
+    debounce = get_int_option('--debounce-ms', int(DEFAULT_DEBOUNCE * 1000)) / 1000
+    poll_interval = get_int_option('--poll-ms', int(DEFAULT_POLL_INTERVAL * 1000)) / 1000
+    project_number = get_int_option('--project', 0)
+    close_deleted = has_flag('--close-deleted')
+    
+    manifest = TaskManifest(owner, repo)
+    key_index = IssueKeyIndex(owner, repo)
+    registry = LabelRegistry(owner, repo)
+    resolver = NodeIdResolver(owner, repo)
+    journal = SyncJournal(owner, repo)
+    recover_journal(journal, manifest, key_index)
+    roadmap = None
+    if project_number:
+        roadmap = load_roadmap(owner, project_number)
+        if roadmap is None:
+            return
+        print(f"🗺️  Project: [{project_number}] {roadmap['title']}")
+    
+    def sync(paths: List[Path], complete: bool) -> None:
+        try:
+            # 이벤트와 스캔 사이에 파일이 지워지거나 바뀔 수 있음 (이 이벤트만 실패로 처리)
+            scan = manifest.scan(paths, complete=complete)
+            to_close = deleted_to_close(manifest, scan, close_deleted)
+            if scan.changed or to_close:
+                sync_changes(owner, repo, tasks_dir, manifest, key_index, scan, to_close, True,
+                             concurrency, parse_workers, registry=registry, journal=journal)
+            if roadmap and scan.changed:
+                with telemetry.phase('roadmap', files=len(scan.changed)):
+                    sync_roadmap_items(roadmap, manifest, resolver, [c.path for c in scan.changed],
+                                       journal, key_index)
+        except (GitHubAPIError, OSError, ValueError) as e:
+            # 감시는 계속하고, 실패한 파일은 매니페스트에 기록되지 않아 다음 이벤트/시작 때 다시 처리
+            print(f"❌ 동기화 실패: {e}")
+        finally:
+            manifest.save()
+            key_index.save()
+            resolver.save()
+            journal.checkpoint()
+    
+    # 시작 시 감시 전에 밀린 변경을 먼저 반영
+    watcher = open_watcher(tasks_dir, poll_interval)
+    with telemetry.phase('watch_catch_up'):
+        sync(discover_task_files(tasks_dir), True)
+    print(f"\n👀 {tasks_dir}/ 감시 중... (debounce {debounce * 1000:.0f}ms, Ctrl+C로 종료)")
+    
+    try:
+        while True:
+            changed = wait_for_changes(watcher, debounce)
+            started = time.perf_counter()
+            if tasks_dir in changed:
+                # 이벤트 유실/디렉토리 변경: 전체 목록으로 다시 확인 (변경 없는 파일은 stat 1회)
+                paths, complete = discover_task_files(tasks_dir), True
+            else:
+                paths, complete = sorted(p for p in changed if is_task_file(p, tasks_dir)), False
+            if not paths:
+                continue
+            print(f"\n🔔 변경 감지: {len(paths)}개 파일")
+            with telemetry.phase('watch_event', files=len(paths)):
+                sync(paths, complete)
+            # 오래 실행되므로 이벤트마다 span을 내보내고 지표 파일을 갱신
+            telemetry.flush()
+            print(f"⏱️  반영 완료: {time.perf_counter() - started:.2f}초")
+    except KeyboardInterrupt:
+        print("\n👋 감시를 종료합니다.")
+    finally:
+        watcher.close()
+
+class SyncTarget:
+    """fanout 동기화 대상 하나 (리포지토리, 선택적 Project, 대상별 로컬 상태)"""
+    
+    def __init__(self, owner: str, repo: str, project_number: int = 0):
+        self.owner = owner
+        self.repo = repo
+        self.project_number = project_number
+        self.manifest = TaskManifest(owner, repo)
+        self.key_index = IssueKeyIndex(owner, repo)
+        self.resolver = NodeIdResolver(owner, repo)
+        self.journal = SyncJournal(owner, repo)
+        self.scan: Optional[ScanResult] = None
+        self.to_close: List[Tuple[str, Dict]] = []
+    
+    @property
+    def name(self) -> str:
+        project = f" (Project {self.project_number})" if self.project_number else ""
+        return f"{self.owner}/{self.repo}{project}"
+    
+    def save(self) -> None:
+        self.manifest.save()
+        self.key_index.save()
+        self.resolver.save()
+        self.journal.checkpoint()
+
+def parse_target(spec: str) -> Optional[Tuple[str, str, int]]:
+    """`owner/repo` 또는 `owner/repo:Project번호` 형식의 대상을 (owner, repo, 번호)로 해석합니다."""
+    match = re.fullmatch(r'([\w.-]+)/([\w.-]+?)(?::(\d+))?', spec)
+    if not match:
+        return None
+    return match.group(1), match.group(2), int(match.group(3) or 0)
+
+def fanout_main(tasks_dir: Path) -> None:
+    """fanout: 같은 Task 트리를 여러 리포지토리/Project에 한 번에 동기화합니다.
+    
+    Task 트리는 한 번만 훑고(파일 해시 공유) 변경된 파일도 한 번만 파싱한 뒤, 대상별 변경 비교와
+    Issue/Project 쓰기는 대상마다 동시에 실행합니다. 모든 대상이 HTTP 연결 풀과 rate limiter를
+    공유하며, 요청 수/재시도/대기 시간은 대상별로 집계하여 마지막에 함께 출력합니다.
+    """
+    targets: List[SyncTarget] = []
+    for spec in get_options('--target'):
+        parsed_target = parse_target(spec)
+        if parsed_target is None:
+            print(f"❌ 대상 형식이 올바르지 않습니다: {spec} (owner/repo 또는 owner/repo:Project번호)")
+            return
+        targets.append(SyncTarget(*parsed_target))
+    if not targets:
+        print("❌ --target owner/repo[:Project번호]를 하나 이상 지정해주세요.")
+        return
+    repos = [f"{t.owner}/{t.repo}".lower() for t in targets]
+    if len(set(repos)) != len(repos):
+        print("❌ 같은 리포지토리를 두 번 지정할 수 없습니다. (대상별 매니페스트가 리포지토리 단위)")
+        return
+    
+    auto_yes = has_flag('--yes', '-y')
+    concurrency = get_int_option('--concurrency', 1)
+    parse_workers = get_int_option('--parse-workers', 0) or None
+    full_sync = has_flag('--full')
+    close_deleted = has_flag('--close-deleted')
+    
+    # Task 트리는 한 번만 훑고, 대상별로 매니페스트와 비교 (변경 없는 파일은 대상마다 stat 1회)
+    with telemetry.phase('discover'):
+        task_files = discover_task_files(tasks_dir)
+    hashes: Dict[Path, str] = {}
+    print(f"\n📂 Task 파일 {len(task_files)}개, 대상 {len(targets)}개")
+    for target in targets:
+        pending = recover_journal(target.journal, target.manifest, target.key_index)
+        if pending:
+            print(f"⚠️  {target.name}: 중단된 작업 {len(pending)}개가 있습니다. "
+                  f"(`resume`으로 이어서 실행할 수 있습니다)")
+        with telemetry.phase('scan', files=len(task_files)):
+            target.scan = target.manifest.scan(task_files, force=full_sync, hashes=hashes)
+        target.to_close = deleted_to_close(target.manifest, target.scan, close_deleted)
+        print(f"   - {target.name}: 변경 {len(target.scan.changed)}개, "
+              f"변경 없음 {len(target.scan.unchanged)}개, 삭제 {len(target.scan.deleted)}개")
+    
+    active = [t for t in targets if t.scan.changed or t.to_close]
+    if not active:
+        print("\n✅ 모든 대상에 변경된 Task 파일이 없습니다.")
+        return
+    
+    # 어느 대상에서든 바뀐 파일을 한 번만 파싱하여 모든 대상이 공유
+    changed_paths = list(dict.fromkeys(c.path for t in active for c in t.scan.changed))
+    print(f"\n📚 Task 파일 {len(changed_paths)}개 파싱 중... (모든 대상 공유)")
+    with telemetry.phase('parse', files=len(changed_paths)):
+        parsed = {issue['file']: issue
+                  for issue in process_task_files(tasks_dir, changed_paths, parse_workers)}
+    
+    if not auto_yes:
+        print(f"\n⚠️  {len(active)}개 대상에 변경을 반영하시겠습니까?")
+        response = input("계속하시겠습니까? (y/N): ")
+        if response.lower() != 'y':
+            print("취소되었습니다.")
+            return
+    
+    def run_target(target: SyncTarget) -> Dict:
+        print("\n" + "=" * 60)
+        print(f"📦 {target.name}")
+        print("=" * 60)
+        result: Dict = {'error': None}
+        started = time.perf_counter()
+        with track_usage() as usage:
+            try:
+                if target.scan.changed or target.to_close:
+                    result.update(sync_changes(
+                        target.owner, target.repo, tasks_dir, target.manifest, target.key_index,
+                        target.scan, target.to_close, True, concurrency, journal=target.journal,
+                        parsed=parsed) or {})
+                else:
+                    print("\n✅ 변경된 Task 파일이 없습니다.")
+                if target.project_number and target.scan.changed:
+                    roadmap = load_roadmap(target.owner, target.project_number)
+                    if roadmap is None:
+                        result['error'] = f"Project #{target.project_number} 조회 실패"
+                    else:
+                        with telemetry.phase('roadmap', files=len(target.scan.changed)):
+                            sync_roadmap_items(roadmap, target.manifest, target.resolver,
+                                               [c.path for c in target.scan.changed],
+                                               target.journal, target.key_index)
+            except GitHubAPIError as e:
+                # 다른 대상은 계속 진행, 실패한 파일은 매니페스트에 기록되지 않아 다음 실행 때 다시 처리
+                print(f"❌ 동기화 실패: {e}")
+                result['error'] = str(e)
+            finally:
+                target.save()
+        result.update(seconds=time.perf_counter() - started, requests=dict(usage.requests),
+                      retries=usage.retries, wait=usage.wait)
+        return result
+    
+    # 대상별 동시 실행 (출력은 대상 단위로 묶어 입력 순서대로 출력)
+    started = time.perf_counter()
+    with telemetry.phase('fanout', targets=len(targets)):
+        results = list(run_ordered(run_target, targets, len(targets)))
+    elapsed = time.perf_counter() - started
+    
+    print("\n" + "=" * 60)
+    print("📊 대상별 결과")
+    print("=" * 60)
+    for target, result in results:
+        failed = result['error'] or result.get('failed')
+        print(f"{'❌' if failed else '✅'} {target.name}")
+        print(f"   - 생성 {result.get('created', 0)}, 업데이트 {result.get('updated', 0)}, "
+              f"닫힘 {result.get('closed', 0)}, 실패 {result.get('failed', 0)}, "
+              f"건너뜀 {result.get('skipped', 0)}")
+        print(f"   - 요청 REST {result['requests'].get('core', 0)}회, "
+              f"GraphQL {result['requests'].get('graphql', 0)}회, 재시도 {result['retries']}회, "
+              f"rate limit 대기 {result['wait']:.1f}초, {result['seconds']:.2f}초")
+        if result['error']:
+            print(f"   - 오류: {result['error']}")
+    remaining = get_client().rate_limiter.remaining()
+    if remaining:
+        print(f"\n🔋 남은 rate limit: " + ', '.join(f"{k} {v}" for k, v in sorted(remaining.items())))
+    slowest = max(r['seconds'] for _, r in results)
+    print(f"⏱️  전체 {elapsed:.2f}초 (가장 느린 대상 {slowest:.2f}초, "
+          f"대상별 합계 {sum(r['seconds'] for _, r in results):.2f}초)")
+
+def resume_main(owner: str, repo: str) -> None:
+    """resume: 중단된 동기화에서 끝나지 않은 작업만 다시 실행합니다.
+    
+    작업 저널의 완료 기록으로 매니페스트를 복구한 뒤 미완료 작업만 실행하므로 Task 트리나
+    Issue 목록을 다시 조회하지 않습니다. 생성 작업은 마커 키로 이미 만들어졌는지 먼저 확인하여
+    (키 인덱스 → 미러 → 키 검색) 중복 Issue를 만들지 않습니다.
+    --project N이면 Issue는 있지만 Project Item이 없는 Task(생성 직후 중단)도 Project에 추가합니다.
+    """
+    concurrency = get_int_option('--concurrency', 4)
+    project_number = get_int_option('--project', 0)
+    
+    manifest = TaskManifest(owner, repo)
+    key_index = IssueKeyIndex(owner, repo)
+    resolver = NodeIdResolver(owner, repo)
+    journal = SyncJournal(owner, repo)
+    try:
+        pending = recover_journal(journal, manifest, key_index)
+        roadmap = load_roadmap(owner, project_number) if project_number else None
+        if project_number and roadmap is None:
+            return
+        if not pending and roadmap is None:
+            print("\n✅ 다시 실행할 작업이 없습니다.")
+            return
+        
+        by_kind: Dict[str, List[JournalOp]] = {}
+        for op in pending:
+            by_kind.setdefault(op.kind, []).append(op)
+        print(f"\n🧾 미완료 작업 {len(pending)}개: "
+              + (', '.join(f"{kind} {len(ops)}개" for kind, ops in by_kind.items()) or '없음'))
+        counts = {'done': 0, 'failed': 0, 'existing': 0}
+        
+        def finish(op: JournalOp, ok: bool, **result) -> None:
+            if ok:
+                apply_journal_op(manifest, key_index, journal.done(op, **result))
+                counts['done'] += 1
+            else:
+                journal.failed(op)
+                counts['failed'] += 1
+        
+        # 생성: 중단 직전에 만들어졌을 수 있으므로 마커 키로 먼저 확인
+        creates = by_kind.get('create', [])
+        if creates:
+            with telemetry.phase('dedupe', tasks=len(creates)):
+                found = key_index.lookup((op.data['fields']['task_key'], op.data['fields']['title'])
+                                         for op in creates)
+            remaining = []
+            for op in creates:
+                match = found.get(op.data['fields']['task_key'])
+                if match:
+                    print(f"   ⏭️  이미 생성됨: #{match[0]['number']} {op.data['fields']['title']}")
+                    apply_journal_op(manifest, key_index, journal.done(op, number=match[0]['number']))
+                    counts['existing'] += 1
+                else:
+                    remaining.append(op)
+            creates = remaining
+        
+        updates = by_kind.get('update', [])
+        registry = LabelRegistry(owner, repo)
+        if creates or updates:
+            needed = {AUTOMATION_LABEL}
+            for op in creates + updates:
+                needed.update(op.data['fields']['labels'])
+            try:
+                registry.ensure(needed)
+            except GitHubAPIError as e:
+                print(f"⚠️  라벨 목록 조회 실패 (라벨 없이 진행): {e}")
+        
+        def update(op: JournalOp) -> bool:
+            fields = op.data['fields']
+            print(f"\n✏️  Issue #{op.data['number']}: {fields['title']}")
+            return update_issue(owner, repo, op.data['number'], fields['title'], op.data['body'],
+                                fields['labels'], previous_labels=op.data.get('previous_labels'),
+                                registry=registry)
+        
+        def close(op: JournalOp) -> bool:
+            print(f"\n🗑️  Issue #{op.data['number']}: {op.data['path']} (파일 삭제됨)")
+            return close_issue(owner, repo, op.data['number'])
+        
+        with telemetry.phase('create', items=len(creates)):
+            results = create_issues_batch(
+                owner, repo, [dict(op.data['fields'], body=op.data['body']) for op in creates],
+                registry, concurrency=concurrency)
+            for op, created in zip(creates, results):
+                finish(op, bool(created), number=(created or {}).get('number'),
+                       node_id=(created or {}).get('node_id'))
+        with telemetry.phase('update', items=len(updates)):
+            for op, success in run_ordered(update, updates, concurrency):
+                finish(op, success)
+        closes = by_kind.get('close', [])
+        with telemetry.phase('close', items=len(closes)):
+            for op, success in run_ordered(close, closes, concurrency):
+                finish(op, success)
+        
+        # Project 추가/날짜: 매니페스트와 비교해 아직 필요한 것만 다시 보냄
+        roadmaps: Dict[str, Tuple[Dict, Set[str]]] = {}
+        for op in by_kind.get('item', []) + by_kind.get('dates', []):
+            roadmaps.setdefault(op.data['roadmap']['id'], (op.data['roadmap'], set()))[1].add(
+                op.data['path'])
+        if roadmap:
+            # 생성 직후 중단되어 Project 작업이 기록되지 않은 Issue까지 포함
+            paths = roadmaps.setdefault(roadmap['id'], (roadmap, set()))[1]
+            paths.update(k for k, e in manifest.entries.items() if e.get('number'))
+        with telemetry.phase('roadmap'):
+            for project, paths in roadmaps.values():
+                print(f"\n🗺️  Project {project.get('title') or project['id']}: Task {len(paths)}개 확인")
+                sync_roadmap_items(project, manifest, resolver, [Path(p) for p in sorted(paths)],
+                                   journal, key_index)
+        # 다시 보낼 필요가 없었던 Project 작업 (이미 매니페스트에 반영됨)
+        for op in by_kind.get('item', []) + by_kind.get('dates', []):
+            entry = manifest.entries.get(op.data['path']) or {}
+            if (op.kind == 'item' and entry.get('item_id')) or \
+                    (op.kind == 'dates' and (entry.get('dates') or {}).get(op.data['name'])
+                     == op.data['value']):
+                journal.done(op)
+        
+        print("\n" + "=" * 60)
+        print(f"✅ 재개 완료!")
+        print(f"   - 실행: {counts['done']}개")
+        print(f"   - 이미 반영됨 (중복 생성 안 함): {counts['existing']}개")
+        print(f"   - 실패: {counts['failed']}개")
+    finally:
+        manifest.save()
+        key_index.save()
+        resolver.save()
+        left = journal.checkpoint()
+        if left:
+            print(f"   - 남은 미완료 작업: {left}개 (다시 resume 가능)")
+
+def mirror_main(owner: str, repo: str) -> None:
+    """mirror: 로컬 미러를 증분 갱신합니다. (처음 실행 또는 --rebuild이면 전체 조회)
+    
+    --project N이면 Project Item과 필드 값도 갱신합니다. 미러를 만든 뒤에는 중복 확인이
+    GitHub 검색 대신 미러 조회로 처리됩니다.
+    """
+    project_number = get_int_option('--project', 0)
+    roadmap = load_roadmap(owner, project_number) if project_number else None
+    if project_number and roadmap is None:
+        return
+    
+    with GitHubMirror(owner, repo) as mirror:
+        if has_flag('--rebuild'):
+            mirror.rebuild()
+        first = not mirror.populated()
+        print(f"\n🔄 미러 {'생성' if first else '갱신'} 중...")
+        try:
+            with telemetry.phase('mirror_issues'):
+                print(f"   Issues: {mirror.refresh_issues()}개 반영")
+            with telemetry.phase('mirror_labels'):
+                LabelRegistry(owner, repo).load()
+            if roadmap:
+                with telemetry.phase('mirror_items'):
+                    print(f"   Project Items: {mirror.refresh_project(roadmap['id'])}개 반영")
+        except GitHubAPIError as e:
+            print(f"❌ 미러 갱신 실패: {e}")
+            return
+        stats = mirror.stats()
+    print(f"\n✅ 미러: Issues {stats['issues']}개, 라벨 {stats['labels']}개, "
+          f"Project Items {stats['project_items']}개")
+
+def pull_main(owner: str, repo: str) -> None:
+    """pull: 마지막 pull 이후 바뀐 Issue/Project Item 상태를 Task frontmatter에 반영합니다.
+    
+    Issue가 닫히면 status를 Done으로, 다시 열리면 To Do로 바꾸고, --project N이면 Item의
+    Status와 시작일/종료일 필드도 가져옵니다. 바뀐 키만 제자리에서 고치고 나머지 줄은 그대로 둡니다.
+    --since ISO시각으로 시작 시점을 지정할 수 있고, --dry-run이면 파일과 시점을 저장하지 않습니다.
+    """
+    dry_run = has_flag('--dry-run')
+    project_number = get_int_option('--project', 0)
+    since = get_option('--since')
+    
+    state = PullState(owner, repo)
+    manifest = TaskManifest(owner, repo)
+    by_number = {e['number']: path for path, e in manifest.entries.items() if e.get('number')}
+    by_key = {e['task_key']: path for path, e in manifest.entries.items() if e.get('task_key')}
+    events: List[Tuple[str, str, Dict]] = []
+    unmatched = 0
+    
+    roadmap = None
+    if project_number:
+        roadmap = load_roadmap(owner, project_number)
+        if roadmap is None:
+            return
+    
+    # 미러를 증분 갱신한 뒤, 마지막 pull 이후 바뀐 Issue/Item만 미러에서 읽음
+    with GitHubMirror(owner, repo) as mirror:
+        print("\n🔄 미러 갱신 중...")
+        try:
+            with telemetry.phase('pull_refresh'):
+                mirror.refresh_issues()
+                if roadmap:
+                    mirror.refresh_project(roadmap['id'])
+        except GitHubAPIError as e:
+            print(f"❌ 변경 조회 실패: {e}")
+            print("   pull 시점은 저장하지 않았으므로 다시 실행하면 같은 시점부터 조회합니다.")
+            return
+        
+        issues_since = since or state.issues_since
+        latest_issue = issues_since
+        print(f"\n🔍 바뀐 Issues 조회 중... (since: {issues_since or '처음부터'})")
+        fetched = 0
+        with telemetry.phase('pull_issues'):
+            for issue in mirror.issues_with_label(AUTOMATION_LABEL, issues_since, body=False):
+                fetched += 1
+                latest_issue = max(latest_issue or '', issue.get('updated_at') or '')
+                # 연결되지 않은 Issue도 열림/닫힘 상태는 기록
+                changes = issue_changes(issue, state.closed)
+                path = by_number.get(issue['number']) or by_key.get(issue.get('task_key'))
+                if not path:
+                    unmatched += 1
+                    continue
+                if changes:
+                    events.append((issue.get('updated_at') or '', path, changes))
+        print(f"   {fetched}개 Issue 변경")
+        
+        latest_item = None
+        if roadmap:
+            items_since = since or state.projects_since.get(str(project_number))
+            latest_item = items_since
+            print(f"\n🔍 바뀐 Project Items 조회 중... (since: {items_since or '처음부터'})")
+            fetched = 0
+            with telemetry.phase('pull_items'):
+                for item in mirror.project_items(roadmap['id'], items_since):
+                    fetched += 1
+                    latest_item = max(latest_item or '', item.get('updated_at') or '')
+                    path = by_number.get(item['number'])
+                    if not path:
+                        unmatched += 1
+                        continue
+                    changes = item_changes(item, roadmap['fields']['start'],
+                                           roadmap['fields']['end'])
+                    events.append((item.get('updated_at') or '', path, changes))
+            print(f"   {fetched}개 Item 변경")
+    
+    written = 0
+    for path, changes in merge_events(events).items():
+        try:
+            frontmatter, _ = read_frontmatter(Path(path))
+        except OSError:
+            continue  # 삭제된 Task 파일
+        updates = frontmatter_updates(frontmatter or {}, changes)
+        if updates:
+            print(f"   ✏️  {path}: " + ', '.join(f"{k}={v}" for k, v in updates.items()))
+            if not dry_run:
+                try:
+                    update_fields(Path(path), updates)
+                    written += 1
+                except (OSError, ValueError) as e:
+                    print(f"   ❌ 파일 수정 실패: {path} - {e}")
+                    continue
+        # Project에서 가져온 날짜는 이미 Project와 같으므로 다음 동기화에서 다시 보내지 않음
+        synced = {name: changes[key] for name, key in (('start', 'start-date'), ('end', 'end'))
+                  if key in changes}
+        if synced and not dry_run:
+            manifest.update(path, dates=dict(manifest.entries[path].get('dates') or {}, **synced))
+    
+    if not dry_run:
+        state.issues_since = latest_issue
+        if project_number and latest_item:
+            state.projects_since[str(project_number)] = latest_item
+        state.save()
+        manifest.save()
+    
+    print(f"\n✅ Task 파일 {written}개 수정{' (dry-run: 저장 안 함)' if dry_run else ''}")
+    if unmatched:
+        print(f"   - Task 파일과 연결되지 않은 Issue/Item: {unmatched}개 (건너뜀)")
+    if written:
+        print("   수정된 파일은 다음 동기화에서 Issue 본문에 반영됩니다.")
+
+def stale_paths(actions: List[Dict]) -> Set[str]:
+    """계획 이후 내용이 바뀌었거나 다시 생긴 파일 경로를 찾습니다."""
+    stale = set()
+    hashes = {}
+    for action in actions:
+        path = action.get('path')
+        if not path or path in hashes:
+            continue
+        try:
+            hashes[path] = hash_bytes(Path(path).read_bytes())
+        except OSError:
+            hashes[path] = None
+        expected = None if action['op'] in ('close', 'forget') else action.get('hash')
+        if hashes[path] != expected:
+            stale.add(path)
+    return stale
+
+def apply_sync_plan(owner: str, repo: str, header: Dict, actions: List[Dict],
+                    manifest: TaskManifest, key_index: IssueKeyIndex,
+                    concurrency: int = 1,
+                    journal: Optional[SyncJournal] = None) -> Dict[str, int]:
+    """계획 파일의 작업을 순서대로 실행합니다. 작업별 (성공/실패) 집계를 반환합니다.
+    
+    GitHub에 반영하는 작업(생성/업데이트/닫기/Project 추가/날짜)은 실행 전후로 journal에 기록하고
+    매니페스트는 완료 기록으로만 갱신하므로, 중간에 중단되면 resume으로 이어서 실행합니다.
+    """
+    journal = journal or SyncJournal(owner, repo)
+    counts = {'success': 0, 'failed': 0, 'stale': 0}
+    stale = stale_paths(actions)
+    if stale:
+        print(f"\n⚠️  계획 이후 변경된 파일 {len(stale)}개는 건너뜁니다. (plan을 다시 실행하세요)")
+        for path in sorted(stale):
+            print(f"   - {path}")
+    by_op: Dict[str, List[Dict]] = {}
+    for action in actions:
+        if action.get('path') in stale:
+            counts['stale'] += 1
+            continue
+        by_op.setdefault(action['op'], []).append(action)
+    
+    def changed_file(action: Dict) -> ChangedFile:
+        path = Path(action['path'])
+        return ChangedFile(path, action['hash'], path.stat(), manifest.get(path))
+    
+    def done(success: bool) -> None:
+        counts['success' if success else 'failed'] += 1
+    
+    registry = LabelRegistry(owner, repo)
+    for action in by_op.get('ensure_labels', []):
+        print("\n🏷️  라벨 확인 중...")
+        try:
+            failed_labels = registry.ensure(action['labels'])
+            done(not failed_labels)
+        except GitHubAPIError as e:
+            print(f"⚠️  라벨 목록 조회 실패 (라벨 없이 진행): {e}")
+            done(False)
+    
+    def update(action: Dict) -> bool:
+        print(f"\n✏️  Issue #{action['number']}: {action['title']}")
+        return update_issue(owner, repo, action['number'], action['title'], action['body'],
+                            labels=action['labels'], previous_labels=action.get('previous_labels'),
+                            registry=registry)
+    
+    def close(action: Dict) -> bool:
+        print(f"\n🗑️  Issue #{action['number']}: {action['path']} (파일 삭제됨)")
+        return close_issue(owner, repo, action['number'])
+    
+    # wave 번호 순서로 실행하고 같은 wave 안에서만 묶어서 생성
+    waves: Dict[int, List[Dict]] = {}
+    for action in by_op.get('create', []):
+        waves.setdefault(action.get('wave', 1), []).append(action)
+    def finish(op: JournalOp, success: bool, **result) -> None:
+        if success:
+            apply_journal_op(manifest, key_index, journal.done(op, **result))
+        else:
+            journal.failed(op)
+        done(success)
+    
+    with telemetry.phase('create', items=len(by_op.get('create', []))):
+        for wave in sorted(waves):
+            ops = journal.intend('create', [task_step(changed_file(a), a)
+                                            for a in waves[wave]])
+            results = create_issues_batch(owner, repo, waves[wave], registry,
+                                          concurrency=concurrency)
+            for op, created in zip(ops, results):
+                finish(op, bool(created), number=(created or {}).get('number'),
+                       node_id=(created or {}).get('node_id'))
+    
+    updates = by_op.get('update', [])
+    with telemetry.phase('update', items=len(updates)):
+        ops = journal.intend('update', [
+            task_step(changed_file(a), a, number=a['number'],
+                      previous_labels=a.get('previous_labels'))
+            for a in updates])
+        for op, (_, success) in zip(ops, run_ordered(update, updates, concurrency)):
+            finish(op, success)
+    
+    for action in by_op.get('record', []):
+        manifest.record(changed_file(action), number=action.get('number'),
+                        title=action.get('title'), labels=action.get('labels'),
+                        task_key=action.get('task_key'), aliases=action.get('aliases'),
+                        depends_on=action.get('depends_on'), schedule=action.get('schedule'))
+        if action.get('number'):
+            key_index.add(action['task_key'], action['number'], action['title'])
+        done(True)
+    
+    for action in by_op.get('forget', []):
+        manifest.remove(action['path'])
+        done(True)
+    
+    closes = by_op.get('close', [])
+    with telemetry.phase('close', items=len(closes)):
+        ops = journal.intend('close', [
+            (f"task:{a['path']}", {'path': a['path'], 'number': a['number'],
+                                   'task_key': a.get('task_key')})
+            for a in closes])
+        for op, (_, success) in zip(ops, run_ordered(close, closes, concurrency)):
+            finish(op, success)
+    
+    project = header.get('project') or {}
+    project_id = project.get('id')
+    # resume이 Project 작업을 다시 실행할 때 쓰는 Project 정보 (load_roadmap과 같은 형태)
+    roadmap = {'id': project_id, 'title': f"#{project.get('number')}",
+               'fields': {a['field']: a['field_id'] for a in by_op.get('set_date', [])}}
+    
+    def add_to_project(action: Dict) -> Optional[str]:
+        entry = manifest.entries.get(action['path']) or {}
+        if not entry.get('number'):
+            return None  # Issue 생성 실패
+        node_id = entry.get('node_id')
+        if not node_id:
+            try:
+                node_id = get_client().rest(
+                    'GET', f"repos/{owner}/{repo}/issues/{entry['number']}").get('node_id')
+            except GitHubAPIError as e:
+                print(f"   ⚠️  Issue #{entry['number']} 조회 실패: {e}")
+                return None
+            manifest.update(action['path'], node_id=node_id)
+        item_id = add_issue_to_project(project_id, node_id)
+        print(f"{'✅' if item_id else '⚠️ '} Issue #{entry['number']} Project 추가"
+              f"{'' if item_id else ' 실패'}")
+        return item_id
+    
+    with telemetry.phase('add_to_project', items=len(by_op.get('add_to_project', []))):
+        # Issue가 없는 Task(생성 실패)는 기록하지 않고 실패로 집계
+        additions = []
+        for action in by_op.get('add_to_project', []):
+            number = (manifest.entries.get(action['path']) or {}).get('number')
+            if number:
+                additions.append(action)
+            else:
+                done(False)
+        ops = journal.intend('item', [
+            (f"item:{project_id}:{a['path']}",
+             {'path': a['path'], 'number': manifest.entries[a['path']]['number'],
+              'roadmap': roadmap})
+            for a in additions])
+        for op, (_, item_id) in zip(ops, run_ordered(add_to_project, additions, concurrency)):
+            finish(op, bool(item_id), item_id=item_id if item_id != 'exists' else None)
+    
+    def set_date(action: Dict) -> bool:
+        item_id = (manifest.entries.get(action['path']) or {}).get('item_id')
+        if not item_id:
+            return False
+        return update_project_item_date(project_id, item_id, action['field_id'], action['date'])
+    
+    date_actions = by_op.get('set_date', [])
+    with telemetry.phase('set_date', items=len(date_actions)):
+        ops = journal.intend('dates', [
+            (f"dates:{project_id}:{a['path']}:{a['field']}",
+             {'path': a['path'], 'name': a['field'], 'value': a['date'], 'roadmap': roadmap})
+            for a in date_actions])
+        for op, (_, success) in zip(ops, run_ordered(set_date, date_actions, concurrency)):
+            finish(op, success)
+    return counts
+
+def apply_main(owner: str, repo: str) -> None:
+    """apply: plan으로 저장한 계획을 그대로 실행합니다."""
+    args = get_positionals(('--concurrency',))[1:]  # 'apply' 다음의 계획 파일 경로
+    plan_path = Path(args[0] if args else 'sync-plan.json')
+    try:
+        header, actions = read_plan(plan_path)
+    except (OSError, ValueError) as e:
+        print(f"❌ 계획 파일을 읽을 수 없습니다: {plan_path} - {e}")
+        return
+    if header.get('repo') != f"{owner}/{repo}":
+        print(f"❌ 계획의 리포지토리({header.get('repo')})가 현재 리포지토리와 다릅니다.")
+        return
+    
+    print(f"\n📝 계획: {plan_path} ({header.get('created_at')}, {len(actions)}개 작업)")
+    for line in format_estimate(header):
+        print(line)
+    if not actions:
+        print("\n✅ 실행할 작업이 없습니다.")
+        return
+    
+    if not has_flag('--yes', '-y'):
+        response = input("\n계속하시겠습니까? (y/N): ")
+        if response.lower() != 'y':
+            print("취소되었습니다.")
+            return
+    
+    manifest = TaskManifest(owner, repo)
+    key_index = IssueKeyIndex(owner, repo)
+    journal = SyncJournal(owner, repo)
+    try:
+        pending = recover_journal(journal, manifest, key_index)
+        if pending:
+            print(f"⚠️  중단된 작업 {len(pending)}개가 있습니다. "
+                  f"(`resume`으로 목록 조회 없이 이어서 실행할 수 있습니다)")
+        counts = apply_sync_plan(owner, repo, header, actions, manifest, key_index,
+                                 get_int_option('--concurrency', 1), journal)
+    finally:
+        manifest.save()
+        key_index.save()
+        journal.checkpoint()
+    
+    print("\n" + "=" * 60)
+    print(f"✅ 완료!")
+    print(f"   - 성공: {counts['success']}개")
+    print(f"   - 실패: {counts['failed']}개")
+    if counts['stale']:
+        print(f"   - 건너뜀 (계획 이후 변경): {counts['stale']}개")
 
 if __name__ == '__main__':
     main()
-
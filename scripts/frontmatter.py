@@ -0,0 +1,234 @@
+"""
+Frontmatter 파서 모듈
+Task 마크다운 파일의 YAML frontmatter를 빠르게 파싱합니다.
+- 파일 전체가 아니라 닫는 `---` 줄까지만 읽음
+- Task 스키마처럼 단순한 `key: value` 형식은 YAML 파서 없이 직접 해석 (fast path)
+- 그 외 형식은 C 확장(CSafeLoader)이 있으면 사용하여 yaml로 파싱 (PyYAML은 이때 처음 로드)
+- 본문은 필요할 때 읽는 지연 로딩 모드 제공 (load_document)
+- 단순 필드 값만 바꾸는 제자리 수정 제공 (update_fields, 나머지 줄은 그대로 유지)
+"""
+
+import datetime
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DELIMITER = '---'
+
+_KEY_VALUE_RE = re.compile(r'^([A-Za-z_][A-Za-z0-9_-]*):(?:[ \t]+(.*?))?[ \t]*$')
+_INT_RE = re.compile(r'^[-+]?(?:0|[1-9][0-9]*)$')
+_DATE_RE = re.compile(r'^([0-9]{4})-([0-9]{2})-([0-9]{2})$')
+# 값 중간의 매핑 구분자(`: `), 주석(` #`), 끝의 `:`, 탭
+_PLAIN_INDICATOR_RE = re.compile(r':(?:\s|$)|\s#|\t')
+_NULL_VALUES = {'', '~', 'null', 'Null', 'NULL'}
+_BOOL_VALUES = {
+    'yes': True, 'Yes': True, 'YES': True, 'true': True, 'True': True, 'TRUE': True,
+    'on': True, 'On': True, 'ON': True,
+    'no': False, 'No': False, 'NO': False, 'false': False, 'False': False, 'FALSE': False,
+    'off': False, 'Off': False, 'OFF': False,
+}
+# plain scalar 첫 글자로 올 수 없거나 다른 타입으로 해석될 수 있는 문자
+_UNSAFE_PLAIN_START = set('-?:,[]{}#&*!|>\'"%@`=<.+0123456789')
+
+_MISSING = object()
+
+
+def _parse_scalar(value: str) -> Any:
+    """단순 스칼라를 yaml.safe_load와 같은 타입으로 해석합니다. 애매하면 _MISSING."""
+    if value in _NULL_VALUES:
+        return None
+    first = value[0]
+    if first == '"':
+        inner = value[1:-1]
+        if len(value) >= 2 and value[-1] == '"' and '"' not in inner and '\\' not in inner:
+            return inner
+        return _MISSING
+    if first == "'":
+        inner = value[1:-1]
+        if len(value) >= 2 and value[-1] == "'" and "'" not in inner:
+            return inner
+        return _MISSING
+    if value in _BOOL_VALUES:
+        return _BOOL_VALUES[value]
+    if _INT_RE.match(value):
+        return int(value)
+    match = _DATE_RE.match(value)
+    if match:
+        try:
+            return datetime.date(*map(int, match.groups()))
+        except ValueError:
+            return _MISSING
+    if first in _UNSAFE_PLAIN_START or _PLAIN_INDICATOR_RE.search(value):
+        return _MISSING
+    return value
+
+
+def parse_flat(header: str) -> Optional[Dict[str, Any]]:
+    """평면 `key: value` 형식의 frontmatter를 직접 해석합니다. 지원하지 않는 형식이면 None."""
+    result: Dict[str, Any] = {}
+    for line in header.splitlines():
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+        match = _KEY_VALUE_RE.match(line)
+        if not match or match.group(1) in _BOOL_VALUES or match.group(1) in _NULL_VALUES:
+            return None
+        value = _parse_scalar(match.group(2) or '')
+        if value is _MISSING:
+            return None
+        result[match.group(1)] = value
+    return result
+
+
+def _yaml():
+    """PyYAML 모듈 (가져오기 비용이 커서 fast path로 해석하지 못한 헤더가 있을 때만 로드)"""
+    import yaml
+    return yaml
+
+
+_SafeLoader = None
+
+
+def _safe_loader():
+    """C 확장(libyaml)이 있으면 CSafeLoader, 없으면 SafeLoader"""
+    global _SafeLoader
+    if _SafeLoader is None:
+        yaml = _yaml()
+        _SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    return _SafeLoader
+
+
+def load_header(header: str) -> Any:
+    """frontmatter 헤더 문자열을 파싱합니다. (fast path → yaml)"""
+    parsed = parse_flat(header)
+    if parsed is not None:
+        return parsed or None
+    return _yaml().load(header, Loader=_safe_loader())
+
+
+def parse_frontmatter(content: str) -> Tuple[Optional[Dict], str]:
+    """마크다운 파일에서 YAML frontmatter를 파싱합니다."""
+    if not content.startswith(DELIMITER):
+        return None, content
+
+    parts = content.split(DELIMITER, 2)
+    if len(parts) < 3:
+        return None, content
+
+    try:
+        frontmatter = load_header(parts[1])
+        body = parts[2].strip()
+        return frontmatter, body
+    except _yaml().YAMLError:
+        return None, content
+
+
+class FrontmatterDocument:
+    """frontmatter는 바로 파싱하고 본문은 처음 접근할 때 읽는 문서"""
+
+    def __init__(self, path: Path, frontmatter: Optional[Dict], body_offset: Optional[int],
+                 encoding: str = 'utf-8'):
+        self.path = path
+        self.frontmatter = frontmatter
+        self._body_offset = body_offset
+        self._encoding = encoding
+        self._body: Optional[str] = None
+
+    @property
+    def body(self) -> str:
+        """본문 (frontmatter 이후 내용, 앞뒤 공백 제거)"""
+        if self._body is None:
+            with open(self.path, 'rb') as f:
+                if self._body_offset:
+                    f.seek(self._body_offset)
+                self._body = f.read().decode(self._encoding).strip()
+        return self._body
+
+
+def load_document(path: Path, encoding: str = 'utf-8') -> FrontmatterDocument:
+    """닫는 `---` 줄까지만 읽어 frontmatter를 파싱합니다. 본문은 지연 로딩됩니다."""
+    with open(path, 'rb') as f:
+        first = f.readline()
+        if not first.startswith(DELIMITER.encode()):
+            return FrontmatterDocument(path, None, 0, encoding)
+        header_lines = [first[len(DELIMITER):]]
+        for line in f:
+            if line.rstrip() == DELIMITER.encode():
+                break
+            header_lines.append(line)
+        else:
+            # 닫는 구분자가 없음
+            return FrontmatterDocument(path, None, 0, encoding)
+        body_offset = f.tell()
+    try:
+        frontmatter = load_header(b''.join(header_lines).decode(encoding))
+    except _yaml().YAMLError:
+        return FrontmatterDocument(path, None, 0, encoding)
+    return FrontmatterDocument(path, frontmatter, body_offset, encoding)
+
+
+def read_frontmatter(path: Path, encoding: str = 'utf-8') -> Tuple[Optional[Dict], str]:
+    """파일에서 (frontmatter, 본문)을 읽습니다. frontmatter가 없으면 (None, 전체 내용)."""
+    document = load_document(path, encoding)
+    return document.frontmatter, document.body
+
+
+def update_fields(path: Path, fields: Dict[str, Any], encoding: str = 'utf-8') -> bool:
+    """frontmatter의 `key: value` 줄을 제자리에서 바꿉니다. (없는 키는 닫는 `---` 앞에 추가)
+
+    다른 줄, 줄바꿈 문자, 본문은 그대로 유지하며 임시 파일 + rename으로 원자적으로 저장합니다.
+    값이 None이면 해당 줄을 지웁니다. 내용이 바뀌었으면 True를 반환합니다.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    text = data.decode(encoding)
+    lines = text.splitlines(keepends=True)
+    if not lines or lines[0].rstrip('\r\n') != DELIMITER:
+        raise ValueError(f"frontmatter가 없습니다: {path}")
+    end = next((i for i in range(1, len(lines)) if lines[i].rstrip('\r\n') == DELIMITER), None)
+    if end is None:
+        raise ValueError(f"frontmatter 닫는 구분자가 없습니다: {path}")
+    newline = '\r\n' if lines[0].endswith('\r\n') else '\n'
+    
+    remaining = dict(fields)
+    header: List[str] = []
+    for line in lines[1:end]:
+        match = _KEY_VALUE_RE.match(line.rstrip('\r\n'))
+        if match and match.group(1) in remaining:
+            value = remaining.pop(match.group(1))
+            if value is not None:
+                # 기존 줄이 따옴표 문자열이면 같은 스타일 유지
+                quoted = (match.group(2) or '').startswith('"')
+                header.append(f"{match.group(1)}: {_format_scalar(value, quoted)}{newline}")
+            continue
+        header.append(line)
+    for key, value in remaining.items():
+        if value is not None:
+            header.append(f"{key}: {_format_scalar(value)}{newline}")
+    
+    updated = ''.join([lines[0]] + header + lines[end:])
+    if updated == text:
+        return False
+    import tempfile
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(updated.encode(encoding))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return True
+
+
+def _format_scalar(value: Any, quoted: bool = False) -> str:
+    """값을 frontmatter 한 줄 스칼라로 씁니다. (날짜는 ISO, 해석이 애매한 문자열은 따옴표)"""
+    if isinstance(value, (datetime.date, int)) and not isinstance(value, bool):
+        return str(value)
+    text = str(value)
+    if text and (_DATE_RE.match(text) or (not quoted and _parse_scalar(text) == text)):
+        return text
+    return '"' + text.replace('\\', '\\\\').replace('"', '\\"') + '"'
@@ -0,0 +1,134 @@
+"""
+리포지토리 확인 모듈
+현재 작업 트리의 GitHub 리포지토리(owner, repo)를 `.git/config`에서 직접 읽습니다.
+- `git`/`gh` 프로세스를 실행하지 않음 (watch, pre-commit hook 등에서 시작 지연 최소화)
+- `GIT_DIR`, 상위 디렉토리의 `.git`, 작업 트리(worktree)의 `.git` 파일(gitdir:)과 commondir 지원
+- origin remote를 우선 사용하고, 없으면 GitHub URL을 가진 첫 번째 remote 사용
+- 결과는 작업 트리별로 캐시하고, config 파일의 크기/수정 시각이 바뀌면 다시 읽음
+- config에서 찾지 못하면 `gh repo view`로 대체 (offline이면 생략)
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from cache_store import load_json, save_json
+
+CACHE_NAME = 'repos.json'
+GITHUB_URL_RE = re.compile(r'github\.com[:/]([^/\s]+)/([^/\s]+?)(?:\.git)?/?$')
+_SECTION_RE = re.compile(r'^\s*\[\s*([\w.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]')
+_VALUE_RE = re.compile(r'^\s*([\w-]+)\s*=\s*(.*?)\s*$')
+_COMMENT_RE = re.compile(r'\s+[#;].*$')
+
+
+def find_git_config(start: Optional[Path] = None) -> Optional[Tuple[Path, Path]]:
+    """(작업 트리 경로, config 파일 경로)를 찾습니다. Git 리포지토리가 아니면 None."""
+    git_dir_env = os.environ.get('GIT_DIR')
+    if git_dir_env:
+        git_dir = Path(git_dir_env).resolve()
+        worktree = Path(os.environ.get('GIT_WORK_TREE') or (start or Path.cwd())).resolve()
+    else:
+        worktree = git_dir = None
+        current = (start or Path.cwd()).resolve()
+        for directory in (current, *current.parents):
+            dot_git = directory / '.git'
+            if dot_git.is_dir():
+                worktree, git_dir = directory, dot_git
+                break
+            if dot_git.is_file():
+                # 작업 트리/서브모듈: "gitdir: <경로>"
+                content = dot_git.read_text(encoding='utf-8', errors='ignore').strip()
+                if content.startswith('gitdir:'):
+                    worktree = directory
+                    git_dir = (directory / content[len('gitdir:'):].strip()).resolve()
+                break
+        if git_dir is None:
+            return None
+    commondir = git_dir / 'commondir'
+    if commondir.is_file():
+        git_dir = (git_dir / commondir.read_text(encoding='utf-8').strip()).resolve()
+    config = git_dir / 'config'
+    return (worktree, config) if config.is_file() else None
+
+
+def remote_urls(config: Path) -> Dict[str, str]:
+    """config 파일의 remote 이름 → URL (파일에 적힌 순서)"""
+    urls: Dict[str, str] = {}
+    remote = None
+    for line in config.read_text(encoding='utf-8', errors='ignore').splitlines():
+        if line.lstrip().startswith(('#', ';')):
+            continue
+        section = _SECTION_RE.match(line)
+        if section:
+            remote = section.group(2) if section.group(1).lower() == 'remote' else None
+            continue
+        value = _VALUE_RE.match(line)
+        if remote is not None and value and value.group(1).lower() == 'url':
+            url = value.group(2)
+            if url.startswith('"') and '"' in url[1:]:
+                url = url[1:url.index('"', 1)]
+            else:
+                url = _COMMENT_RE.sub('', url)
+            urls.setdefault(remote, url)
+    return urls
+
+
+def parse_github_url(url: str) -> Optional[Tuple[str, str]]:
+    """GitHub remote URL(https/ssh/scp 형식)에서 (owner, repo)를 꺼냅니다."""
+    match = GITHUB_URL_RE.search(url.strip())
+    return (match.group(1), match.group(2)) if match else None
+
+
+def repo_from_config(config: Path) -> Optional[Tuple[str, str]]:
+    urls = remote_urls(config)
+    for name in ['origin'] + [n for n in urls if n != 'origin']:
+        repo_info = parse_github_url(urls.get(name, ''))
+        if repo_info:
+            return repo_info
+    return None
+
+
+def repo_from_gh() -> Optional[Tuple[str, str]]:
+    """`gh repo view`로 리포지토리를 확인합니다. (네트워크 사용)"""
+    import json
+    import subprocess
+    try:
+        result = subprocess.run(
+            ['gh', 'repo', 'view', '--json', 'nameWithOwner'],
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            errors='ignore',
+            check=True
+        )
+        owner, repo = json.loads(result.stdout)['nameWithOwner'].split('/')
+        return owner, repo
+    except (subprocess.CalledProcessError, FileNotFoundError, ValueError, KeyError):
+        return None
+
+
+def get_github_repo(offline: bool = False) -> Optional[Tuple[str, str]]:
+    """현재 작업 트리의 GitHub 리포지토리 (owner, repo)를 반환합니다.
+
+    `.git/config`의 remote URL을 우선 사용하고, 찾지 못하면(offline이 아니면) `gh repo view`로
+    확인합니다. 결과는 작업 트리별로 캐시하며 config가 바뀌면 다시 읽습니다.
+    """
+    found = find_git_config()
+    if found is None:
+        return None if offline else repo_from_gh()
+    worktree, config = found
+    st = config.stat()
+    signature = [str(config), st.st_mtime_ns, st.st_size]
+    cache = load_json(CACHE_NAME, {}) or {}
+    cached = cache.get(str(worktree))
+    if cached and cached.get('config') == signature and cached.get('repo'):
+        repo_info = tuple(cached['repo'])
+    else:
+        repo_info = repo_from_config(config)
+        if repo_info is None and not offline:
+            repo_info = repo_from_gh()
+        if repo_info is not None:
+            cache[str(worktree)] = {'config': signature, 'repo': list(repo_info)}
+            save_json(CACHE_NAME, cache)
+    return repo_info
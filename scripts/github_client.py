@@ -0,0 +1,479 @@
+"""
+GitHub API 클라이언트 모듈
+모든 스크립트가 공유하는 keep-alive HTTP 연결 풀로 REST/GraphQL 요청을 처리합니다.
+- 요청마다 `gh` 프로세스를 생성하지 않고 연결(TLS 세션)을 재사용
+- GITHUB_API_URL 환경 변수로 로컬 가짜 GitHub 서버를 지정할 수 있음
+- Retry-After / X-RateLimit-* 헤더를 읽어 rate limit에 맞춰 요청 속도를 조절
+- REST GET 응답은 ETag/Last-Modified로 캐시하고 조건부 요청으로 재검증 (http_cache.py)
+- 추적이 켜져 있으면 호출마다 span을 기록 (telemetry.py)
+- track_usage()로 묶은 구간(예: fanout의 동기화 대상 하나)의 요청 수/재시도/대기 시간을 집계
+- http.client(ssl 포함)는 첫 연결 시점에 로드 (네트워크가 필요 없는 실행의 시작 시간 단축)
+"""
+
+import atexit
+import contextvars
+import json
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+import telemetry
+from cli_args import get_int_option, has_flag
+from http_cache import DEFAULT_MAX_BYTES, ResponseCache
+
+if TYPE_CHECKING:
+    import http.client
+
+DEFAULT_API_URL = 'https://api.github.com'
+USER_AGENT = 'task-sync-scripts'
+# 응답을 받지 못했을 때 다시 보내도 결과가 같은 메서드
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'})
+
+
+def _http():
+    """http.client 모듈 (ssl까지 가져오므로 실제로 연결할 때 로드)"""
+    import http.client
+    return http.client
+
+
+def _stale_connection_errors() -> Tuple[type, ...]:
+    """keep-alive 연결이 서버 측에서 끊겼을 때 발생하는 예외들 (새 연결로 1회 재시도)"""
+    http_client = _http()
+    return (http_client.RemoteDisconnected, http_client.CannotSendRequest,
+            http_client.BadStatusLine, ConnectionResetError, BrokenPipeError)
+
+
+class GitHubAPIError(Exception):
+    """GitHub API 요청 실패를 나타냅니다."""
+
+    def __init__(self, message: str, status: Optional[int] = None,
+                 errors: Optional[List[Dict]] = None):
+        super().__init__(message)
+        self.status = status
+        self.errors = errors or []
+
+
+class APIResponse:
+    """HTTP 응답 (상태 코드, 소문자 헤더, 원본 본문)"""
+
+    def __init__(self, status: int, headers: Dict[str, str], body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.attempts = 1
+        self.wait = 0.0  # rate limit 대기 시간 (초)
+
+    def json(self) -> Any:
+        if not self.body:
+            return None
+        return json.loads(self.body.decode('utf-8'))
+
+
+class ConnectionPool:
+    """호스트 하나에 대한 keep-alive 연결 풀입니다."""
+
+    def __init__(self, base_url: str, maxsize: int = 10, timeout: float = 30.0):
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme or 'https'
+        self.host = parts.hostname or ''
+        self.port = parts.port
+        self.timeout = timeout
+        self._idle: 'queue.LifoQueue[http.client.HTTPConnection]' = queue.LifoQueue(maxsize)
+
+    def _new_connection(self) -> 'http.client.HTTPConnection':
+        if self.scheme == 'http':
+            return _http().HTTPConnection(self.host, self.port, timeout=self.timeout)
+        return _http().HTTPSConnection(self.host, self.port, timeout=self.timeout)
+
+    def release(self, conn: 'http.client.HTTPConnection') -> None:
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def send(self, method: str, path: str, body: Optional[bytes],
+             headers: Dict[str, str]) -> APIResponse:
+        """요청을 보내고 응답을 끝까지 읽은 뒤 연결을 풀에 반환합니다.
+
+        풀에서 꺼낸 keep-alive 연결이 서버 측에서 이미 끊겨 있었으면 새 연결로 1회 재시도합니다.
+        요청을 보낸 뒤(응답 대기/읽기 중) 끊긴 경우에는 서버가 처리했을 수 있으므로
+        멱등 메서드(IDEMPOTENT_METHODS)만 재시도합니다. (POST Issue 생성 등의 중복 방지)
+        """
+        try:
+            conn, reused = self._idle.get_nowait(), True
+        except queue.Empty:
+            conn, reused = self._new_connection(), False
+        while True:
+            sent = False
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                sent = True
+                resp = conn.getresponse()
+                data = resp.read()
+            except _stale_connection_errors():
+                conn.close()
+                if not reused or (sent and method not in IDEMPOTENT_METHODS):
+                    raise
+                conn, reused = self._new_connection(), False
+                continue
+            except Exception:
+                conn.close()
+                raise
+            response_headers = {k.lower(): v for k, v in resp.getheaders()}
+            if resp.will_close:
+                conn.close()
+            else:
+                self.release(conn)
+            return APIResponse(resp.status, response_headers, data)
+
+
+class RateLimiter:
+    """GitHub rate limit 헤더를 추적하여 요청 간격을 조절합니다. (스레드 안전)
+
+    - Retry-After 또는 잔여 한도 0 응답을 받으면 모든 스레드가 해당 시점까지 대기
+    - 잔여 한도가 LOW_WATERMARK 미만이면 reset 시각까지 남은 요청을 균등하게 분산
+    """
+
+    LOW_WATERMARK = 100
+    SECONDARY_LIMIT_WAIT = 60.0  # Retry-After가 없는 2차 rate limit 응답의 기본 대기 시간
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        self._next_slot = 0.0
+        self._remaining: Dict[str, int] = {}
+        self._reset_at: Dict[str, float] = {}
+
+    def wait(self, resource: str = 'core') -> None:
+        """다음 요청을 보내도 되는 시점까지 대기합니다."""
+        with self._lock:
+            now = time.time()
+            start = max(now, self._paused_until, self._next_slot)
+            remaining = self._remaining.get(resource)
+            reset_at = self._reset_at.get(resource, 0.0)
+            if remaining is not None and remaining < self.LOW_WATERMARK and reset_at > start:
+                self._next_slot = start + (reset_at - start) / max(remaining, 1)
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def update(self, headers: Dict[str, str]) -> None:
+        """응답 헤더의 잔여 한도와 reset 시각을 기록합니다."""
+        resource = headers.get('x-ratelimit-resource', 'core')
+        try:
+            remaining = int(headers['x-ratelimit-remaining'])
+            reset_at = float(headers['x-ratelimit-reset'])
+        except (KeyError, ValueError):
+            return
+        with self._lock:
+            self._remaining[resource] = remaining
+            self._reset_at[resource] = reset_at
+
+    def backoff(self, response: 'APIResponse', attempt: int) -> Optional[float]:
+        """rate limit 응답이면 대기 시간을 설정하고 반환합니다. 아니면 None."""
+        headers = response.headers
+        if response.status not in (403, 429):
+            return None
+        body = response.body.decode('utf-8', 'ignore').lower()
+        if 'retry-after' in headers:
+            try:
+                wait = float(headers['retry-after'])
+            except ValueError:
+                wait = self.SECONDARY_LIMIT_WAIT
+        elif headers.get('x-ratelimit-remaining') == '0':
+            try:
+                wait = float(headers['x-ratelimit-reset']) - time.time() + 1
+            except (KeyError, ValueError):
+                wait = self.SECONDARY_LIMIT_WAIT
+        elif 'rate limit' in body:
+            wait = self.SECONDARY_LIMIT_WAIT * (2 ** attempt)
+        else:
+            return None
+        self.pause(wait)
+        return max(wait, 0.0)
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.time() + max(seconds, 0.0))
+
+    def remaining(self) -> Dict[str, int]:
+        """리소스별 마지막 잔여 한도 (예: {'core': 4990, 'graphql': 4870})"""
+        with self._lock:
+            return dict(self._remaining)
+
+
+class APIUsage:
+    """track_usage() 구간의 요청 집계 (리소스별 요청 수, 재시도 수, rate limit 대기 시간)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests: Dict[str, int] = {}
+        self.retries = 0
+        self.wait = 0.0
+
+    def record(self, resource: str, attempts: int, waited: float) -> None:
+        with self._lock:
+            self.requests[resource] = self.requests.get(resource, 0) + attempts
+            self.retries += attempts - 1
+            self.wait += waited
+
+
+_usage: 'contextvars.ContextVar[Optional[APIUsage]]' = contextvars.ContextVar('github_api_usage',
+                                                                             default=None)
+
+
+@contextmanager
+def track_usage() -> Iterator[APIUsage]:
+    """구간 안의 요청을 새 APIUsage에 집계합니다. (run_ordered 작업 스레드 포함)"""
+    usage = APIUsage()
+    token = _usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _usage.reset(token)
+
+
+def get_token() -> Optional[str]:
+    """인증 토큰을 가져옵니다. (GITHUB_TOKEN/GH_TOKEN → `gh auth token` 1회)"""
+    for name in ('GITHUB_TOKEN', 'GH_TOKEN'):
+        token = os.environ.get(name)
+        if token:
+            return token.strip()
+    import subprocess
+    try:
+        result = subprocess.run(
+            ['gh', 'auth', 'token'],
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            errors='ignore',
+            check=True
+        )
+        return result.stdout.strip() or None
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+
+
+def _default_graphql_url(api_url: str) -> str:
+    # GitHub Enterprise Server: https://host/api/v3 → https://host/api/graphql
+    if api_url.endswith('/api/v3'):
+        return api_url[:-len('/v3')] + '/graphql'
+    return api_url + '/graphql'
+
+
+class GitHubClient:
+    """REST/GraphQL 요청을 하나의 연결 풀로 처리하는 클라이언트입니다."""
+
+    def __init__(self, api_url: Optional[str] = None, token: Optional[str] = None,
+                 graphql_url: Optional[str] = None, pool_size: int = 10,
+                 timeout: float = 30.0, max_retries: int = 5,
+                 response_cache: Optional[ResponseCache] = None):
+        self.api_url = (api_url or os.environ.get('GITHUB_API_URL') or DEFAULT_API_URL).rstrip('/')
+        self.graphql_url = (graphql_url or os.environ.get('GITHUB_GRAPHQL_URL')
+                            or _default_graphql_url(self.api_url))
+        self._token = token
+        self._token_loaded = token is not None
+        self._base_path = urlsplit(self.api_url).path
+        self._graphql_path = urlsplit(self.graphql_url).path or '/graphql'
+        self.pool = ConnectionPool(self.api_url, maxsize=pool_size, timeout=timeout)
+        self.rate_limiter = RateLimiter()
+        self.max_retries = max_retries
+        self.response_cache = response_cache
+
+    @property
+    def token(self) -> Optional[str]:
+        if not self._token_loaded:
+            self._token = get_token()
+            self._token_loaded = True
+        return self._token
+
+    def _headers(self, has_body: bool) -> Dict[str, str]:
+        headers = {
+            'Accept': 'application/vnd.github+json',
+            'User-Agent': USER_AGENT,
+            'X-GitHub-Api-Version': '2022-11-28',
+        }
+        if self.token:
+            headers['Authorization'] = f'Bearer {self.token}'
+        if has_body:
+            headers['Content-Type'] = 'application/json; charset=utf-8'
+        return headers
+
+    def request(self, method: str, path: str, payload: Any = None,
+                params: Optional[Dict[str, Any]] = None) -> APIResponse:
+        """원본 HTTP 요청을 보냅니다. path는 API 루트 기준 상대 경로입니다."""
+        if path.startswith('/'):
+            full_path = path
+        else:
+            full_path = f"{self._base_path}/{path}"
+        if params:
+            full_path = f"{full_path}?{urlencode(params)}"
+        body = json.dumps(payload).encode('utf-8') if payload is not None else None
+        resource = 'graphql' if full_path == self._graphql_path else 'core'
+        headers = self._headers(body is not None)
+        cache_key = None
+        if method == 'GET' and self.response_cache is not None:
+            cache_key = self.response_cache.key(f"{self.pool.host}:{self.pool.port}{full_path}",
+                                                 self.token)
+            headers.update(self.response_cache.conditional_headers(cache_key))
+        started = time.perf_counter()
+        waited = 0.0
+        for attempt in range(self.max_retries + 1):
+            wait_start = time.perf_counter()
+            self.rate_limiter.wait(resource)
+            waited += time.perf_counter() - wait_start
+            try:
+                response = self.pool.send(method, full_path, body, headers)
+            except (OSError, _http().HTTPException) as e:
+                raise GitHubAPIError(f"{method} {path} 네트워크 오류: {e}") from e
+            self.rate_limiter.update(response.headers)
+            if attempt == self.max_retries:
+                break
+            wait = self.rate_limiter.backoff(response, attempt)
+            if wait is None:
+                break
+            print(f"   ⏳ Rate limit - {wait:.0f}초 후 재시도합니다 ({attempt + 1}/{self.max_retries})")
+        response.attempts = attempt + 1
+        response.wait = waited
+        usage = _usage.get()
+        if usage is not None:
+            usage.record(resource, response.attempts, waited)
+        revalidated = cache_key is not None and response.status == 304
+        if cache_key is not None:
+            response = self._apply_cache(cache_key, response)
+        if resource == 'core' and telemetry.enabled():
+            # GraphQL 호출은 rateLimit.cost와 함께 graphql_partial에서 기록
+            telemetry.record_call(telemetry.operation_name(method, path), method, full_path,
+                                  response.status, time.perf_counter() - started,
+                                  len(body or b''), len(response.body), attempt, waited,
+                                  cached=revalidated)
+        return response
+
+    def _apply_cache(self, cache_key: str, response: APIResponse) -> APIResponse:
+        """304 응답은 캐시된 본문으로 바꾸고, 검증자가 있는 200 응답은 캐시에 저장합니다."""
+        if response.status == 304:
+            entry = self.response_cache.get(cache_key)
+            if entry is not None:
+                self.response_cache.touch(cache_key)
+                return APIResponse(200, dict(entry['headers'], **response.headers),
+                                   entry['body'].encode('utf-8'))
+        elif response.status == 200:
+            self.response_cache.put(cache_key, response.headers, response.body)
+        return response
+
+    def rest(self, method: str, path: str, payload: Any = None,
+             params: Optional[Dict[str, Any]] = None) -> Any:
+        """REST 요청을 보내고 JSON 응답을 반환합니다."""
+        response = self.request(method, path, payload, params)
+        if response.status >= 400:
+            try:
+                message = (response.json() or {}).get('message', '')
+            except (ValueError, AttributeError):
+                message = response.body.decode('utf-8', 'ignore')
+            raise GitHubAPIError(f"{method} {path} 실패 ({response.status}): {message}",
+                                 status=response.status)
+        return response.json()
+
+    def graphql_partial(self, query: str,
+                        variables: Optional[Dict[str, Any]] = None) -> Tuple[Dict, List[Dict]]:
+        """GraphQL 요청을 보내고 (data, errors)를 반환합니다. 부분 실패를 허용합니다."""
+        tracing = telemetry.enabled()
+        payload: Dict[str, Any] = {'query': telemetry.with_rate_limit_cost(query) if tracing
+                                   else query}
+        if variables:
+            payload['variables'] = variables
+        for attempt in range(self.max_retries + 1):
+            started = time.perf_counter()
+            response = self.request('POST', self._graphql_path, payload)
+            if tracing:
+                self._trace_graphql(query, payload, response, time.perf_counter() - started,
+                                    attempt)
+            if response.status >= 400:
+                raise GitHubAPIError(f"GraphQL 요청 실패 ({response.status}): "
+                                     f"{response.body.decode('utf-8', 'ignore')}",
+                                     status=response.status)
+            result = response.json() or {}
+            errors = result.get('errors') or []
+            # GraphQL 1차 한도 초과는 200 응답 + RATE_LIMITED 오류로 전달됨
+            if attempt < self.max_retries and any(e.get('type') == 'RATE_LIMITED' for e in errors):
+                try:
+                    wait = float(response.headers['x-ratelimit-reset']) - time.time() + 1
+                except (KeyError, ValueError):
+                    wait = RateLimiter.SECONDARY_LIMIT_WAIT
+                self.rate_limiter.pause(wait)
+                print(f"   ⏳ GraphQL rate limit - {max(wait, 0):.0f}초 후 재시도합니다")
+                continue
+            break
+        data = result.get('data') or {}
+        if tracing and payload['query'] is not query and isinstance(data, dict):
+            data.pop('rateLimit', None)
+        return data, errors
+
+    def _trace_graphql(self, query: str, payload: Dict, response: APIResponse, latency: float,
+                       attempt: int) -> None:
+        cost = None
+        try:
+            cost = ((((response.json() or {}).get('data') or {}).get('rateLimit') or {})
+                    .get('cost'))
+        except ValueError:
+            pass
+        telemetry.record_call(telemetry.operation_name('POST', self._graphql_path, query), 'POST',
+                              self._graphql_path, response.status, latency,
+                              len(json.dumps(payload)), len(response.body),
+                              attempt + response.attempts - 1, response.wait, cost)
+
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict:
+        """GraphQL 요청을 보내고 data를 반환합니다. errors가 있으면 예외를 발생시킵니다."""
+        data, errors = self.graphql_partial(query, variables)
+        if errors:
+            messages = '; '.join(e.get('message', '') for e in errors)
+            raise GitHubAPIError(f"GraphQL 오류: {messages}", errors=errors)
+        return data
+
+    def close(self) -> None:
+        self.pool.close()
+        if self.response_cache is not None:
+            self.response_cache.save()
+
+
+_client: Optional[GitHubClient] = None
+_client_lock = threading.Lock()
+
+
+def response_cache_from_options() -> Optional[ResponseCache]:
+    """환경 변수/명령줄 옵션에 따라 응답 캐시를 만듭니다. (--no-cache, --http-cache-mb)"""
+    if os.environ.get('GITHUB_HTTP_CACHE') == '0' or has_flag('--no-cache'):
+        return None
+    default_mb = DEFAULT_MAX_BYTES // (1024 * 1024)
+    try:
+        default_mb = int(os.environ.get('GITHUB_HTTP_CACHE_MB', default_mb))
+    except ValueError:
+        pass
+    max_mb = get_int_option('--http-cache-mb', default_mb)
+    if max_mb <= 0:
+        return None
+    return ResponseCache(max_bytes=max_mb * 1024 * 1024)
+
+
+def get_client() -> GitHubClient:
+    """프로세스 전체에서 공유하는 클라이언트를 반환합니다."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                cache = response_cache_from_options()
+                _client = GitHubClient(response_cache=cache)
+                if cache is not None:
+                    atexit.register(cache.save)
+    return _client
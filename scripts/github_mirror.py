@@ -0,0 +1,422 @@
+"""
+GitHub 로컬 미러 모듈
+Issue, 라벨, Project Item(필드 값 포함)을 로컬 SQLite에 보관하여
+"이미 있는지 / Item ID는 무엇인지 / 날짜는 무엇인지"를 네트워크 없이 인덱스로 조회합니다.
+- 파일: 캐시 디렉토리의 `mirror.sqlite3` (WAL 모드, 읽기와 쓰기가 서로 막지 않음)
+- 인덱스: Issue 번호, 제목, 라벨, Node ID, 마커 키, Project Item의 Issue
+- 갱신은 증분: Issue는 GraphQL `filterBy: {since}`, Project Item은 `updated:>=` 필터로 마지막 갱신 이후
+  바뀐 것만 커서 페이지네이션으로 조회 (다음 페이지를 미리 요청하면서 받은 페이지를 기록)
+- 받은 행은 WRITE_CHUNK개씩 따로 커밋하므로, 중간에 실패해도 커밋된 청크까지는 남음
+- 네트워크는 쓰기와 갱신에만 사용 (쓴 결과는 updatedAt이 바뀌므로 다음 증분 갱신에 포함)
+- 삭제/이전된 Issue와 Project에서 제거된 Item은 증분 갱신에 나타나지 않으므로 rebuild로 다시 만듦
+"""
+
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional
+
+from cache_store import get_cache_dir
+from issue_markers import find_marker
+from pagination import DEFAULT_PAGE_SIZE, iter_nodes
+
+if TYPE_CHECKING:
+    import sqlite3
+
+MIRROR_FILE = 'mirror.sqlite3'
+MIRROR_VERSION = 1
+# 한 트랜잭션(커밋)에 모아 쓰는 행 수
+WRITE_CHUNK = 500
+# 본문을 빼고 조회할 때의 Issue 열
+_ISSUE_COLUMNS = ('number', 'node_id', 'title', 'state', 'url', 'task_key', 'updated_at')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    repo TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    node_id TEXT,
+    title TEXT NOT NULL,
+    state TEXT,
+    body TEXT,
+    url TEXT,
+    task_key TEXT,
+    updated_at TEXT,
+    PRIMARY KEY (repo, number)
+);
+CREATE INDEX IF NOT EXISTS issues_title ON issues (repo, title);
+CREATE INDEX IF NOT EXISTS issues_node_id ON issues (node_id);
+CREATE INDEX IF NOT EXISTS issues_task_key ON issues (repo, task_key);
+CREATE TABLE IF NOT EXISTS issue_labels (
+    repo TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    label TEXT NOT NULL,
+    PRIMARY KEY (repo, number, label)
+);
+CREATE INDEX IF NOT EXISTS issue_labels_label ON issue_labels (repo, label, number);
+CREATE TABLE IF NOT EXISTS labels (
+    repo TEXT NOT NULL,
+    key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    node_id TEXT,
+    PRIMARY KEY (repo, key)
+);
+CREATE TABLE IF NOT EXISTS project_items (
+    project_id TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    content_id TEXT,
+    repo TEXT,
+    number INTEGER,
+    updated_at TEXT,
+    PRIMARY KEY (project_id, item_id)
+);
+CREATE INDEX IF NOT EXISTS project_items_issue ON project_items (project_id, repo, number);
+CREATE INDEX IF NOT EXISTS project_items_content ON project_items (content_id);
+CREATE TABLE IF NOT EXISTS item_values (
+    item_id TEXT NOT NULL,
+    field_id TEXT NOT NULL,
+    field_name TEXT,
+    value TEXT,
+    PRIMARY KEY (item_id, field_id)
+);
+CREATE TABLE IF NOT EXISTS sync_marks (
+    scope TEXT PRIMARY KEY,
+    since TEXT
+);
+"""
+
+_TABLES = ('issues', 'issue_labels', 'labels', 'project_items', 'item_values', 'sync_marks')
+
+# 수정 시각 오름차순 커서: 조회 중 수정된 Issue는 뒤로 옮겨질 뿐 다른 Issue를 건너뛰게 하지 않음
+ISSUES_QUERY = """
+query($owner: String!, $name: String!, $first: Int!, $after: String, $since: DateTime) {
+  repository(owner: $owner, name: $name) {
+    issues(first: $first, after: $after, filterBy: {since: $since},
+           orderBy: {field: UPDATED_AT, direction: ASC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        id number title state body url updatedAt
+        labels(first: 100) { nodes { name } }
+      }
+    }
+  }
+}
+"""
+
+PROJECT_ITEMS_QUERY = """
+query($projectId: ID!, $first: Int!, $after: String, $filter: String) {
+  node(id: $projectId) {
+    ... on ProjectV2 {
+      items(first: $first, after: $after, query: $filter) {
+        pageInfo { hasNextPage endCursor }
+        nodes {
+          id
+          updatedAt
+          content {
+            ... on Issue { id number repository { nameWithOwner } }
+          }
+          fieldValues(first: 20) {
+            nodes {
+              ... on ProjectV2ItemFieldDateValue {
+                date
+                field { ... on ProjectV2FieldCommon { id name } }
+              }
+              ... on ProjectV2ItemFieldSingleSelectValue {
+                name
+                field { ... on ProjectV2FieldCommon { id name } }
+              }
+              ... on ProjectV2ItemFieldTextValue {
+                text
+                field { ... on ProjectV2FieldCommon { id name } }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _label_names(labels) -> List[str]:
+    """REST(`[{name}]`), GraphQL(`{nodes: [{name}]}`), 문자열 목록 형태의 라벨을 이름 목록으로"""
+    if isinstance(labels, dict):
+        labels = labels.get('nodes') or []
+    return [l['name'] if isinstance(l, dict) else str(l) for l in labels or [] if l]
+
+
+def _chunks(items: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    chunk: List[Dict] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _field_value(value: Dict) -> Optional[str]:
+    for key in ('date', 'name', 'text'):
+        if value.get(key) is not None:
+            return str(value[key])
+    return None
+
+
+class GitHubMirror:
+    """리포지토리 하나의 로컬 미러 (여러 리포지토리가 같은 DB 파일을 공유)"""
+
+    def __init__(self, owner: str, repo: str, path: Optional[str] = None):
+        self.owner = owner
+        self.repo = repo
+        self.repo_key = f"{owner}/{repo}".lower()
+        import sqlite3
+        self._db = sqlite3.connect(path or str(get_cache_dir() / MIRROR_FILE), timeout=30)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        if self._db.execute('PRAGMA user_version').fetchone()[0] != MIRROR_VERSION:
+            self._reset()
+
+    def _reset(self) -> None:
+        with self._db:
+            for table in _TABLES:
+                self._db.execute(f'DROP TABLE IF EXISTS {table}')
+            self._db.executescript(_SCHEMA)
+            self._db.execute(f'PRAGMA user_version={MIRROR_VERSION}')
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> 'GitHubMirror':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ---- 갱신 기록 ----
+
+    def _mark(self, scope: str) -> Optional[str]:
+        row = self._db.execute('SELECT since FROM sync_marks WHERE scope = ?', (scope,)).fetchone()
+        return row['since'] if row else None
+
+    def _set_mark(self, scope: str, since: Optional[str]) -> None:
+        if since:
+            self._db.execute('INSERT OR REPLACE INTO sync_marks (scope, since) VALUES (?, ?)',
+                             (scope, since))
+
+    def populated(self) -> bool:
+        """Issue를 한 번이라도 전체 갱신했는지 (미러만으로 "없음"을 판단할 수 있는지)"""
+        return self._mark(f"issues:{self.repo_key}") is not None
+
+    def rebuild(self) -> None:
+        """이 리포지토리의 Issue/라벨과 갱신 기록을 지워 다음 refresh에서 전체를 다시 받습니다."""
+        with self._db:
+            for table in ('issues', 'issue_labels', 'labels'):
+                self._db.execute(f'DELETE FROM {table} WHERE repo = ?', (self.repo_key,))
+            self._db.execute('DELETE FROM sync_marks WHERE scope = ?', (f"issues:{self.repo_key}",))
+
+    # ---- Issue ----
+
+    def _write_issues(self, issues: List[Dict]) -> None:
+        rows = []
+        for issue in issues:
+            node_id = issue.get('node_id') or issue.get('id')
+            rows.append((self.repo_key, int(issue['number']),
+                         node_id if isinstance(node_id, str) else None,
+                         (issue.get('title') or '').strip(), (issue.get('state') or '').lower(),
+                         issue.get('body'), issue.get('html_url') or issue.get('url'),
+                         find_marker(issue.get('body')),
+                         issue.get('updated_at') or issue.get('updatedAt')))
+        self._db.executemany(
+            'INSERT OR REPLACE INTO issues (repo, number, node_id, title, state, body, url, '
+            'task_key, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+        labeled = [issue for issue in issues if 'labels' in issue]
+        self._db.executemany('DELETE FROM issue_labels WHERE repo = ? AND number = ?',
+                             [(self.repo_key, int(i['number'])) for i in labeled])
+        self._db.executemany(
+            'INSERT OR IGNORE INTO issue_labels (repo, number, label) VALUES (?, ?, ?)',
+            [(self.repo_key, int(i['number']), name.lower())
+             for i in labeled for name in _label_names(i['labels'])])
+
+    def refresh_issues(self, page_size: int = DEFAULT_PAGE_SIZE) -> int:
+        """마지막 갱신 이후 바뀐 Issue(열림/닫힘 모두)만 받아 반영합니다. 받은 개수를 반환합니다.
+
+        수정 시각 오름차순이므로 청크를 커밋할 때마다 갱신 기록을 그 청크의 마지막 시각으로 올립니다.
+        """
+        scope = f"issues:{self.repo_key}"
+        since = self._mark(scope)
+        variables = {'owner': self.owner, 'name': self.repo, 'since': since}
+        issues = iter_nodes(ISSUES_QUERY, variables, ('repository', 'issues'), page_size,
+                            prefetch=True)
+        count = 0
+        for chunk in _chunks(issues, WRITE_CHUNK):
+            with self._db:
+                self._write_issues(chunk)
+                self._set_mark(scope, max(i.get('updatedAt') or '' for i in chunk))
+            count += len(chunk)
+        if since is None and count == 0:
+            # 처음 갱신에서 Issue가 하나도 없어도 "전체 갱신됨"으로 기록
+            with self._db:
+                self._set_mark(scope, '1970-01-01T00:00:00Z')
+        return count
+
+    def _issue(self, row: Optional['sqlite3.Row']) -> Optional[Dict]:
+        if row is None:
+            return None
+        issue = dict(row)
+        issue.pop('repo', None)
+        issue['id'] = issue['node_id']
+        return issue
+
+    def issue(self, number: int) -> Optional[Dict]:
+        return self._issue(self._db.execute(
+            'SELECT * FROM issues WHERE repo = ? AND number = ?',
+            (self.repo_key, number)).fetchone())
+
+    def issue_by_title(self, title: str) -> Optional[Dict]:
+        """제목이 같은 Issue 중 가장 먼저 만들어진 것"""
+        return self._issue(self._db.execute(
+            'SELECT * FROM issues WHERE repo = ? AND title = ? ORDER BY number LIMIT 1',
+            (self.repo_key, title.strip())).fetchone())
+
+    def issue_by_node_id(self, node_id: str) -> Optional[Dict]:
+        return self._issue(self._db.execute(
+            'SELECT * FROM issues WHERE node_id = ? AND repo = ?',
+            (node_id, self.repo_key)).fetchone())
+
+    def issue_by_key(self, key: str) -> Optional[Dict]:
+        """본문 마커 키가 key인 Issue"""
+        return self._issue(self._db.execute(
+            'SELECT * FROM issues WHERE repo = ? AND task_key = ? ORDER BY number LIMIT 1',
+            (self.repo_key, key)).fetchone())
+
+    def issues_with_label(self, label: str, since: Optional[str] = None,
+                          body: bool = True) -> Iterator[Dict]:
+        """라벨이 있는 Issue를 최근 생성 순으로 하나씩 yield합니다.
+
+        since를 주면 그 시각 이후(초과)에 바뀐 Issue만, body=False이면 본문 없이 조회합니다.
+        """
+        columns = 'issues.*' if body else ', '.join(f'issues.{c}' for c in _ISSUE_COLUMNS)
+        sql = (f'SELECT {columns} FROM issue_labels JOIN issues USING (repo, number) '
+               'WHERE issue_labels.repo = ? AND issue_labels.label = ?')
+        params = [self.repo_key, label.lower()]
+        if since:
+            sql += ' AND issues.updated_at > ?'
+            params.append(since)
+        for row in self._db.execute(sql + ' ORDER BY number DESC', params):
+            yield self._issue(row)
+
+    def title_numbers(self) -> Dict[str, int]:
+        """제목 → Issue 번호 (같은 제목이면 먼저 만들어진 Issue)"""
+        rows = self._db.execute('SELECT title, MIN(number) AS number FROM issues '
+                                'WHERE repo = ? GROUP BY title', (self.repo_key,))
+        return {row['title']: row['number'] for row in rows}
+
+    # ---- 라벨 ----
+
+    def replace_labels(self, labels: Iterable[Dict]) -> None:
+        """리포지토리 라벨 목록({name, id})을 통째로 바꿉니다."""
+        with self._db:
+            self._db.execute('DELETE FROM labels WHERE repo = ?', (self.repo_key,))
+            self._db.executemany(
+                'INSERT OR REPLACE INTO labels (repo, key, name, node_id) VALUES (?, ?, ?, ?)',
+                [(self.repo_key, l['name'].lower(), l['name'], l.get('id')) for l in labels])
+            self._set_mark(f"labels:{self.repo_key}", 'loaded')
+
+    def label_names(self) -> Optional[List[str]]:
+        """마지막으로 기록한 라벨 이름(소문자) 목록. 기록한 적이 없으면 None"""
+        if self._mark(f"labels:{self.repo_key}") is None:
+            return None
+        return [row['key'] for row in self._db.execute(
+            'SELECT key FROM labels WHERE repo = ?', (self.repo_key,))]
+
+    # ---- Project Item ----
+
+    def _write_items(self, project_id: str, items: List[Dict]) -> None:
+        rows, values = [], []
+        for item in items:
+            content = item.get('content') or {}
+            name = ((content.get('repository') or {}).get('nameWithOwner') or '').lower()
+            rows.append((project_id, item['id'], content.get('id'), name or None,
+                         content.get('number'), item.get('updatedAt')))
+            for value in ((item.get('fieldValues') or {}).get('nodes') or []):
+                field = (value or {}).get('field') or {}
+                if field.get('id') and _field_value(value) is not None:
+                    values.append((item['id'], field['id'], field.get('name'), _field_value(value)))
+        self._db.executemany(
+            'INSERT OR REPLACE INTO project_items (project_id, item_id, content_id, repo, number, '
+            'updated_at) VALUES (?, ?, ?, ?, ?, ?)', rows)
+        # 비워진 필드도 반영되도록 Item의 값을 통째로 바꿈
+        self._db.executemany('DELETE FROM item_values WHERE item_id = ?', [(r[1],) for r in rows])
+        self._db.executemany(
+            'INSERT OR REPLACE INTO item_values (item_id, field_id, field_name, value) '
+            'VALUES (?, ?, ?, ?)', values)
+
+    def refresh_project(self, project_id: str, page_size: int = DEFAULT_PAGE_SIZE) -> int:
+        """마지막 갱신 이후 바뀐 Project Item만 받아 반영합니다. 받은 개수를 반환합니다.
+
+        서버 필터(`updated:>=날짜`)는 날짜 단위이므로 같은 날 바뀐 Item은 다시 받을 수 있습니다.
+        """
+        scope = f"project:{project_id}"
+        since = self._mark(scope)
+        variables = {'projectId': project_id, 'filter': f"updated:>={since[:10]}" if since else None}
+        items = (item for item in iter_nodes(PROJECT_ITEMS_QUERY, variables, ('node', 'items'),
+                                             page_size, prefetch=True)
+                 if item.get('id') and not (since and (item.get('updatedAt') or '') < since))
+        latest = since
+        count = 0
+        for chunk in _chunks(items, WRITE_CHUNK):
+            with self._db:
+                self._write_items(project_id, chunk)
+            latest = max([latest or ''] + [i.get('updatedAt') or '' for i in chunk])
+            count += len(chunk)
+        # Item은 Project 안의 위치 순서로 오므로 갱신 기록은 끝까지 받은 뒤에만 올림
+        with self._db:
+            self._set_mark(scope, latest or '1970-01-01T00:00:00Z')
+        return count
+
+    def project_item(self, project_id: str, number: int) -> Optional[Dict]:
+        """Issue의 Project Item ID와 필드 값 {item_id, values: {필드 ID: 값}}. 없으면 None"""
+        row = self._db.execute(
+            'SELECT item_id FROM project_items WHERE project_id = ? AND repo = ? AND number = ?',
+            (project_id, self.repo_key, number)).fetchone()
+        if row is None:
+            return None
+        values = {r['field_id']: r['value'] for r in self._db.execute(
+            'SELECT field_id, value FROM item_values WHERE item_id = ?', (row['item_id'],))}
+        return {'item_id': row['item_id'], 'values': values}
+
+    def project_items(self, project_id: str, since: Optional[str] = None) -> Iterator[Dict]:
+        """이 리포지토리 Issue의 Project Item을 바뀐 순서로 하나씩 yield합니다.
+
+        {item_id, number, updated_at, values: {필드 ID: 값}, names: {필드 ID: 필드 이름}}
+        since를 주면 그 시각 이후(초과)에 바뀐 Item만 조회합니다.
+        """
+        sql = ('SELECT item_id, number, updated_at, field_id, field_name, value '
+               'FROM project_items LEFT JOIN item_values USING (item_id) '
+               'WHERE project_id = ? AND repo = ?')
+        params = [project_id, self.repo_key]
+        if since:
+            sql += ' AND updated_at > ?'
+            params.append(since)
+        item: Optional[Dict] = None
+        for row in self._db.execute(sql + ' ORDER BY updated_at, item_id', params):
+            if item is None or item['item_id'] != row['item_id']:
+                if item is not None:
+                    yield item
+                item = {'item_id': row['item_id'], 'number': row['number'],
+                        'updated_at': row['updated_at'], 'values': {}, 'names': {}}
+            if row['field_id']:
+                item['values'][row['field_id']] = row['value']
+                item['names'][row['field_id']] = row['field_name']
+        if item is not None:
+            yield item
+
+    def stats(self) -> Dict[str, int]:
+        """이 리포지토리의 미러 행 수 (출력용)"""
+        counts = {}
+        for table in ('issues', 'labels'):
+            counts[table] = self._db.execute(f'SELECT COUNT(*) FROM {table} WHERE repo = ?',
+                                             (self.repo_key,)).fetchone()[0]
+        counts['project_items'] = self._db.execute(
+            'SELECT COUNT(*) FROM project_items WHERE repo = ?', (self.repo_key,)).fetchone()[0]
+        return counts
+
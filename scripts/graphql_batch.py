@@ -0,0 +1,87 @@
+"""
+GraphQL 배치 실행 모듈
+여러 mutation/query 필드를 별칭(alias)으로 묶어 하나의 GraphQL 문서로 보냅니다.
+- API 제한을 넘지 않도록 chunk 단위로 분할
+- 부분 실패는 항목(key)별로 보고
+"""
+
+import json
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from github_client import GitHubAPIError, GitHubClient, get_client
+
+# 한 문서에 담을 기본 연산 수 (GitHub 2차 rate limit 및 timeout을 고려한 보수적인 값)
+DEFAULT_BATCH_SIZE = 50
+
+
+class BatchResult:
+    """배치 내 단일 연산의 결과입니다."""
+
+    def __init__(self, data: Any = None, error: Optional[str] = None):
+        self.data = data
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def gql_value(value: Any) -> str:
+    """Python 값을 GraphQL 리터럴로 변환합니다. (문자열은 JSON 이스케이프)"""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return str(value)
+    if value is None:
+        return 'null'
+    if isinstance(value, dict):
+        return '{' + ', '.join(f'{k}: {gql_value(v)}' for k, v in value.items()) + '}'
+    if isinstance(value, (list, tuple)):
+        return '[' + ', '.join(gql_value(v) for v in value) + ']'
+    return json.dumps(str(value), ensure_ascii=False)
+
+
+def chunked(items: List[Any], size: int) -> Iterable[List[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def execute_aliased(operations: List[Tuple[Hashable, str]], operation_type: str = 'mutation',
+                    batch_size: int = DEFAULT_BATCH_SIZE,
+                    client: Optional[GitHubClient] = None) -> Dict[Hashable, BatchResult]:
+    """(key, 필드 문자열) 목록을 별칭 문서로 묶어 실행하고 key별 결과를 반환합니다."""
+    client = client or get_client()
+    results: Dict[Hashable, BatchResult] = {}
+    for chunk in chunked(operations, max(1, batch_size)):
+        aliases = {f'op{i}': key for i, (key, _) in enumerate(chunk)}
+        document = operation_type + ' {\n' + '\n'.join(
+            f'  op{i}: {field}' for i, (_, field) in enumerate(chunk)
+        ) + '\n}'
+        try:
+            data, errors = client.graphql_partial(document)
+        except GitHubAPIError as e:
+            for key in aliases.values():
+                results[key] = BatchResult(error=str(e))
+            continue
+
+        error_by_alias: Dict[str, str] = {}
+        for error in errors:
+            path = error.get('path') or []
+            alias = path[0] if path else None
+            message = error.get('message', 'unknown error')
+            if alias in aliases:
+                error_by_alias[alias] = message
+            else:
+                # 문서 전체 오류 (예: 구문 오류) - 해당 chunk 전체 실패로 처리
+                for other in aliases:
+                    error_by_alias.setdefault(other, message)
+
+        for alias, key in aliases.items():
+            value = (data or {}).get(alias)
+            if alias in error_by_alias:
+                results[key] = BatchResult(error=error_by_alias[alias])
+            elif value is None:
+                results[key] = BatchResult(error='응답에 결과가 없습니다')
+            else:
+                results[key] = BatchResult(data=value)
+    return results
@@ -0,0 +1,109 @@
+"""
+HTTP 응답 캐시 모듈
+REST GET 응답을 ETag / Last-Modified와 함께 디스크에 저장하고 다음 요청에서 조건부 요청으로 재검증합니다.
+- 304 Not Modified 응답은 GitHub rate limit을 소모하지 않으므로 변경 없는 리포지토리에서는 한도를 거의 쓰지 않음
+- 토큰별로 캐시 키를 분리 (다른 사용자의 응답을 재사용하지 않음)
+- 전체 본문 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+- GITHUB_HTTP_CACHE=0 또는 --no-cache로 비활성화, --http-cache-mb로 최대 크기 지정
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+from cache_store import load_json, save_json
+
+HTTP_CACHE_VERSION = 1
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+# 캐시된 응답을 돌려줄 때 함께 보관하는 헤더
+_KEPT_HEADERS = ('content-type', 'link', 'etag', 'last-modified')
+
+
+class ResponseCache:
+    """ETag/Last-Modified 기반 REST 응답 캐시"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, name: str = 'http/responses.json'):
+        self.max_bytes = max_bytes
+        self._name = name
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict]] = None
+        self._dirty = False
+        self.hits = 0  # 304로 재검증된 횟수
+
+    @staticmethod
+    def key(url: str, token: Optional[str]) -> str:
+        import hashlib
+        token_hash = hashlib.sha256((token or '').encode('utf-8')).hexdigest()[:12]
+        return hashlib.sha256(f"{token_hash} GET {url}".encode('utf-8')).hexdigest()
+
+    def _load(self) -> Dict[str, Dict]:
+        if self._entries is None:
+            data = load_json(self._name, {}) or {}
+            if data.get('version') != HTTP_CACHE_VERSION:
+                data = {}
+            self._entries = data.get('entries', {})
+        return self._entries
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            return self._load().get(key)
+
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        """저장된 응답이 있으면 If-None-Match / If-Modified-Since 헤더를 반환합니다."""
+        entry = self.get(key)
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def touch(self, key: str) -> None:
+        """304로 재검증된 항목의 사용 시각을 갱신합니다."""
+        with self._lock:
+            entry = self._load().get(key)
+            if entry:
+                entry['used_at'] = time.time()
+                self.hits += 1
+                self._dirty = True
+
+    def put(self, key: str, headers: Dict[str, str], body: bytes) -> None:
+        """검증자(ETag/Last-Modified)가 있는 200 응답을 저장합니다."""
+        etag = headers.get('etag')
+        last_modified = headers.get('last-modified')
+        if not etag and not last_modified:
+            return
+        try:
+            text = body.decode('utf-8')
+        except UnicodeDecodeError:
+            return
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            entries = self._load()
+            entries[key] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'headers': {h: headers[h] for h in _KEPT_HEADERS if h in headers},
+                'body': text,
+                'size': len(body),
+                'used_at': time.time(),
+            }
+            self._dirty = True
+            self._evict(entries)
+
+    def _evict(self, entries: Dict[str, Dict]) -> None:
+        total = sum(e.get('size', 0) for e in entries.values())
+        if total <= self.max_bytes:
+            return
+        for key in sorted(entries, key=lambda k: entries[k].get('used_at', 0)):
+            total -= entries.pop(key).get('size', 0)
+            if total <= self.max_bytes:
+                break
+
+    def save(self) -> None:
+        with self._lock:
+            if self._dirty and self._entries is not None:
+                save_json(self._name, {'version': HTTP_CACHE_VERSION, 'entries': self._entries})
+                self._dirty = False
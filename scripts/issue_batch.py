@@ -0,0 +1,95 @@
+"""
+Issue 일괄 생성 모듈
+여러 Issue를 별칭(alias) `createIssue` mutation으로 묶어 GraphQL 문서 하나로 생성합니다.
+- 라벨 이름은 실행 단위로 한 번 labelIds(Node ID)로 변환 (Issue마다 서버에서 이름을 풀지 않음)
+- 리포지토리 Node ID는 디스크에 저장하여 다음 실행에서는 조회 생략
+- 별칭마다 number, URL, Node ID를 돌려받아 Project 추가 단계에 그대로 전달
+- 문서 하나에 ISSUE_CREATE_BATCH_SIZE개 (Issue N개 생성에 약 N/25번 요청)
+"""
+
+from typing import Dict, List, Optional
+
+from cache_store import cache_key, load_json, save_json
+from concurrency import run_ordered
+from github_client import GitHubAPIError, get_client
+from graphql_batch import chunked, execute_aliased, gql_value
+from labels import LabelRegistry
+
+# 문서 하나에 담을 createIssue 수 (본문이 큰 Issue도 요청 크기/timeout 안에 들도록 보수적으로)
+ISSUE_CREATE_BATCH_SIZE = 25
+
+REPOSITORY_ID_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) { id }
+}
+"""
+
+
+def _repository_id_cache(owner: str, repo: str) -> str:
+    return f"repo_ids/{cache_key(owner, repo)}.json"
+
+
+def cached_repository_id(owner: str, repo: str) -> Optional[str]:
+    """디스크에 저장된 리포지토리 Node ID (없으면 None, 조회하지 않음)"""
+    return (load_json(_repository_id_cache(owner, repo), {}) or {}).get('id')
+
+
+def repository_id(owner: str, repo: str) -> str:
+    """리포지토리 Node ID를 반환합니다. (한 번 조회한 값은 디스크에 저장)"""
+    cached = cached_repository_id(owner, repo)
+    if cached:
+        return cached
+    data = get_client().graphql(REPOSITORY_ID_QUERY, {'owner': owner, 'name': repo})
+    node_id = data['repository']['id']
+    save_json(_repository_id_cache(owner, repo), {'id': node_id})
+    return node_id
+
+
+def create_issue_field(repo_id: str, title: str, body: str, label_ids: List[str]) -> str:
+    """createIssue mutation 필드 문자열 (결과: number, url, id)"""
+    fields = {'repositoryId': repo_id, 'title': title, 'body': body}
+    if label_ids:
+        fields['labelIds'] = label_ids
+    return f"createIssue(input: {gql_value(fields)}) {{ issue {{ id number url }} }}"
+
+
+def create_issues_batch(owner: str, repo: str, issues: List[Dict], registry: LabelRegistry,
+                        batch_size: int = ISSUE_CREATE_BATCH_SIZE,
+                        concurrency: int = 1) -> List[Optional[Dict]]:
+    """issues({'title', 'body', 'labels'})를 일괄 생성하고 입력 순서대로 결과를 반환합니다.
+
+    결과는 REST 응답과 같은 키(number, html_url, node_id)의 dict이며, 실패한 Issue는 None입니다.
+    registry의 라벨은 미리 준비(ensure)되어 있어야 하며, 없는 라벨은 건너뜁니다.
+    """
+    if not issues:
+        return []
+    try:
+        repo_id = repository_id(owner, repo)
+    except (GitHubAPIError, KeyError, TypeError) as e:
+        print(f"❌ 리포지토리 ID 조회 실패 (Issue {len(issues)}개 생성 불가): {e}")
+        return [None] * len(issues)
+    label_ids = registry.node_ids({l for issue in issues for l in issue.get('labels') or []})
+    operations = []
+    for index, issue in enumerate(issues):
+        ids = [label_ids[l.lower()] for l in issue.get('labels') or [] if l.lower() in label_ids]
+        operations.append((index, create_issue_field(repo_id, issue['title'], issue['body'],
+                                                     list(dict.fromkeys(ids)))))
+
+    def run(chunk):
+        return execute_aliased(chunk, batch_size=len(chunk))
+
+    results: List[Optional[Dict]] = [None] * len(issues)
+    for _, batch in run_ordered(run, list(chunked(operations, max(1, batch_size))), concurrency):
+        for index, result in batch.items():
+            issue = issues[index]
+            created = ((result.data or {}).get('issue') or {}) if result.ok else {}
+            print(f"\n📝 Issue: {issue['title']}")
+            if created.get('number'):
+                results[index] = {'number': created['number'], 'html_url': created.get('url'),
+                                  'node_id': created.get('id')}
+                valid = registry.valid(issue.get('labels') or [])
+                label_info = f" (라벨: {', '.join(valid)})" if valid else ""
+                print(f"✅ Issue #{created['number']} 생성 완료: {created.get('url')}{label_info}")
+            else:
+                print(f"❌ Issue 생성 실패: {result.error or '응답에 Issue가 없습니다'}")
+    return results
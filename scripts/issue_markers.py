@@ -0,0 +1,211 @@
+"""
+Issue 식별 마커 모듈
+Task 파일의 안정적인 식별자(Task ID 또는 경로)로 만든 키를 Issue 본문에 숨은 주석으로 넣고,
+중복 확인 시 전체 Issue 제목 목록 대신 키로 Issue를 찾습니다.
+- 마커: `<!-- task-sync-id: <키> -->` (렌더링된 Issue에는 보이지 않음)
+- 로컬 인덱스(키 → Issue 번호/제목)를 먼저 확인하고, 없는 키는 로컬 미러(github_mirror.py)에서 찾음
+- 미러를 아직 만들지 않았으면 없는 키만 GitHub 검색으로 조회
+- 검색은 별칭 query로 묶어 Task 수에 비례하는 요청만 보냄 (리포지토리 Issue 수와 무관)
+- 마커가 없는 예전 Issue는 정확한 제목 검색으로 찾음
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from cache_store import cache_key, load_json, save_json
+from github_client import GitHubAPIError
+from graphql_batch import execute_aliased, gql_value
+
+MARKER_NAME = 'task-sync-id'
+MARKER_RE = re.compile(r'<!--\s*' + MARKER_NAME + r':\s*([0-9a-f]{16,64})\s*-->')
+# 별칭 search query 한 번에 보낼 검색 수 (검색은 비용이 커서 작게 유지)
+SEARCH_BATCH_SIZE = 20
+
+_TASK_NUMBER_RE = re.compile(r'^\s*Task\s+(\d+)\b', re.IGNORECASE)
+_FILE_NUMBER_RE = re.compile(r'^(\d+)[_\-. ]')
+
+
+class DuplicateTaskKeyError(ValueError):
+    """서로 다른 Task 파일이 같은 식별자를 가질 때 발생합니다. paths는 겹치는 파일 경로 목록입니다."""
+
+    def __init__(self, key: str, paths: List[str]):
+        super().__init__(f"{key}: {', '.join(paths)}")
+        self.key = key
+        self.paths = paths
+
+
+def task_numbers(frontmatter: Dict, file_path: Path) -> List[int]:
+    """제목의 `Task NNN`과 파일 이름의 숫자 접두사에서 찾은 Task 번호 (우선순위 순서)"""
+    numbers = []
+    for match in (_TASK_NUMBER_RE.match(str(frontmatter.get('title') or '')),
+                  _FILE_NUMBER_RE.match(file_path.name)):
+        if match:
+            numbers.append(int(match.group(1)))
+    return numbers
+
+
+def task_identity(frontmatter: Dict, file_path: Path) -> str:
+    """Task의 안정적인 식별자를 반환합니다.
+
+    우선순위: frontmatter `id` → 제목의 `Task NNN` → 파일 이름의 숫자 접두사 → 파일 경로
+    (제목이나 파일 이름이 바뀌어도 Task 번호가 같으면 같은 식별자)
+    Task 번호는 디렉토리와 무관하므로 여러 디렉토리에서 번호가 겹치면 check_unique_keys로 거부합니다.
+    """
+    explicit = frontmatter.get('id') or frontmatter.get('task-id')
+    if explicit:
+        return f"id:{explicit}"
+    numbers = task_numbers(frontmatter, file_path)
+    if numbers:
+        return f"task:{numbers[0]}"
+    try:
+        path = file_path.resolve().relative_to(Path.cwd().resolve())
+    except ValueError:
+        path = file_path
+    return f"path:{path.as_posix()}"
+
+
+def task_key(identity: str) -> str:
+    """식별자로부터 마커 키(sha256 앞 16자리)를 만듭니다."""
+    import hashlib
+    return hashlib.sha256(identity.encode('utf-8')).hexdigest()[:16]
+
+
+def check_unique_keys(tasks: Iterable[Tuple[str, str]]) -> None:
+    """(파일 경로, 마커 키) 목록에서 키가 겹치면 DuplicateTaskKeyError를 발생시킵니다.
+
+    겹치는 키로 동기화하면 한 Task의 변경이 다른 Task의 Issue를 덮어쓰므로 실행 전에 확인합니다.
+    """
+    paths_by_key: Dict[str, List[str]] = {}
+    for path, key in tasks:
+        if key:
+            paths_by_key.setdefault(key, []).append(path)
+    for key, paths in paths_by_key.items():
+        if len(paths) > 1:
+            raise DuplicateTaskKeyError(key, sorted(paths))
+
+
+def marker(key: str) -> str:
+    return f"<!-- {MARKER_NAME}: {key} -->"
+
+
+def find_marker(body: Optional[str]) -> Optional[str]:
+    """Issue 본문에서 마커 키를 찾습니다."""
+    match = MARKER_RE.search(body or '')
+    return match.group(1) if match else None
+
+
+def _search_field(query: str) -> str:
+    return (f"search(query: {gql_value(query)}, type: ISSUE, first: 5) "
+            "{ nodes { ... on Issue { number title body } } }")
+
+
+class IssueKeyIndex:
+    """리포지토리 하나의 마커 키 → Issue (번호, 제목) 인덱스"""
+
+    def __init__(self, owner: str, repo: str, batch_size: int = SEARCH_BATCH_SIZE):
+        self.owner = owner
+        self.repo = repo
+        self.batch_size = batch_size
+        self._name = f"issue_keys/{cache_key(owner, repo)}.json"
+        self._entries: Dict[str, Dict] = load_json(self._name, {}) or {}
+        self._dirty = False
+
+    def get(self, key: str) -> Optional[Dict]:
+        return self._entries.get(key)
+
+    def add(self, key: str, number: int, title: str) -> None:
+        entry = {'number': number, 'title': title}
+        if key and self._entries.get(key) != entry:
+            self._entries[key] = entry
+            self._dirty = True
+
+    def forget(self, key: str) -> None:
+        if self._entries.pop(key, None) is not None:
+            self._dirty = True
+
+    def lookup(self, tasks: Iterable[Tuple[str, str]],
+               offline: bool = False) -> Dict[str, Tuple[Dict, bool]]:
+        """(키, 제목) 목록에 해당하는 기존 Issue를 찾습니다.
+
+        offline=True이면 로컬 인덱스만 확인하고 GitHub 검색은 하지 않습니다.
+
+        Returns:
+            키 → ({number, title}, 마커로 찾았는지 여부). 찾지 못한 키는 포함되지 않음
+        """
+        found: Dict[str, Tuple[Dict, bool]] = {}
+        missing: List[Tuple[str, str]] = []
+        for key, title in tasks:
+            entry = self._entries.get(key)
+            if entry:
+                found[key] = (entry, True)
+            else:
+                missing.append((key, title))
+        if not missing:
+            return found
+        missing = self._lookup_mirror(missing, found, refresh=not offline)
+        if not missing or offline:
+            return found
+
+        repo_filter = f"repo:{self.owner}/{self.repo} is:issue"
+        operations = []
+        for key, title in missing:
+            operations.append(((key, 'marker'), _search_field(f'{repo_filter} in:body {key}')))
+            operations.append(((key, 'title'), _search_field(
+                f'{repo_filter} in:title "{title.replace(chr(34), " ")}"')))
+        results = execute_aliased(operations, operation_type='query', batch_size=self.batch_size)
+
+        for key, title in missing:
+            by_marker = results.get((key, 'marker'))
+            by_title = results.get((key, 'title'))
+            match = None
+            for node in (by_marker.data or {}).get('nodes', []) if by_marker and by_marker.ok else []:
+                if node and find_marker(node.get('body')) == key:
+                    match = (node, True)
+                    break
+            if match is None and by_title and by_title.ok:
+                for node in (by_title.data or {}).get('nodes', []):
+                    # 마커가 없는 예전 Issue만 제목으로 연결 (다른 Task의 마커가 있으면 제외)
+                    if node and node.get('title', '').strip() == title.strip() \
+                            and not find_marker(node.get('body')):
+                        match = (node, False)
+                        break
+            if match:
+                node, by_key = match
+                self.add(key, node['number'], node['title'])
+                found[key] = (self._entries[key], by_key)
+        return found
+
+    def _lookup_mirror(self, missing: List[Tuple[str, str]], found: Dict[str, Tuple[Dict, bool]],
+                       refresh: bool) -> List[Tuple[str, str]]:
+        """로컬 미러에서 키(없으면 마커 없는 같은 제목 Issue)를 찾고, 검색이 필요한 키만 반환합니다.
+
+        미러가 전체 Issue를 갖고 있으면(populated) 미러에 없는 키는 없는 것으로 보고 검색하지 않습니다.
+        """
+        from github_mirror import GitHubMirror  # github_mirror가 이 모듈을 import하므로 지연 import
+
+        with GitHubMirror(self.owner, self.repo) as mirror:
+            if not mirror.populated():
+                return missing
+            if refresh:
+                try:
+                    mirror.refresh_issues()
+                except GitHubAPIError as e:
+                    print(f"   ⚠️  미러 갱신 실패 (검색으로 확인): {e}")
+                    return missing
+            for key, title in missing:
+                issue = mirror.issue_by_key(key)
+                by_key = issue is not None
+                if issue is None:
+                    issue = mirror.issue_by_title(title)
+                    if issue is not None and issue.get('task_key'):
+                        issue = None  # 다른 Task의 마커가 있는 Issue
+                if issue is not None:
+                    self.add(key, issue['number'], issue['title'])
+                    found[key] = (self._entries[key], by_key)
+        return []
+
+    def save(self) -> None:
+        if self._dirty:
+            save_json(self._name, self._entries)
+            self._dirty = False
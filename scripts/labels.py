@@ -0,0 +1,126 @@
+"""
+라벨 레지스트리 모듈
+실행 단위로 리포지토리 라벨 목록을 한 번만 조회하고, 필요한 라벨을 미리 생성합니다.
+- 라벨 목록은 페이지네이션으로 1회 조회 (Issue마다 재조회하지 않음, ETag 캐시로 재검증)
+- 누락된 라벨만 동시에 생성한 뒤에는 메모리 조회만 수행
+- GitHub 라벨은 대소문자를 구분하지 않으므로 소문자 키로 관리
+- 일괄 생성(issue_batch.py)에는 이름 대신 라벨 Node ID를 전달
+- 조회/생성 후 라벨 목록을 로컬 미러(github_mirror.py)에 기록하여 오프라인 plan에서 누락 라벨을 계산
+"""
+
+from typing import Dict, Iterable, List, Optional, Set
+from urllib.parse import quote
+
+from concurrency import run_ordered
+from github_client import GitHubAPIError, get_client
+from github_mirror import GitHubMirror
+from pagination import iter_rest_items
+
+AUTOMATION_LABEL = 'Issue Automation'
+LABEL_CREATE_WORKERS = 4
+
+def label_style(label: str) -> tuple[str, str]:
+    """라벨 생성 시 사용할 (색상, 설명)을 반환합니다."""
+    if label == AUTOMATION_LABEL:
+        return "0E8A16", 'Automatically created issues'
+    return "0052CC", 'Auto-created label'
+
+
+class LabelRegistry:
+    """리포지토리 하나의 라벨 목록 (이름 → node ID)"""
+
+    def __init__(self, owner: str, repo: str):
+        self.owner = owner
+        self.repo = repo
+        self._labels: Dict[str, Dict[str, Optional[str]]] = {}
+        self._loaded = False
+
+    def load(self) -> 'LabelRegistry':
+        """라벨 목록을 한 번 조회합니다."""
+        if not self._loaded:
+            # REST 목록은 ETag로 캐시되어 변경이 없으면 304 응답으로 처리됨
+            for label in iter_rest_items(f'repos/{self.owner}/{self.repo}/labels'):
+                self._remember(label['name'], label.get('node_id'))
+            self._loaded = True
+            self.save_snapshot()
+        return self
+
+    @staticmethod
+    def cached_names(owner: str, repo: str) -> Optional[Set[str]]:
+        """마지막으로 조회한 라벨 이름(소문자) 목록. 없으면 None (API 호출 없음)"""
+        with GitHubMirror(owner, repo) as mirror:
+            names = mirror.label_names()
+        return set(names) if names is not None else None
+
+    def save_snapshot(self) -> None:
+        with GitHubMirror(self.owner, self.repo) as mirror:
+            mirror.replace_labels(self._labels.values())
+
+    def _remember(self, name: str, node_id: Optional[str]) -> None:
+        self._labels[name.lower()] = {'name': name, 'id': node_id}
+
+    def __contains__(self, label: str) -> bool:
+        return label.lower() in self._labels
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def _create(self, label: str) -> Optional[str]:
+        """라벨 하나를 생성합니다. 실패 시 오류 메시지를 반환합니다."""
+        color, description = label_style(label)
+        try:
+            created = get_client().rest('POST', f'repos/{self.owner}/{self.repo}/labels',
+                                        {'name': label, 'color': color,
+                                         'description': description})
+            self._remember(created.get('name', label), created.get('node_id'))
+            return None
+        except GitHubAPIError as e:
+            if e.status == 422:
+                # 다른 실행이 먼저 만든 경우 (already_exists)
+                self._remember(label, None)
+                return None
+            return str(e)
+
+    def ensure(self, labels: Iterable[str],
+               workers: int = LABEL_CREATE_WORKERS) -> List[str]:
+        """누락된 라벨을 동시에 생성합니다. 생성에 실패한 라벨 목록을 반환합니다."""
+        self.load()
+        missing = sorted({l for l in labels if l and l not in self})
+        if not missing:
+            return []
+        failed = []
+        for label, error in run_ordered(self._create, missing, workers):
+            if error:
+                print(f"   ⚠️  라벨 '{label}' 생성 실패 (건너뜀): {error}")
+                failed.append(label)
+            else:
+                print(f"   ✅ 라벨 '{label}' 생성됨")
+        self.save_snapshot()
+        return failed
+
+    def valid(self, labels: Iterable[str]) -> List[str]:
+        """존재하는 라벨만 리포지토리의 실제 이름으로 반환합니다."""
+        return [self._labels[l.lower()]['name'] for l in labels if l and l in self]
+
+    def node_id(self, label: str) -> Optional[str]:
+        entry = self._labels.get(label.lower())
+        return entry['id'] if entry else None
+
+    def node_ids(self, labels: Iterable[str]) -> Dict[str, str]:
+        """존재하는 라벨의 Node ID를 반환합니다. (소문자 이름 → ID)
+
+        다른 실행이 먼저 만들어 ID를 모르는 라벨만 하나씩 조회합니다.
+        """
+        ids = {}
+        for label in {l.lower() for l in labels if l and l in self}:
+            entry = self._labels[label]
+            if not entry['id']:
+                try:
+                    found = get_client().rest(
+                        'GET', f"repos/{self.owner}/{self.repo}/labels/{quote(entry['name'])}")
+                    entry['id'] = found.get('node_id')
+                except GitHubAPIError as e:
+                    print(f"   ⚠️  라벨 '{entry['name']}' ID 조회 실패 (건너뜀): {e}")
+            if entry['id']:
+                ids[label] = entry['id']
+        return ids
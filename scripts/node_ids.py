@@ -0,0 +1,78 @@
+"""
+Issue Node ID 일괄 조회 모듈
+Issue 번호 → GraphQL Node ID 매핑을 관리합니다.
+- 이미 받아온 목록 조회 결과(id/node_id 필드)를 그대로 재사용
+- 누락된 번호만 별칭 query 하나로 묶어 조회
+- 매핑을 디스크에 저장하여 다음 실행에서는 조회 자체를 생략
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from cache_store import cache_key, load_json, save_json
+from graphql_batch import execute_aliased, gql_value
+
+# 별칭 query 한 번에 조회할 Issue 수
+NODE_ID_BATCH_SIZE = 100
+
+
+class NodeIdResolver:
+    """리포지토리 하나의 Issue 번호 → Node ID 매핑입니다."""
+
+    def __init__(self, owner: str, repo: str, batch_size: int = NODE_ID_BATCH_SIZE):
+        self.owner = owner
+        self.repo = repo
+        self.batch_size = batch_size
+        self._cache_name = f"node_ids/{cache_key(owner, repo)}.json"
+        raw = load_json(self._cache_name, {}) or {}
+        self._ids: Dict[int, str] = {int(k): v for k, v in raw.items()}
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def get(self, number: int) -> Optional[str]:
+        return self._ids.get(number)
+
+    def add(self, number: int, node_id: str) -> None:
+        if node_id and self._ids.get(number) != node_id:
+            self._ids[number] = node_id
+            self._dirty = True
+
+    def forget(self, number: int) -> None:
+        """잘못된(삭제/이전된) Issue의 매핑을 제거합니다."""
+        if self._ids.pop(number, None) is not None:
+            self._dirty = True
+
+    def remember(self, issues: Iterable[Dict]) -> None:
+        """목록 조회 결과에 포함된 Node ID를 기록합니다. (GraphQL `id` 또는 REST `node_id`)"""
+        for issue in issues:
+            node_id = issue.get('node_id') or issue.get('id')
+            if isinstance(node_id, str) and issue.get('number') is not None:
+                self.add(int(issue['number']), node_id)
+
+    def resolve(self, numbers: Iterable[int]) -> Dict[int, str]:
+        """번호 목록의 Node ID를 반환합니다. 모르는 번호만 일괄 조회합니다."""
+        numbers = list(numbers)
+        missing: List[int] = [n for n in dict.fromkeys(numbers) if n not in self._ids]
+        if missing:
+            operations = [
+                (number,
+                 f"repository(owner: {gql_value(self.owner)}, name: {gql_value(self.repo)}) "
+                 f"{{ issue(number: {int(number)}) {{ id }} }}")
+                for number in missing
+            ]
+            results = execute_aliased(operations, operation_type='query',
+                                      batch_size=self.batch_size)
+            for number, result in results.items():
+                issue = (result.data or {}).get('issue') if result.ok else None
+                if issue and issue.get('id'):
+                    self.add(number, issue['id'])
+                else:
+                    print(f"   ⚠️  Issue #{number} Node ID 조회 실패: {result.error or '없음'}")
+        return {n: self._ids[n] for n in numbers if n in self._ids}
+
+    def save(self) -> None:
+        """변경된 매핑을 디스크에 저장합니다."""
+        if self._dirty:
+            save_json(self._cache_name, {str(k): v for k, v in self._ids.items()})
+            self._dirty = False
@@ -0,0 +1,111 @@
+"""
+GraphQL 커서 페이지네이션 모듈
+`pageInfo { hasNextPage endCursor }` 커서를 따라 페이지를 하나씩 yield하는 제너레이터를 제공합니다.
+- 전체 목록을 메모리에 모으지 않고 페이지 단위로 스트리밍 처리
+- prefetch=True이면 현재 페이지를 처리하는 동안 다음 페이지를 미리 요청
+- REST 목록 API는 iter_rest_items로 페이지 번호를 따라 조회 (ETag 캐시 적용)
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence
+
+from github_client import GitHubClient, get_client
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 100  # GitHub GraphQL connection의 first 최대값
+
+
+class Page:
+    """connection의 한 페이지 (nodes, 전체 개수, 다음 커서)"""
+
+    def __init__(self, nodes: List[Dict], total_count: Optional[int],
+                 end_cursor: Optional[str], has_next_page: bool):
+        self.nodes = nodes
+        self.total_count = total_count
+        self.end_cursor = end_cursor
+        self.has_next_page = has_next_page
+
+
+def _dig(data: Dict, path: Sequence[str]) -> Dict:
+    for key in path:
+        data = (data or {}).get(key) or {}
+    return data
+
+
+def _fetch_page(client: GitHubClient, query: str, variables: Dict[str, Any],
+                connection_path: Sequence[str]) -> Page:
+    data = client.graphql(query, variables)
+    connection = _dig(data, connection_path)
+    page_info = connection.get('pageInfo') or {}
+    return Page(
+        nodes=[node for node in (connection.get('nodes') or []) if node],
+        total_count=connection.get('totalCount'),
+        end_cursor=page_info.get('endCursor'),
+        has_next_page=bool(page_info.get('hasNextPage')),
+    )
+
+
+def paginate(query: str, variables: Dict[str, Any], connection_path: Sequence[str],
+             page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = False,
+             client: Optional[GitHubClient] = None) -> Iterator[Page]:
+    """connection을 페이지 단위로 yield합니다.
+
+    query는 `$first: Int!`, `$after: String` 변수를 받아야 하고,
+    connection_path가 가리키는 connection은 `nodes`와 `pageInfo`를 조회해야 합니다.
+    """
+    client = client or get_client()
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+    base_variables = dict(variables, first=page_size)
+
+    def fetch(cursor: Optional[str]) -> Page:
+        return _fetch_page(client, query, dict(base_variables, after=cursor), connection_path)
+
+    if not prefetch:
+        cursor = None
+        while True:
+            page = fetch(cursor)
+            yield page
+            if not page.has_next_page or not page.end_cursor:
+                return
+            cursor = page.end_cursor
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending: Optional['Future'] = executor.submit(fetch, None)
+        while pending is not None:
+            page = pending.result()
+            # 소비자가 현재 페이지를 처리하는 동안 다음 페이지를 미리 요청
+            if page.has_next_page and page.end_cursor:
+                pending = executor.submit(fetch, page.end_cursor)
+            else:
+                pending = None
+            yield page
+
+
+def iter_nodes(query: str, variables: Dict[str, Any], connection_path: Sequence[str],
+               page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = False,
+               client: Optional[GitHubClient] = None) -> Iterator[Dict]:
+    """connection의 node를 하나씩 yield합니다."""
+    for page in paginate(query, variables, connection_path, page_size, prefetch, client):
+        yield from page.nodes
+
+
+def iter_rest_items(path: str, params: Optional[Dict[str, Any]] = None,
+                    per_page: int = MAX_PAGE_SIZE,
+                    client: Optional[GitHubClient] = None) -> Iterator[Dict]:
+    """REST 목록 API(`?page=N&per_page=M`)의 항목을 하나씩 yield합니다.
+
+    GraphQL과 달리 REST GET은 ETag 조건부 요청이 가능하므로, 변경이 없으면
+    304 응답(rate limit 미소모)과 캐시된 본문으로 처리됩니다.
+    """
+    client = client or get_client()
+    per_page = max(1, min(per_page, MAX_PAGE_SIZE))
+    page = 1
+    while True:
+        items = client.rest('GET', path, params=dict(params or {}, per_page=per_page, page=page))
+        yield from items or []
+        if not items or len(items) < per_page:
+            return
+        page += 1
@@ -0,0 +1,227 @@
+"""
+스트리밍 파이프라인 모듈
+여러 단계(예: 파싱 → 중복 확인 → 생성 → Project 추가 → 날짜 설정)를
+크기가 제한된 큐로 연결하여 각 단계가 앞 단계의 결과를 받는 즉시 처리하도록 합니다.
+- 단계마다 작업 스레드 수 지정 (API 호출 단계는 --concurrency만큼)
+- 큐 크기가 제한되어 있어 느린 단계가 있으면 앞 단계가 기다림 (메모리 사용량 일정)
+- 단계 함수가 None을 반환하면 해당 항목은 다음 단계로 넘어가지 않음
+- batch_size가 주어진 단계는 항목을 최대 batch_size개씩 모아 목록으로 처리 (일괄 API 호출용)
+- 결과와 print 출력은 입력 순서대로 내보냄 (항목별로 버퍼링했다가 앞 항목이 끝나면 출력, run_ordered와 같은 방식)
+  묶음 단계 호출의 출력은 묶음의 첫 항목 위치에 출력
+- 순서를 기다리며 쌓이는 항목 수는 제한 (앞 항목이 느리면 입력을 잠시 멈춤)
+- 추적이 켜져 있으면 단계 함수 호출마다 단계 이름으로 phase span을 기록
+"""
+
+import io
+import queue
+import sys
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import telemetry
+from concurrency import ThreadOutputRouter
+
+DEFAULT_QUEUE_SIZE = 32
+# 묶음 단계가 첫 항목 이후 다음 항목을 기다리는 최대 시간 (초)
+DEFAULT_BATCH_LINGER = 0.2
+
+_DONE = object()
+_DROPPED = object()  # 중간 단계에서 None을 반환하여 결과가 없는 항목
+
+
+class Stage:
+    """파이프라인 단계 하나 (이름, 처리 함수, 작업 스레드 수)
+
+    batch_size > 1이면 func은 항목 목록을 받아 같은 길이의 결과 목록을 반환합니다.
+    """
+
+    def __init__(self, name: str, func: Callable[[Any], Any], workers: int = 1,
+                 batch_size: int = 1, linger: float = DEFAULT_BATCH_LINGER):
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.linger = linger
+
+
+class _StageRunner:
+    """단계 하나의 작업 스레드들을 실행합니다."""
+
+    def __init__(self, stage: Stage, inbox: queue.Queue, outbox: queue.Queue,
+                 pipeline: 'Pipeline'):
+        self.stage = stage
+        self.inbox = inbox
+        self.outbox = outbox
+        self.pipeline = pipeline
+        self._remaining = stage.workers
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        for i in range(self.stage.workers):
+            threading.Thread(target=self._work, name=f"{self.stage.name}-{i}",
+                             daemon=True).start()
+
+    def _next_batch(self) -> Tuple[List[Tuple[int, Any]], bool]:
+        """항목을 batch_size개까지 모읍니다. (첫 항목 이후 linger초 동안 새 항목이 없으면 그대로 반환)
+
+        ((순번, 항목) 목록, 입력이 끝났는지)를 반환합니다.
+        """
+        batch: List[Tuple[int, Any]] = []
+        while len(batch) < self.stage.batch_size:
+            try:
+                item = self.inbox.get(timeout=self.stage.linger) if batch else self.inbox.get()
+            except queue.Empty:
+                break
+            if item is _DONE:
+                # 같은 단계의 다른 작업 스레드도 종료하도록 다시 넣음
+                self.inbox.put(_DONE)
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _work(self) -> None:
+        while True:
+            batch, finished = self._next_batch()
+            if batch and not self.pipeline.failed:
+                # 오류 이후에는 남은 항목을 버리면서 종료를 기다림
+                batch.sort(key=lambda entry: entry[0])
+                seqs = [seq for seq, _ in batch]
+                try:
+                    with telemetry.phase(self.stage.name):
+                        if self.stage.batch_size > 1:
+                            results = self.pipeline.call(self.stage.func,
+                                                         [item for _, item in batch], min(seqs))
+                        else:
+                            results = [self.pipeline.call(self.stage.func, batch[0][1], seqs[0])]
+                except BaseException as e:
+                    self.pipeline.fail(e)
+                    results = []
+                for seq, result in zip(seqs, results):
+                    if result is None:
+                        self.pipeline.drop(seq)
+                    else:
+                        self.outbox.put((seq, result))
+            if finished:
+                break
+        with self._lock:
+            self._remaining -= 1
+            last = self._remaining == 0
+        if last:
+            self.outbox.put(_DONE)
+
+
+class Pipeline:
+    """단계들을 제한된 큐로 연결한 파이프라인"""
+
+    def __init__(self, stages: List[Stage], queue_size: int = DEFAULT_QUEUE_SIZE):
+        self.stages = stages
+        self.queue_size = queue_size
+        self.error: Optional[BaseException] = None
+        self._router: Optional[ThreadOutputRouter] = None
+        self._output_lock = threading.Lock()
+        self._outputs: Dict[int, List[str]] = {}
+        self._results: Optional[queue.Queue] = None
+        # 순서를 기다리며 처리 중일 수 있는 최대 항목 수 (묶음 하나는 항상 들어가도록)
+        window = max([queue_size] + [stage.batch_size + stage.workers for stage in stages])
+        self._window = threading.BoundedSemaphore(window * (len(stages) + 1))
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
+    def fail(self, error: BaseException) -> None:
+        if self.error is None:
+            self.error = error
+
+    def call(self, func: Callable[[Any], Any], item: Any, seq: int) -> Any:
+        """func(item)을 실행하고 그동안의 print 출력을 seq번째 항목의 출력으로 모아 둡니다."""
+        buffer = io.StringIO()
+        self._router.capture(buffer)
+        try:
+            return func(item)
+        finally:
+            self._router.capture(None)
+            output = buffer.getvalue()
+            if output:
+                with self._output_lock:
+                    self._outputs.setdefault(seq, []).append(output)
+
+    def drop(self, seq: int) -> None:
+        """중간 단계에서 걸러진 항목도 순서를 채우도록 완료로 표시합니다."""
+        self._results.put((seq, _DROPPED))
+
+    def _feed(self, source: Iterable[Any], inbox: queue.Queue) -> None:
+        iterator = iter(source)
+        seq = 0
+        try:
+            while not self.failed:
+                # 앞 항목이 끝나지 않아 순서 대기 중인 항목이 많으면 입력을 멈춤
+                if not self._window.acquire(timeout=0.1):
+                    continue
+                try:
+                    # source(예: map_processes)의 출력도 해당 항목의 출력으로 묶음
+                    with telemetry.phase('source'):
+                        item = self.call(next, iterator, seq)
+                except StopIteration:
+                    break
+                inbox.put((seq, item))
+                seq += 1
+        except BaseException as e:
+            self.fail(e)
+        finally:
+            inbox.put(_DONE)
+
+    def _emit(self, seq: int) -> None:
+        with self._output_lock:
+            outputs = self._outputs.pop(seq, [])
+        for output in outputs:
+            self._router.target.write(output)
+        if outputs:
+            self._router.target.flush()
+        self._window.release()
+
+    def run(self, source: Iterable[Any]) -> Iterator[Any]:
+        """source의 항목을 모든 단계에 통과시키고 마지막 단계의 결과를 입력 순서대로 yield합니다."""
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        self._results = queues[-1]
+        original_stdout = sys.stdout
+        self._router = ThreadOutputRouter(original_stdout)
+        sys.stdout = self._router
+        try:
+            for stage, inbox, outbox in zip(self.stages, queues, queues[1:]):
+                _StageRunner(stage, inbox, outbox, self).start()
+            threading.Thread(target=self._feed, args=(source, queues[0]),
+                             name='source', daemon=True).start()
+
+            pending: Dict[int, Any] = {}
+            next_seq = 0
+            while True:
+                item = queues[-1].get()
+                if item is _DONE:
+                    break
+                seq, result = item
+                pending[seq] = result
+                while next_seq in pending:
+                    result = pending.pop(next_seq)
+                    self._emit(next_seq)
+                    next_seq += 1
+                    if result is not _DROPPED:
+                        yield result
+            # 오류로 중단된 항목의 출력과 남은 결과를 순서대로 내보냄
+            with self._output_lock:
+                remaining = sorted(set(pending) | set(self._outputs))
+            for seq in remaining:
+                result = pending.pop(seq, _DROPPED)
+                self._emit(seq)
+                if result is not _DROPPED:
+                    yield result
+        finally:
+            sys.stdout = original_stdout
+        if self.error is not None:
+            raise self.error
+
+
+def run_pipeline(source: Iterable[Any], stages: List[Stage],
+                 queue_size: int = DEFAULT_QUEUE_SIZE) -> Iterator[Any]:
+    """source를 stages에 차례로 통과시킨 결과를 yield합니다."""
+    return Pipeline(stages, queue_size).run(source)
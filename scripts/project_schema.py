@@ -0,0 +1,125 @@
+"""
+Project 스키마 캐시 모듈
+Owner 타입, Project 목록, Project별 필드(타입, 선택지 ID, Iteration ID)를 로컬에 캐시합니다.
+- 캐시 파일: projects/{owner}.json (Owner 단위)
+- TTL 이내에는 API를 호출하지 않음 (warm start 시 스키마 조회 0회)
+- TTL이 지나면 updatedAt probe 1회로 확인하여 변경이 없으면 필드를 다시 조회하지 않음
+- Owner 타입은 바뀌지 않으므로 refresh=True일 때만 다시 조회
+"""
+
+import time
+from typing import Dict, List, Optional
+
+from cache_store import cache_key, load_json, save_json
+from github_client import GitHubAPIError, get_client
+from projects import date_fields, fetch_project_schema, get_project_updated_at, list_projects
+
+SCHEMA_CACHE_VERSION = 1
+DEFAULT_SCHEMA_TTL = 24 * 60 * 60  # 초
+
+
+class ProjectSchema:
+    """Project 하나의 필드 스키마"""
+
+    def __init__(self, data: Dict):
+        self.data = data
+        self.id: str = data['id']
+        self.updated_at: Optional[str] = data.get('updated_at')
+        self.fields: Dict[str, Dict] = {f['name'].lower(): f for f in data.get('fields', [])}
+
+    def field(self, name: str) -> Optional[Dict]:
+        return self.fields.get(name.lower())
+
+    def date_fields(self) -> Dict[str, str]:
+        """Date 필드의 {소문자 이름: 필드 ID}"""
+        return date_fields(self.data)
+
+    def option_id(self, field_name: str, option_name: str) -> Optional[str]:
+        """Single select 필드의 선택지 ID를 이름으로 찾습니다."""
+        for option in (self.field(field_name) or {}).get('options', []):
+            if option['name'].lower() == option_name.lower():
+                return option['id']
+        return None
+
+    def iteration_id(self, field_name: str, title: str) -> Optional[str]:
+        """Iteration 필드의 Iteration ID를 제목으로 찾습니다."""
+        for iteration in (self.field(field_name) or {}).get('iterations', []):
+            if iteration['title'].lower() == title.lower():
+                return iteration['id']
+        return None
+
+
+class ProjectSchemaCache:
+    """Owner 하나에 대한 Project 스키마 캐시"""
+
+    def __init__(self, owner: str, ttl: int = DEFAULT_SCHEMA_TTL, refresh: bool = False):
+        self.owner = owner
+        self.ttl = ttl
+        self.refresh = refresh
+        self._name = f"projects/{cache_key(owner)}.json"
+        data = load_json(self._name, {}) or {}
+        if data.get('version') != SCHEMA_CACHE_VERSION:
+            data = {}
+        self._data: Dict = data
+        self._data.setdefault('schemas', {})
+        self._dirty = False
+
+    def _fresh(self, fetched_at: Optional[float]) -> bool:
+        return not self.refresh and fetched_at is not None and time.time() - fetched_at < self.ttl
+
+    def owner_type(self) -> str:
+        """Owner 타입 ('organization' 또는 'user')"""
+        if self.refresh or not self._data.get('owner_type'):
+            try:
+                user_data = get_client().rest('GET', f'users/{self.owner}')
+            except GitHubAPIError:
+                return 'user'  # 기본값 (캐시하지 않음)
+            self._data['owner_type'] = ('organization' if user_data.get('type') == 'Organization'
+                                        else 'user')
+            self._dirty = True
+        return self._data['owner_type']
+
+    def projects(self) -> List[Dict]:
+        """Project 목록 (TTL 이내면 캐시 사용)"""
+        if not self._fresh(self._data.get('projects_fetched_at')):
+            projects = list_projects(self.owner, self.owner_type())
+            if not projects:
+                # 조회 실패 시 이전 캐시라도 사용
+                return self._data.get('projects') or []
+            self._data['projects'] = projects
+            self._data['projects_fetched_at'] = time.time()
+            self._dirty = True
+        return self._data['projects']
+
+    def schema(self, project_number: int, project_id: str) -> ProjectSchema:
+        """Project의 필드 스키마 (TTL 이내면 캐시, 지나면 updatedAt probe로 검증)"""
+        key = str(project_number)
+        cached = self._data['schemas'].get(key)
+        if cached and cached.get('id') == project_id:
+            if self._fresh(cached.get('fetched_at')):
+                return ProjectSchema(cached)
+            if not self.refresh:
+                try:
+                    if cached.get('updated_at') and \
+                            get_project_updated_at(project_id) == cached['updated_at']:
+                        cached['fetched_at'] = time.time()
+                        self._dirty = True
+                        return ProjectSchema(cached)
+                except GitHubAPIError:
+                    return ProjectSchema(cached)
+
+        schema = fetch_project_schema(project_id)
+        schema['fetched_at'] = time.time()
+        self._data['schemas'][key] = schema
+        self._dirty = True
+        return ProjectSchema(schema)
+
+    def cached(self, project_number: int) -> Optional[ProjectSchema]:
+        """TTL과 관계없이 캐시된 스키마만 반환합니다. (API 호출 없음, 오프라인 plan용)"""
+        cached = self._data['schemas'].get(str(project_number))
+        return ProjectSchema(cached) if cached else None
+
+    def save(self) -> None:
+        if self._dirty:
+            save_json(self._name, dict(self._data, version=SCHEMA_CACHE_VERSION))
+            self._dirty = False
@@ -0,0 +1,188 @@
+"""
+GitHub Projects (v2) 헬퍼 모듈
+Owner 타입/Project 목록/필드 조회, Item 추가, 날짜 필드 설정을 스크립트들이 공통으로 사용합니다.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from github_client import get_client
+from pagination import DEFAULT_PAGE_SIZE, iter_nodes
+
+PROJECT_FIELDS_QUERY = """
+query($projectId: ID!, $first: Int!, $after: String) {
+  node(id: $projectId) {
+    ... on ProjectV2 {
+      updatedAt
+      fields(first: $first, after: $after) {
+        pageInfo { hasNextPage endCursor }
+        nodes {
+          ... on ProjectV2FieldCommon {
+            id
+            name
+            dataType
+          }
+          ... on ProjectV2SingleSelectField {
+            options { id name }
+          }
+          ... on ProjectV2IterationField {
+            configuration {
+              iterations { id title startDate duration }
+              completedIterations { id title startDate duration }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+PROJECT_UPDATED_AT_QUERY = """
+query($projectId: ID!) {
+  node(id: $projectId) {
+    ... on ProjectV2 {
+      updatedAt
+    }
+  }
+}
+"""
+
+ADD_ITEM_MUTATION = """
+mutation($projectId: ID!, $contentId: ID!) {
+  addProjectV2ItemById(input: {projectId: $projectId, contentId: $contentId}) {
+    item {
+      id
+    }
+  }
+}
+"""
+
+UPDATE_DATE_MUTATION = """
+mutation($projectId: ID!, $itemId: ID!, $fieldId: ID!, $date: Date!) {
+  updateProjectV2ItemFieldValue(input: {
+    projectId: $projectId,
+    itemId: $itemId,
+    fieldId: $fieldId,
+    value: {date: $date}
+  }) {
+    projectV2Item {
+      id
+    }
+  }
+}
+"""
+
+
+def list_projects(owner: str, owner_type: str) -> List[Dict]:
+    """사용 가능한 Projects 목록을 가져옵니다."""
+    projects = []
+    try:
+        query = f"""
+        query($login: String!, $first: Int!, $after: String) {{
+          {owner_type}(login: $login) {{
+            projectsV2(first: $first, after: $after) {{
+              pageInfo {{ hasNextPage endCursor }}
+              nodes {{
+                id
+                number
+                title
+                url
+              }}
+            }}
+          }}
+        }}
+        """
+
+        for project in iter_nodes(query, {'login': owner}, (owner_type, 'projectsV2')):
+            projects.append({
+                'id': project['id'],
+                'number': project['number'],
+                'title': project['title'],
+                'url': project['url']
+            })
+    except Exception as e:
+        print(f"⚠️  Projects 조회 실패: {e}")
+
+    return projects
+
+
+def fetch_project_schema(project_id: str) -> Dict:
+    """Project의 모든 필드(타입, 선택지 ID, Iteration ID 포함)와 updatedAt을 조회합니다."""
+    client = get_client()
+    updated_at = None
+    fields = []
+    cursor = None
+    while True:
+        data = client.graphql(PROJECT_FIELDS_QUERY, {'projectId': project_id,
+                                                     'first': DEFAULT_PAGE_SIZE, 'after': cursor})
+        node = data.get('node') or {}
+        # 첫 페이지의 updatedAt 기준 (조회 중 변경되면 다음 probe에서 다시 조회됨)
+        updated_at = updated_at or node.get('updatedAt')
+        connection = node.get('fields') or {}
+        for field in connection.get('nodes') or []:
+            if not (field or {}).get('id'):
+                continue
+            configuration = field.get('configuration') or {}
+            fields.append({
+                'id': field['id'],
+                'name': field['name'],
+                'data_type': field.get('dataType'),
+                'options': field.get('options') or [],
+                'iterations': ((configuration.get('iterations') or [])
+                               + (configuration.get('completedIterations') or [])),
+            })
+        page_info = connection.get('pageInfo') or {}
+        if not page_info.get('hasNextPage'):
+            break
+        cursor = page_info.get('endCursor')
+    return {'id': project_id, 'updated_at': updated_at, 'fields': fields}
+
+
+def get_project_updated_at(project_id: str) -> Optional[str]:
+    """Project의 updatedAt만 조회합니다. (스키마 캐시 검증용 probe)"""
+    data = get_client().graphql(PROJECT_UPDATED_AT_QUERY, {'projectId': project_id})
+    return (data.get('node') or {}).get('updatedAt')
+
+
+def date_fields(schema: Dict) -> Dict[str, str]:
+    """스키마에서 Date 필드의 {소문자 이름: 필드 ID}를 반환합니다."""
+    return {f['name'].lower(): f['id'] for f in schema.get('fields', [])
+            if f.get('data_type') == 'DATE'}
+
+
+def find_date_fields(fields: Dict[str, str]) -> Tuple[Optional[str], Optional[str]]:
+    """Date 필드 중 (시작일 필드 ID, 종료일 필드 ID)를 이름으로 찾습니다."""
+    start_field_id = None
+    end_field_id = None
+    for field_name, field_id in fields.items():
+        if 'start' in field_name or '시작' in field_name:
+            start_field_id = field_id
+        elif 'end' in field_name or 'due' in field_name or '마감' in field_name or '종료' in field_name:
+            end_field_id = field_id
+    return start_field_id, end_field_id
+
+
+def add_issue_to_project(project_id: str, issue_id: str) -> Optional[str]:
+    """Issue를 Project에 추가합니다. Item ID (이미 추가된 경우 'exists')를 반환합니다."""
+    try:
+        data = get_client().graphql(ADD_ITEM_MUTATION, {'projectId': project_id,
+                                                        'contentId': issue_id})
+        item_id = ((data.get('addProjectV2ItemById') or {}).get('item') or {}).get('id')
+        return item_id
+    except Exception as e:
+        error_msg = str(e)
+        if 'already exists' in error_msg.lower() or 'already added' in error_msg.lower():
+            return 'exists'  # 이미 추가됨
+        return None
+
+
+def update_project_item_date(project_id: str, item_id: str, field_id: str,
+                             date_value: str) -> bool:
+    """Project Item의 날짜 필드를 업데이트합니다."""
+    try:
+        get_client().graphql(UPDATE_DATE_MUTATION, {'projectId': project_id, 'itemId': item_id,
+                                                    'fieldId': field_id, 'date': date_value})
+        return True
+    except Exception as e:
+        print(f"   ⚠️  날짜 필드 업데이트 실패: {e}")
+        return False
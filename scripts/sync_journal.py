@@ -0,0 +1,183 @@
+"""
+동기화 작업 저널 모듈
+Issue 생성/업데이트/닫기와 Project 추가/날짜 설정을 실행 전(intent)과 실행 후(done/failed)에
+추가 전용(append-only) JSON Lines 파일에 기록합니다. (durable outbox)
+- 파일: journal/{owner__repo}.jsonl
+- intent는 묶음 단위로 쓰고 한 번 fsync한 뒤 실행, 완료 기록은 N개 또는 T초마다 한 번 fsync
+- 프로세스가 중간에 죽어도 완료 기록으로 매니페스트를 복구하고, 끝나지 않은 작업만 resume으로 다시 실행
+- 같은 대상(Task 파일, Project 날짜 필드)의 나중 intent가 앞선 미완료 intent를 대체
+- 쓰다 만 마지막 줄(기록 중 중단)은 무시
+- 매니페스트를 저장한 뒤 checkpoint로 끝난 작업을 지우고 미완료 intent만 남겨 파일을 다시 씀
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from cache_store import cache_key, get_cache_dir
+
+JOURNAL_VERSION = 1
+DEFAULT_FSYNC_EVERY = 64
+DEFAULT_FSYNC_INTERVAL = 1.0  # 초
+
+INTENT = 'intent'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class JournalOp:
+    """저널에 기록된 작업 하나 (마지막 상태 기준)"""
+
+    def __init__(self, op: str, kind: str, target: str, data: Dict):
+        self.op = op
+        self.kind = kind
+        self.target = target
+        self.data = data
+        self.state = INTENT
+        self.result: Dict = {}
+        self.error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.state == DONE
+
+
+class SyncJournal:
+    """리포지토리 하나의 작업 저널"""
+
+    def __init__(self, owner: str, repo: str, fsync_every: int = DEFAULT_FSYNC_EVERY,
+                 fsync_interval: float = DEFAULT_FSYNC_INTERVAL):
+        self.path = get_cache_dir() / 'journal' / f"{cache_key(owner, repo)}.jsonl"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync_every = max(1, fsync_every)
+        self.fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._unsynced = 0
+        self._synced_at = time.monotonic()
+        self._run = os.urandom(4).hex()
+        self._seq = 0
+
+    # ---- 쓰기 ----
+
+    def _append(self, records: List[Dict], durable: bool) -> None:
+        data = ''.join(json.dumps(r, ensure_ascii=False, separators=(',', ':')) + '\n'
+                       for r in records).encode('utf-8')
+        with self._lock:
+            if self._fd is None:
+                self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            # O_APPEND 한 번의 write로 줄 단위 기록 (다른 기록과 섞이지 않음)
+            os.write(self._fd, data)
+            self._unsynced += len(records)
+            if durable or self._unsynced >= self.fsync_every or \
+                    time.monotonic() - self._synced_at >= self.fsync_interval:
+                self._sync_locked()
+
+    def _sync_locked(self) -> None:
+        if self._fd is not None and self._unsynced:
+            os.fsync(self._fd)
+        self._unsynced = 0
+        self._synced_at = time.monotonic()
+
+    def sync(self) -> None:
+        """아직 fsync하지 않은 기록을 디스크에 반영합니다."""
+        with self._lock:
+            self._sync_locked()
+
+    def intend(self, kind: str, steps: Iterable[Tuple[str, Dict]]) -> List[JournalOp]:
+        """(대상, 데이터) 목록의 실행 의도를 기록하고 한 번 fsync합니다. 실행 전에 호출합니다."""
+        ops = []
+        for target, data in steps:
+            self._seq += 1
+            ops.append(JournalOp(f"{self._run}-{self._seq}", kind, target, data))
+        if ops:
+            self._append([{'v': JOURNAL_VERSION, 'op': op.op, 'state': INTENT, 'kind': kind,
+                           'target': op.target, 'data': op.data} for op in ops], durable=True)
+        return ops
+
+    def done(self, op: JournalOp, **result) -> JournalOp:
+        """작업 완료를 기록합니다. (fsync는 묶어서 수행)"""
+        op.state, op.result = DONE, result
+        self._append([{'op': op.op, 'state': DONE, 'result': result}], durable=False)
+        return op
+
+    def failed(self, op: JournalOp, error: Optional[str] = None) -> JournalOp:
+        op.state, op.error = FAILED, error or '실패'
+        self._append([{'op': op.op, 'state': FAILED, 'error': op.error}], durable=False)
+        return op
+
+    def close(self) -> None:
+        with self._lock:
+            self._sync_locked()
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    # ---- 읽기 ----
+
+    def load(self) -> List[JournalOp]:
+        """저널의 작업을 기록 순서대로 읽습니다. (상태는 마지막 기록 기준)"""
+        self.sync()
+        ops: Dict[str, JournalOp] = {}
+        try:
+            with open(self.path, 'rb') as f:
+                lines = f.read().split(b'\n')
+        except OSError:
+            return []
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # 빈 줄 또는 쓰다 만 줄
+            op = ops.get(record.get('op'))
+            if record.get('state') == INTENT and record.get('v') == JOURNAL_VERSION:
+                ops[record['op']] = JournalOp(record['op'], record['kind'], record['target'],
+                                              record.get('data') or {})
+            elif op is not None and record.get('state') == DONE:
+                op.state, op.result = DONE, record.get('result') or {}
+            elif op is not None and record.get('state') == FAILED:
+                op.state, op.error = FAILED, record.get('error')
+        return list(ops.values())
+
+    @staticmethod
+    def pending(ops: List[JournalOp]) -> List[JournalOp]:
+        """끝나지 않은 작업 (같은 대상의 나중 intent가 있으면 앞선 작업은 제외)"""
+        latest: Dict[str, JournalOp] = {}
+        for op in ops:
+            latest[op.target] = op
+        return [op for op in ops if not op.finished and latest[op.target] is op]
+
+    def checkpoint(self) -> int:
+        """매니페스트 저장 후 호출합니다. 미완료 intent만 남기고 파일을 다시 씁니다. 남은 수를 반환합니다."""
+        with self._lock:
+            self._sync_locked()
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        remaining = self.pending(self.load())
+        if not remaining:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+            return 0
+        import tempfile
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                for op in remaining:
+                    f.write(json.dumps({'v': JOURNAL_VERSION, 'op': op.op, 'state': INTENT,
+                                        'kind': op.kind, 'target': op.target, 'data': op.data},
+                                       ensure_ascii=False, separators=(',', ':')) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        return len(remaining)
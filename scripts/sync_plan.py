@@ -0,0 +1,133 @@
+"""
+동기화 계획 모듈
+Task 트리와 로컬 캐시(매니페스트, 키 인덱스, 라벨 스냅샷, Project 스키마)만으로 만든 변경 계획을
+JSON/NDJSON 파일로 저장하고 읽습니다. (API 호출 없음)
+- 작업(op): ensure_labels, create, update, record, forget, close, add_to_project, set_date
+- 파일 단위 작업에는 계획 시점의 내용 해시가 들어 있어 apply 때 바뀐 파일을 건너뜀
+- 예상 REST/GraphQL 호출 수와 rate limit 비용을 함께 기록
+"""
+
+import json
+import math
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from issue_batch import ISSUE_CREATE_BATCH_SIZE, cached_repository_id
+
+PLAN_VERSION = 1
+
+# 작업별 예상 호출 수 (REST, GraphQL). create는 wave별로 묶어서 계산 (estimate 참고)
+_OP_CALLS = {
+    'create': (0, 0),
+    'close': (1, 0),
+    'record': (0, 0),
+    'forget': (0, 0),
+    'add_to_project': (0, 1),
+    'set_date': (0, 1),
+}
+# 2차 rate limit 점수: GET과 GraphQL query 1점, 쓰기 요청(POST/PATCH/DELETE)과 mutation 5점
+_READ_POINTS = 1
+_WRITE_POINTS = 5
+
+
+def action_calls(action: Dict) -> Tuple[int, int, int]:
+    """작업 하나의 예상 (REST 읽기, REST 쓰기, GraphQL mutation) 호출 수"""
+    op = action['op']
+    if op == 'ensure_labels':
+        return 1, len(action.get('missing', [])), 0
+    if op == 'update':
+        writes = 1 + (1 if action.get('labels_added') else 0) + len(action.get('labels_removed', []))
+        return 0, writes, 0
+    if op == 'add_to_project':
+        # Issue node ID를 모르면 REST로 한 번 조회
+        return (1 if action.get('needs_node_id') else 0), 0, 1
+    rest, graphql = _OP_CALLS.get(op, (0, 0))
+    return 0, rest, graphql
+
+
+def estimate(actions: Iterable[Dict], repository_id_cached: bool = False) -> Dict:
+    """계획 전체의 예상 API 호출 수와 비용을 계산합니다.
+
+    생성은 apply와 같이 wave별로 createIssue 별칭 mutation 문서 하나에 ISSUE_CREATE_BATCH_SIZE개씩
+    묶어 계산하고, 리포지토리 Node ID가 캐시에 없으면 조회 query 1회를 더합니다.
+    GraphQL 요청은 1차 한도에서 1점으로 계산합니다. (노드 목록을 조회하지 않으므로)
+    """
+    rest_reads = rest_writes = mutations = queries = creations = 0
+    ops: Dict[str, int] = {}
+    waves: Dict[int, int] = {}
+    for action in actions:
+        reads, writes, graphql = action_calls(action)
+        rest_reads += reads
+        rest_writes += writes
+        mutations += graphql
+        ops[action['op']] = ops.get(action['op'], 0) + 1
+        if action['op'] == 'create':
+            creations += 1
+            waves[action.get('wave', 1)] = waves.get(action.get('wave', 1), 0) + 1
+    mutations += sum(math.ceil(count / ISSUE_CREATE_BATCH_SIZE) for count in waves.values())
+    if creations and not repository_id_cached:
+        queries += 1
+    return {
+        'rest_calls': rest_reads + rest_writes,
+        'graphql_calls': mutations + queries,
+        'graphql_cost': mutations + queries,
+        'secondary_points': ((rest_reads + queries) * _READ_POINTS
+                             + (rest_writes + mutations) * _WRITE_POINTS),
+        'content_creations': creations,
+        'operations': ops,
+    }
+
+
+def make_header(owner: str, repo: str, actions: List[Dict], **extra) -> Dict:
+    header = {
+        'version': PLAN_VERSION,
+        'repo': f"{owner}/{repo}",
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'estimate': estimate(actions, cached_repository_id(owner, repo) is not None),
+    }
+    header.update(extra)
+    return header
+
+
+def write_plan(path: Path, header: Dict, actions: List[Dict], ndjson: bool = False) -> None:
+    """계획을 저장합니다. NDJSON은 첫 줄이 {"plan": 헤더}, 이후 한 줄에 작업 하나입니다."""
+    with open(path, 'w', encoding='utf-8') as f:
+        if ndjson:
+            f.write(json.dumps({'plan': header}, ensure_ascii=False) + '\n')
+            for action in actions:
+                f.write(json.dumps(action, ensure_ascii=False) + '\n')
+        else:
+            json.dump(dict(header, actions=actions), f, ensure_ascii=False, indent=1)
+            f.write('\n')
+
+
+def read_plan(path: Path) -> Tuple[Dict, List[Dict]]:
+    """JSON 또는 NDJSON 계획 파일을 읽어 (헤더, 작업 목록)을 반환합니다."""
+    with open(path, 'r', encoding='utf-8') as f:
+        first = f.readline()
+        try:
+            head = json.loads(first)
+        except ValueError:
+            head = None
+        if isinstance(head, dict) and 'plan' in head:
+            header = head['plan']
+            actions = [json.loads(line) for line in f if line.strip()]
+        else:
+            data = json.loads(first + f.read())
+            actions = data.pop('actions', [])
+            header = data
+    if header.get('version') != PLAN_VERSION:
+        raise ValueError(f"지원하지 않는 계획 버전: {header.get('version')}")
+    return header, actions
+
+
+def format_estimate(header: Dict) -> List[str]:
+    """계획 요약 출력용 줄 목록"""
+    est = header.get('estimate', {})
+    lines = [f"   - {op}: {count}개" for op, count in sorted(est.get('operations', {}).items())]
+    lines.append(f"   - 예상 REST 호출: {est.get('rest_calls', 0)}회, "
+                 f"GraphQL 호출: {est.get('graphql_calls', 0)}회 (비용 {est.get('graphql_cost', 0)}점)")
+    lines.append(f"   - 2차 rate limit 점수: {est.get('secondary_points', 0)}점, "
+                 f"콘텐츠 생성 요청: {est.get('content_creations', 0)}회")
+    return lines
@@ -0,0 +1,267 @@
+"""
+Task 의존성 그래프 모듈
+frontmatter `depends-on`으로 선언된 Task 간 의존성을 DAG로 만들고,
+생성 순서(위상 정렬 wave), 일정 재계산, Issue 의존 관계 연결을 처리합니다.
+- 그래프 생성과 위상 정렬은 O(V+E), 순환이 있으면 순환 경로와 함께 DependencyCycleError
+- 같은 wave의 Task는 서로 의존하지 않으므로 동시에 생성할 수 있음
+- 일정은 바뀐 Task에서 시작해 영향을 받는 후행 Task만 위상 순서로 다시 계산 (전체 재계산 없음)
+- Issue 간 "blocked by" 관계는 별칭 mutation으로 묶어 추가/제거
+"""
+
+import datetime
+import heapq
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from graphql_batch import execute_aliased, gql_value
+from issue_markers import task_identity, task_key, task_numbers
+
+DEPENDS_ON_KEY = 'depends-on'
+# 별칭 mutation 한 번에 보낼 의존 관계 수
+LINK_BATCH_SIZE = 50
+
+_TASK_REF_RE = re.compile(r'^\s*(?:Task\s+)?(\d+)\s*$', re.IGNORECASE)
+
+
+class DependencyCycleError(ValueError):
+    """의존성 그래프에 순환이 있을 때 발생합니다. cycle은 순환을 이루는 키 목록입니다."""
+
+    def __init__(self, cycle: List[str]):
+        super().__init__(' → '.join(cycle + cycle[:1]))
+        self.cycle = cycle
+
+
+def dependency_refs(frontmatter: Dict) -> List[str]:
+    """frontmatter `depends-on` 값을 Task 식별자 목록으로 바꿉니다.
+
+    목록 또는 쉼표로 구분한 문자열을 받으며, 숫자/`Task NNN`은 Task 번호, 나머지는 Task ID로 봅니다.
+    """
+    value = frontmatter.get(DEPENDS_ON_KEY)
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        items = value
+    else:
+        items = str(value).split(',')
+    refs = []
+    for item in items:
+        if isinstance(item, int) and not isinstance(item, bool):
+            refs.append(f"task:{item}")
+            continue
+        text = str(item).strip()
+        if not text:
+            continue
+        match = _TASK_REF_RE.match(text)
+        refs.append(f"task:{int(match.group(1))}" if match else f"id:{text}")
+    return list(dict.fromkeys(refs))
+
+
+def task_aliases(frontmatter: Dict, file_path: Path) -> List[str]:
+    """다른 Task가 `depends-on`에서 이 Task를 가리킬 수 있는 모든 식별자"""
+    aliases = [task_identity(frontmatter, file_path)]
+    explicit = frontmatter.get('id') or frontmatter.get('task-id')
+    if explicit:
+        aliases.append(f"id:{explicit}")
+    aliases.extend(f"task:{number}" for number in task_numbers(frontmatter, file_path))
+    return list(dict.fromkeys(aliases))
+
+
+def graph_fields(frontmatter: Dict, file_path: Path) -> Dict:
+    """Issue 내용/매니페스트에 저장할 그래프 정보 (식별자는 모두 마커 키로 변환)"""
+    return {
+        'aliases': [task_key(a) for a in task_aliases(frontmatter, file_path)],
+        'depends_on': [task_key(r) for r in dependency_refs(frontmatter)],
+    }
+
+
+def _parse_date(value: Optional[str]) -> Optional[datetime.date]:
+    try:
+        return datetime.date.fromisoformat(str(value)) if value else None
+    except ValueError:
+        return None
+
+
+class TaskGraph:
+    """마커 키를 노드로 하는 Task 의존성 그래프"""
+
+    def __init__(self):
+        self.order: List[str] = []
+        self.predecessors: Dict[str, List[str]] = {}
+        self.successors: Dict[str, List[str]] = {}
+        self.schedule: Dict[str, Dict] = {}
+        # 그래프에 없는 Task를 가리키는 의존성 (키 → 찾지 못한 키 목록)
+        self.unresolved: Dict[str, List[str]] = {}
+        self._position: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def build(cls, tasks: Iterable[Dict]) -> 'TaskGraph':
+        """task_key, aliases, depends_on, schedule({start, end}) 필드를 가진 Task 목록
+        (매니페스트 항목 또는 Issue 내용)으로 그래프를 만듭니다. O(V+E)
+        """
+        graph = cls()
+        tasks = [t for t in tasks if t.get('task_key')]
+        alias_to_key: Dict[str, str] = {}
+        for task in tasks:
+            key = task['task_key']
+            if key in graph.predecessors:
+                continue
+            graph.order.append(key)
+            graph.predecessors[key] = []
+            graph.successors[key] = []
+            graph.schedule[key] = dict(task.get('schedule') or {})
+            for alias in [key] + list(task.get('aliases') or []):
+                alias_to_key.setdefault(alias, key)
+        seen = set()
+        for task in tasks:
+            key = task['task_key']
+            if key in seen:
+                continue
+            seen.add(key)
+            for ref in task.get('depends_on') or []:
+                dep = alias_to_key.get(ref)
+                if dep is None:
+                    graph.unresolved.setdefault(key, []).append(ref)
+                elif dep != key and dep not in graph.predecessors[key]:
+                    graph.predecessors[key].append(dep)
+                    graph.successors[dep].append(key)
+                elif dep == key:
+                    raise DependencyCycleError([key])
+        return graph
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def waves(self, keys: Optional[Iterable[str]] = None) -> List[List[str]]:
+        """위상 정렬 wave 목록을 반환합니다. (Kahn 알고리즘, O(V+E))
+
+        keys가 주어지면 그 노드만 대상으로 하며, 대상 밖의 선행 Task는 이미 끝난 것으로 봅니다.
+        wave 안의 순서는 입력 순서를 따릅니다.
+        """
+        members = set(self.order if keys is None else keys) & set(self.predecessors)
+        nodes = [k for k in self.order if k in members]
+        indegree = {k: sum(1 for p in self.predecessors[k] if p in members) for k in nodes}
+        position = {k: i for i, k in enumerate(nodes)}
+        current = [k for k in nodes if indegree[k] == 0]
+        waves: List[List[str]] = []
+        done = 0
+        while current:
+            waves.append(current)
+            done += len(current)
+            following = []
+            for key in current:
+                for succ in self.successors[key]:
+                    if succ in indegree:
+                        indegree[succ] -= 1
+                        if indegree[succ] == 0:
+                            following.append(succ)
+            current = sorted(following, key=position.__getitem__)
+        if done != len(nodes):
+            raise DependencyCycleError(self._find_cycle({k for k, d in indegree.items() if d > 0}))
+        if keys is None:
+            # 전체 위상 순서는 reschedule에서 재사용
+            self._position = {k: i for i, k in enumerate(k for wave in waves for k in wave)}
+        return waves
+
+    def _find_cycle(self, remaining: set) -> List[str]:
+        """위상 정렬 후 남은 노드에서 순환 하나를 찾습니다. (반복 DFS)"""
+        state: Dict[str, int] = {}
+        for root in (k for k in self.order if k in remaining):
+            if root in state:
+                continue
+            stack = [(root, iter(self.predecessors[root]))]
+            path = [root]
+            state[root] = 1
+            while stack:
+                node, deps = stack[-1]
+                dep = next((d for d in deps if d in remaining), None)
+                if dep is None:
+                    state[node] = 2
+                    stack.pop()
+                    path.pop()
+                elif state.get(dep) == 1:
+                    # path는 후행 → 선행 방향이므로 뒤집어 의존 방향(선행 → 후행)으로 반환
+                    return list(reversed(path[path.index(dep):]))
+                elif dep not in state:
+                    state[dep] = 1
+                    stack.append((dep, iter(self.predecessors[dep])))
+                    path.append(dep)
+        return sorted(remaining)
+
+    def reschedule(self, changed: Iterable[str]) -> Dict[str, Dict]:
+        """일정이 바뀐 Task의 후행 Task 일정을 다시 계산합니다.
+
+        선행 Task 종료일 다음 날보다 먼저 시작하는 후행 Task만 기간을 유지한 채 뒤로 밀고,
+        여유(slack)가 있어 밀리지 않은 Task에서는 전파를 멈춥니다. 영향을 받는 노드만 위상 순서로
+        한 번씩 방문합니다. self.schedule을 갱신하고 바뀐 Task의 {start, end}를 반환합니다.
+        """
+        if self._position is None:
+            self.waves()
+        position = self._position
+        heap = [(position[k], k) for k in set(changed) if k in position]
+        heapq.heapify(heap)
+        queued = {k for _, k in heap}
+        shifted: Dict[str, Dict] = {}
+        while heap:
+            _, key = heapq.heappop(heap)
+            queued.discard(key)
+            for succ in self.successors[key]:
+                start = _parse_date(self.schedule[succ].get('start'))
+                ends = [_parse_date(self.schedule[p].get('end')) for p in self.predecessors[succ]]
+                ends = [e for e in ends if e]
+                if not start or not ends:
+                    continue
+                earliest = max(ends) + datetime.timedelta(days=1)
+                if start >= earliest:
+                    continue
+                delta = earliest - start
+                end = _parse_date(self.schedule[succ].get('end'))
+                self.schedule[succ] = {'start': earliest.isoformat(),
+                                       'end': (end + delta).isoformat() if end else None}
+                shifted[succ] = self.schedule[succ]
+                if succ not in queued:
+                    # 선행 Task가 모두 먼저 처리되도록 위상 순서로 방문
+                    queued.add(succ)
+                    heapq.heappush(heap, (position[succ], succ))
+        return shifted
+
+    def critical_path(self) -> List[str]:
+        """종료일 기준으로 가장 늦게 끝나는 Task까지의 의존 경로 (일정이 없으면 빈 목록)"""
+        latest: Optional[Tuple[datetime.date, str]] = None
+        for key in self.order:
+            end = _parse_date(self.schedule[key].get('end'))
+            if end and (latest is None or end > latest[0]):
+                latest = (end, key)
+        if latest is None:
+            return []
+        path = [latest[1]]
+        while True:
+            preds = [(_parse_date(self.schedule[p].get('end')), p) for p in self.predecessors[path[-1]]]
+            preds = [(e, p) for e, p in preds if e]
+            if not preds:
+                break
+            path.append(max(preds)[1])
+        return list(reversed(path))
+
+
+def _blocked_by_field(mutation: str, issue_id: str, blocking_id: str) -> str:
+    return (f"{mutation}(input: {{issueId: {gql_value(issue_id)}, "
+            f"blockingIssueId: {gql_value(blocking_id)}}}) {{ issue {{ number }} }}")
+
+
+def link_dependencies(add: List[Tuple[str, str]], remove: Optional[List[Tuple[str, str]]] = None,
+                      batch_size: int = LINK_BATCH_SIZE) -> Dict[Tuple[str, str, str], Optional[str]]:
+    """(후행 Issue Node ID, 선행 Issue Node ID) 쌍의 "blocked by" 관계를 추가/제거합니다.
+
+    Returns:
+        ('add'|'remove', 후행 ID, 선행 ID) → 오류 메시지 (성공이면 None)
+    """
+    operations = [(('add', issue, blocking), _blocked_by_field('addBlockedBy', issue, blocking))
+                  for issue, blocking in add]
+    operations += [(('remove', issue, blocking),
+                    _blocked_by_field('removeBlockedBy', issue, blocking))
+                   for issue, blocking in remove or []]
+    if not operations:
+        return {}
+    results = execute_aliased(operations, batch_size=batch_size)
+    return {key: (None if result.ok else result.error) for key, result in results.items()}
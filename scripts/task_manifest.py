@@ -0,0 +1,150 @@
+"""
+Task 파일 매니페스트 모듈
+Task 파일 경로 → (내용 해시, Issue 번호, Node ID, Project Item ID) 매핑을 로컬에 저장합니다.
+- 크기/수정 시각이 그대로인 파일은 stat 한 번으로 건너뜀
+- 내용 해시가 바뀐 파일만 파싱/동기화 대상으로 반환
+- 매니페스트에는 있지만 디스크에서 사라진 파일은 삭제 목록으로 반환
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from cache_store import cache_key, load_json, save_json
+
+MANIFEST_VERSION = 1
+
+
+def hash_bytes(data: bytes) -> str:
+    import hashlib
+    return hashlib.sha256(data).hexdigest()
+
+
+class ChangedFile:
+    """내용이 바뀌었거나 새로 생긴 Task 파일"""
+
+    def __init__(self, path: Path, content_hash: str, stat: os.stat_result,
+                 entry: Optional[Dict]):
+        self.path = path
+        self.content_hash = content_hash
+        self.stat = stat
+        self.entry = entry  # 기존 매니페스트 항목 (새 파일이면 None)
+
+    @property
+    def issue_number(self) -> Optional[int]:
+        return (self.entry or {}).get('number')
+
+
+def file_state(changed: ChangedFile) -> Dict:
+    """매니페스트에 기록할 파일 상태 (JSON으로 저장 가능한 형태)"""
+    return {'path': TaskManifest.key(changed.path), 'hash': changed.content_hash,
+            'mtime_ns': changed.stat.st_mtime_ns, 'size': changed.stat.st_size}
+
+
+class ScanResult:
+    """매니페스트 대비 Task 트리 변경 내역"""
+
+    def __init__(self):
+        self.changed: List[ChangedFile] = []
+        self.unchanged: List[Path] = []
+        self.deleted: Dict[str, Dict] = {}
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.changed or self.deleted)
+
+
+class TaskManifest:
+    """리포지토리 하나에 대한 Task 파일 매니페스트"""
+
+    def __init__(self, owner: str, repo: str):
+        self._name = f"manifests/{cache_key(owner, repo)}.json"
+        data = load_json(self._name, {}) or {}
+        if data.get('version') != MANIFEST_VERSION:
+            data = {}
+        self.entries: Dict[str, Dict] = data.get('files', {})
+        self._dirty = False
+
+    @staticmethod
+    def key(path: Path) -> str:
+        return path.as_posix()
+
+    def get(self, path: Path) -> Optional[Dict]:
+        return self.entries.get(self.key(path))
+
+    def scan(self, paths: Iterable[Path], force: bool = False,
+             complete: bool = True, hashes: Optional[Dict[Path, str]] = None) -> ScanResult:
+        """파일 목록을 매니페스트와 비교합니다. force=True이면 모든 파일을 변경으로 취급합니다.
+
+        complete=False이면 paths를 전체 목록이 아닌 일부(예: 감시 이벤트)로 보고,
+        paths 중 없어진 파일만 삭제로 취급합니다.
+        hashes가 주어지면 여러 매니페스트(fanout 대상)가 파일 내용 해시를 공유합니다.
+        """
+        result = ScanResult()
+        seen = set()
+        for path in paths:
+            key = self.key(path)
+            seen.add(key)
+            entry = self.entries.get(key)
+            try:
+                st = path.stat()
+                if (not force and entry and entry.get('mtime_ns') == st.st_mtime_ns
+                        and entry.get('size') == st.st_size):
+                    result.unchanged.append(path)
+                    continue
+                content_hash = hashes.get(path) if hashes is not None else None
+                if content_hash is None:
+                    content_hash = hash_bytes(path.read_bytes())
+                    if hashes is not None:
+                        hashes[path] = content_hash
+            except OSError:
+                # stat 전이나 stat과 읽기 사이에 없어진 파일
+                if not complete and entry is not None:
+                    result.deleted[key] = entry
+                continue
+            if not force and entry and entry.get('hash') == content_hash:
+                # 내용은 같고 수정 시각만 바뀐 경우 (checkout, touch 등)
+                self._update_stat(key, st)
+                result.unchanged.append(path)
+                continue
+            result.changed.append(ChangedFile(path, content_hash, st, entry))
+        if complete:
+            for key, entry in self.entries.items():
+                if key not in seen:
+                    result.deleted[key] = entry
+        return result
+
+    def _update_stat(self, key: str, st: os.stat_result) -> None:
+        entry = self.entries[key]
+        entry['mtime_ns'] = st.st_mtime_ns
+        entry['size'] = st.st_size
+        self._dirty = True
+
+    def record(self, changed: ChangedFile, **fields) -> None:
+        """동기화가 끝난 파일의 해시와 Issue 정보를 기록합니다."""
+        self.record_file(file_state(changed), **fields)
+
+    def record_file(self, state: Dict, **fields) -> None:
+        """file_state()로 저장해 둔 파일 상태로 기록합니다. (작업 저널 복구용)"""
+        key = state['path']
+        entry = dict(self.entries.get(key) or {})
+        entry.update(hash=state['hash'], mtime_ns=state['mtime_ns'], size=state['size'])
+        entry.update({k: v for k, v in fields.items() if v is not None})
+        self.entries[key] = entry
+        self._dirty = True
+
+    def update(self, path_key: str, **fields) -> None:
+        """기존 항목의 필드(예: Project Item ID)를 갱신합니다."""
+        entry = self.entries.get(path_key)
+        if entry is not None:
+            entry.update({k: v for k, v in fields.items() if v is not None})
+            self._dirty = True
+
+    def remove(self, path_key: str) -> None:
+        if self.entries.pop(path_key, None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        if self._dirty:
+            save_json(self._name, {'version': MANIFEST_VERSION, 'files': self.entries})
+            self._dirty = False
@@ -0,0 +1,103 @@
+"""
+역방향 동기화(pull) 모듈
+GitHub Issue 상태와 Project Item 필드(Status, 시작일/종료일)의 변경을 Task frontmatter 변경으로 바꿉니다.
+- 변경은 로컬 미러(github_mirror.py)를 증분 갱신한 뒤 마지막 pull 시점(high-water mark) 이후
+  바뀐 Issue/Item만 미러에서 읽음
+- Issue 열림/닫힘은 지난 pull에서 본 상태와 달라졌을 때만 변경으로 봄
+- 같은 Task의 변경이 여러 개면 updatedAt 순서로 합쳐 가장 최근 값을 사용
+- 조회 비용은 리포지토리 전체 Issue 수가 아니라 변경 수에 비례
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+
+from cache_store import cache_key, load_json, save_json
+
+PULL_STATE_VERSION = 2
+STATUS_KEY = 'status'
+STATUS_FIELD = 'status'
+CLOSED_STATUS = 'Done'
+REOPENED_STATUS = 'To Do'
+
+
+class PullState:
+    """리포지토리 하나의 pull high-water mark (Issue, Project별 마지막 updatedAt)와 닫힌 Issue 번호"""
+
+    def __init__(self, owner: str, repo: str):
+        self._name = f"pull/{cache_key(owner, repo)}.json"
+        data = load_json(self._name, {}) or {}
+        if data.get('version') != PULL_STATE_VERSION:
+            data = {}
+        self.issues_since: Optional[str] = data.get('issues_since')
+        self.projects_since: Dict[str, str] = data.get('projects_since', {})
+        self.closed: Set[int] = set(data.get('closed', []))
+
+    def save(self) -> None:
+        save_json(self._name, {'version': PULL_STATE_VERSION, 'issues_since': self.issues_since,
+                               'projects_since': self.projects_since,
+                               'closed': sorted(self.closed)})
+
+
+def issue_changes(issue: Dict, closed: Set[int]) -> Dict:
+    """Issue 열림/닫힘 상태가 바뀌었으면 변경으로 바꿉니다.
+
+    closed는 지난 pull까지 닫혀 있던 Issue 번호이며 이번 상태로 고쳐 둡니다. 열림 → 닫힘은 Done으로,
+    닫힘 → 열림은 다시 열림('open', Done이던 Task만 되돌림)으로 표시하고, 상태가 그대로면 변경 없음.
+    """
+    number = issue['number']
+    if issue.get('state') == 'closed':
+        if number in closed:
+            return {}
+        closed.add(number)
+        return {STATUS_KEY: CLOSED_STATUS, 'open': False}
+    if number not in closed:
+        return {}
+    closed.discard(number)
+    return {'open': True}
+
+
+def item_changes(item: Dict, start_field_id: Optional[str], end_field_id: Optional[str]) -> Dict:
+    """미러의 Project Item 필드 값(Status 선택지, 시작일/종료일)을 frontmatter 값으로 바꿉니다.
+
+    종료일은 'end' 키로 반환하며, 파일에 있는 필드(due-date/target-date)는 호출자가 정합니다.
+    """
+    changes: Dict[str, str] = {}
+    for field_id, value in item['values'].items():
+        if field_id == start_field_id:
+            changes['start-date'] = value
+        elif field_id == end_field_id:
+            changes['end'] = value
+        elif (item['names'].get(field_id) or '').lower() == STATUS_FIELD:
+            # 이후의 Status 값이 앞선 Issue 다시 열림보다 우선
+            changes[STATUS_KEY] = value
+            changes['open'] = False
+    return changes
+
+
+def frontmatter_updates(frontmatter: Dict, changes: Dict) -> Dict:
+    """합친 변경 중 현재 frontmatter와 다른 키만 반환합니다.
+
+    'end'는 파일에 있는 마감일 필드(due-date/target-date)로 쓰고, 다시 열린 Issue('open')는
+    status가 Done일 때만 To Do로 되돌립니다.
+    """
+    changes = dict(changes)
+    status = changes.get(STATUS_KEY, frontmatter.get(STATUS_KEY))
+    if changes.pop('open', False) and status == CLOSED_STATUS:
+        changes[STATUS_KEY] = REOPENED_STATUS
+    updates = {}
+    for key, value in changes.items():
+        if key == 'end':
+            names = [n for n in ('due-date', 'target-date') if frontmatter.get(n)] or ['due-date']
+            for name in names:
+                if str(frontmatter.get(name)) != value:
+                    updates[name] = value
+        elif str(frontmatter.get(key)) != value:
+            updates[key] = value
+    return updates
+
+
+def merge_events(events: List[Tuple[str, str, Dict]]) -> Dict[str, Dict]:
+    """(updatedAt, 경로, 변경) 목록을 시간 순서로 합쳐 경로별 최종 변경을 만듭니다."""
+    merged: Dict[str, Dict] = {}
+    for _, path, changes in sorted(events, key=lambda e: e[0]):
+        merged.setdefault(path, {}).update(changes)
+    return merged
@@ -0,0 +1,174 @@
+"""
+Task 파일 변경 감시 모듈
+watch 모드에서 Tasks/ 디렉토리의 마크다운 파일 변경을 기다립니다.
+- Linux: inotify(ctypes)로 이벤트가 올 때까지 select에서 대기 (유휴 CPU 사용 없음)
+- 그 외: 일정 간격으로 stat을 비교하는 polling 방식으로 대체
+- 연속된 저장(에디터의 임시 파일 + rename 등)은 debounce로 묶어 한 번에 반환
+"""
+
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+WATCH_SUFFIX = '.md'
+DEFAULT_DEBOUNCE = 0.15
+DEFAULT_MAX_DELAY = 1.0
+DEFAULT_POLL_INTERVAL = 1.0
+
+# <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (_IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+               | _IN_DELETE_SELF)
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+class InotifyWatcher:
+    """inotify로 디렉토리 트리의 변경을 감시합니다. (하위 디렉토리 포함, 새 디렉토리 자동 추가)"""
+
+    def __init__(self, root: Path):
+        import ctypes
+        import ctypes.util
+        self.root = root
+        self._get_errno = ctypes.get_errno
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or None, use_errno=True)
+        self._fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(self._get_errno(), 'inotify_init1 실패')
+        self._dirs: Dict[int, Path] = {}
+        self._add_tree(root)
+        if not self._dirs:
+            os.close(self._fd)
+            raise OSError(errno.ENOENT, f"감시할 디렉토리가 없습니다: {root}")
+
+    def _add_tree(self, directory: Path) -> None:
+        """directory와 하위 디렉토리를 감시에 추가합니다. (추가하는 사이 지워지거나 바뀐 디렉토리는 건너뜀)"""
+        for dirpath, _, _ in os.walk(directory):
+            path = Path(dirpath)
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+            if wd < 0:
+                error = self._get_errno()
+                if error in (errno.ENOENT, errno.ENOTDIR):
+                    continue
+                raise OSError(error, f"inotify_add_watch 실패: {path}")
+            self._dirs[wd] = path
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """변경된 파일 경로를 기다립니다. (timeout 초 안에 없으면 빈 집합)
+
+        이벤트 큐가 넘쳐 일부를 놓쳤으면 root를 반환하므로 호출자가 전체를 다시 확인합니다.
+        """
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed: Set[Path] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                name = data[offset + _EVENT_HEADER.size:offset + _EVENT_HEADER.size + length]
+                offset += _EVENT_HEADER.size + length
+                if mask & _IN_Q_OVERFLOW:
+                    changed.add(self.root)
+                    continue
+                directory = self._dirs.get(wd)
+                if directory is None:
+                    continue
+                if mask & _IN_IGNORED:
+                    self._dirs.pop(wd, None)
+                    continue
+                path = directory / os.fsdecode(name.rstrip(b'\0')) if length else directory
+                if mask & _IN_ISDIR:
+                    if mask & (_IN_CREATE | _IN_MOVED_TO) and path.is_dir():
+                        # 새 디렉토리: 감시를 추가하고, 그 사이 생긴 파일을 놓치지 않도록 전체 확인
+                        self._add_tree(path)
+                        changed.add(self.root)
+                    elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+                        changed.add(self.root)
+                elif path.suffix == WATCH_SUFFIX:
+                    changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class PollingWatcher:
+    """inotify를 쓸 수 없을 때 interval초마다 파일 크기/수정 시각을 비교합니다."""
+
+    def __init__(self, root: Path, interval: float = DEFAULT_POLL_INTERVAL):
+        self.root = root
+        self.interval = interval
+        self._snapshot = self._take()
+
+    def _take(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        for path in self.root.rglob('*' + WATCH_SUFFIX):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            snapshot[path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = self._take()
+            changed = {p for p in current.keys() | self._snapshot.keys()
+                       if current.get(p) != self._snapshot.get(p)}
+            self._snapshot = current
+            if changed:
+                return changed
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return set()
+            time.sleep(self.interval if remaining is None else min(self.interval, remaining))
+
+    def close(self) -> None:
+        pass
+
+
+def open_watcher(root: Path, poll_interval: float = DEFAULT_POLL_INTERVAL):
+    """inotify 감시자를 만들고, 지원하지 않는 환경이면 polling 감시자를 반환합니다."""
+    if sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError) as e:
+            print(f"⚠️  inotify를 사용할 수 없어 {poll_interval}초 간격 polling으로 감시합니다: {e}")
+    return PollingWatcher(root, poll_interval)
+
+
+def wait_for_changes(watcher, debounce: float = DEFAULT_DEBOUNCE,
+                     max_delay: float = DEFAULT_MAX_DELAY) -> Set[Path]:
+    """첫 변경을 기다린 뒤, debounce초 동안 조용해질 때까지(최대 max_delay초) 변경을 모읍니다."""
+    changed = watcher.wait(None)
+    deadline = time.monotonic() + max_delay
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return changed
+        more = watcher.wait(min(debounce, remaining))
+        if not more:
+            return changed
+        changed |= more
@@ -0,0 +1,453 @@
+"""
+추적(tracing)/지표(metrics) 모듈
+API 호출마다 span(작업, 엔드포인트, 상태, 바이트, 지연, 재시도, rate limit 대기, GraphQL 비용)을,
+스크립트 단계마다 phase span을 기록하고 실행이 끝나면 내보냅니다.
+- --trace-json FILE: OpenTelemetry(OTLP/JSON) 호환 span 파일 (내보낼 때마다 한 줄, JSON Lines)
+- --metrics-prom FILE: Prometheus textfile collector 형식 지표
+- --trace-summary (또는 GITHUB_SYNC_TRACE=1): 작업별 p50/p95/p99 요약 출력
+- 지표는 기록할 때마다 누적하고 span은 주기적으로 내보내므로 watch처럼 오래 실행해도 메모리 사용량이 일정
+- 옵션이 없으면 비활성: phase()는 공유 no-op 객체를 반환하고 record_call()은 즉시 반환
+"""
+
+import atexit
+import json
+import math
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from cli_args import get_option, has_flag
+
+TRACE_ENV = 'GITHUB_SYNC_TRACE'
+SERVICE_NAME = 'task-sync'
+QUANTILES = (0.5, 0.95, 0.99)
+# 작업별로 보관하는 지연 표본 수 (분위수 계산용)
+LATENCY_SAMPLES = 2048
+# --trace-json에서 파일로 내보내기 전까지 메모리에 보관하는 span 수
+MAX_BUFFERED_SPANS = 5000
+
+_GRAPHQL_OPERATION_RE = re.compile(r'^\s*(query|mutation)?[^{]*\{\s*(?:\w+\s*:\s*)?(\w+)')
+_NUMBER_SEGMENT_RE = re.compile(r'/\d+(?=/|$)')
+_REPO_SEGMENT_RE = re.compile(r'^(/?repos)/[^/]+/[^/]+')
+
+
+class Span:
+    """완료된 span 하나"""
+
+    __slots__ = ('name', 'kind', 'span_id', 'parent_id', 'start_ns', 'end_ns', 'attributes',
+                 'error')
+
+    def __init__(self, name: str, kind: str, parent_id: Optional[str], start_ns: int,
+                 attributes: Dict):
+        self.name = name
+        self.kind = kind  # 'phase' 또는 'api'
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.start_ns = start_ns
+        self.end_ns = start_ns
+        self.attributes = attributes
+        self.error: Optional[str] = None
+
+    @property
+    def seconds(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e9
+
+
+def percentile(values: List[float], q: float) -> float:
+    """정렬된 값 목록의 분위수 (nearest-rank)"""
+    if not values:
+        return 0.0
+    return values[max(0, math.ceil(q * len(values)) - 1)]
+
+
+def operation_name(method: str, path: str, query: Optional[str] = None) -> str:
+    """API 호출을 묶어 집계할 작업 이름 (REST: 메서드 + 경로 템플릿, GraphQL: 첫 필드)"""
+    if query is not None:
+        match = _GRAPHQL_OPERATION_RE.match(query)
+        if match:
+            return f"graphql {match.group(1) or 'query'} {match.group(2)}"
+        return 'graphql'
+    template = _REPO_SEGMENT_RE.sub(r'\1/{owner}/{repo}', path.split('?', 1)[0])
+    return f"{method} {_NUMBER_SEGMENT_RE.sub('/{number}', template)}"
+
+
+def with_rate_limit_cost(query: str) -> str:
+    """query 문서의 최상위에 `rateLimit { cost }`를 추가합니다. (mutation은 그대로)"""
+    match = _GRAPHQL_OPERATION_RE.match(query)
+    if not match or match.group(1) == 'mutation' or 'rateLimit' in query:
+        return query
+    end = query.rstrip().rfind('}')
+    if end < 0:
+        return query
+    return query[:end] + '  rateLimit { cost }\n' + query[end:]
+
+
+class _CallStats:
+    """작업(operation) 하나의 누적 지표. 지연은 일정 간격 표본만 보관하여 메모리 사용량이 일정"""
+
+    __slots__ = ('count', 'seconds', 'statuses', 'retries', 'wait', 'bytes_sent',
+                 'bytes_received', 'cost', 'samples', '_stride')
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.statuses: Dict[int, int] = {}
+        self.retries = 0
+        self.wait = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.cost: Optional[int] = None
+        self.samples: List[float] = []
+        self._stride = 1
+
+    def add(self, span: Span) -> None:
+        attributes = span.attributes
+        status = attributes['http.response.status_code']
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.retries += attributes['retries']
+        self.wait += attributes['rate_limit.wait_seconds']
+        self.bytes_sent += attributes['http.request.body.size']
+        self.bytes_received += attributes['http.response.body.size']
+        if 'graphql.cost' in attributes:
+            self.cost = (self.cost or 0) + attributes['graphql.cost']
+        self.seconds += span.seconds
+        if self.count % self._stride == 0:
+            self.samples.append(span.seconds)
+            if len(self.samples) > LATENCY_SAMPLES:
+                # 표본이 넘치면 절반만 남기고 간격을 두 배로 (실행 전체에 고르게 분포)
+                self.samples = self.samples[::2]
+                self._stride *= 2
+        self.count += 1
+
+    def quantiles(self) -> List[float]:
+        latencies = sorted(self.samples)
+        return [percentile(latencies, q) for q in QUANTILES]
+
+
+class _PhaseStats:
+    __slots__ = ('count', 'seconds', 'first_start_ns')
+
+    def __init__(self, start_ns: int):
+        self.count = 0
+        self.seconds = 0.0
+        self.first_start_ns = start_ns
+
+
+class Tracer:
+    """프로세스 하나의 span 수집기
+
+    지표(작업별/단계별 집계)는 span을 기록할 때마다 누적하고, span 자체는 --trace-json이 있을 때만
+    보관합니다. 보관한 span은 flush()(watch 이벤트마다) 또는 MAX_BUFFERED_SPANS개가 쌓이면
+    trace 파일에 OTLP/JSON 한 줄로 덧붙이고 비웁니다.
+    """
+
+    def __init__(self, trace_path: Optional[str] = None, metrics_path: Optional[str] = None,
+                 summary: bool = False):
+        self.trace_path = trace_path
+        self.metrics_path = metrics_path
+        self.summary = summary
+        self.trace_id = os.urandom(16).hex()
+        self.spans: List[Span] = []  # 아직 내보내지 않은 span (trace_path가 있을 때만)
+        self.calls: Dict[str, _CallStats] = {}
+        self.phases: Dict[str, _PhaseStats] = {}
+        self._trace_written = False
+        self._lock = threading.Lock()
+        self._export_lock = threading.Lock()
+        self._stacks: Dict[int, List[Span]] = {}  # 스레드별 열린 phase
+
+    def _stack(self) -> List[Span]:
+        return self._stacks.setdefault(threading.get_ident(), [])
+
+    def current_id(self) -> Optional[str]:
+        """현재 스레드의 열린 phase. 없으면 (작업 스레드) 메인 스레드의 열린 phase"""
+        stack = self._stacks.get(threading.get_ident()) or \
+            self._stacks.get(threading.main_thread().ident)
+        return stack[-1].span_id if stack else None
+
+    def _add(self, span: Span) -> None:
+        with self._lock:
+            if span.kind == 'api':
+                self.calls.setdefault(span.name, _CallStats()).add(span)
+            else:
+                stats = self.phases.get(span.name)
+                if stats is None:
+                    stats = self.phases[span.name] = _PhaseStats(span.start_ns)
+                stats.count += 1
+                stats.seconds += span.seconds
+            if self.trace_path is None:
+                return
+            self.spans.append(span)
+            full = len(self.spans) >= MAX_BUFFERED_SPANS
+        if full:
+            self.flush_trace()
+
+    @contextmanager
+    def phase(self, name: str, **attributes) -> Iterator[Span]:
+        span = Span(name, 'phase', self.current_id(), time.time_ns(), attributes)
+        stack = self._stack()
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            stack.pop()
+            span.end_ns = time.time_ns()
+            self._add(span)
+
+    def record_phase(self, name: str, start_ns: int, end_ns: int, **attributes) -> None:
+        """컨텍스트 매니저로 감쌀 수 없는 구간(예: generator)을 phase span으로 기록합니다."""
+        span = Span(name, 'phase', self.current_id(), start_ns, attributes)
+        span.end_ns = end_ns
+        self._add(span)
+
+    def record_call(self, operation: str, method: str, endpoint: str, status: int,
+                    latency: float, bytes_sent: int, bytes_received: int, retries: int = 0,
+                    wait: float = 0.0, cost: Optional[int] = None, cached: bool = False) -> None:
+        end_ns = time.time_ns()
+        attributes = {
+            'http.request.method': method,
+            'url.path': endpoint,
+            'http.response.status_code': status,
+            'http.request.body.size': bytes_sent,
+            'http.response.body.size': bytes_received,
+            'retries': retries,
+            'rate_limit.wait_seconds': round(wait, 6),
+            'cache.revalidated': cached,
+        }
+        if cost is not None:
+            attributes['graphql.cost'] = cost
+        span = Span(operation, 'api', self.current_id(), end_ns - int(latency * 1e9), attributes)
+        span.end_ns = end_ns
+        if status >= 400:
+            span.error = f"HTTP {status}"
+        self._add(span)
+
+    # 내보내기
+
+    def to_otlp(self, spans: Optional[List[Span]] = None) -> Dict:
+        """OTLP/JSON (ExportTraceServiceRequest) 형식"""
+        def attribute(key, value):
+            if isinstance(value, bool):
+                return {'key': key, 'value': {'boolValue': value}}
+            if isinstance(value, int):
+                return {'key': key, 'value': {'intValue': str(value)}}
+            if isinstance(value, float):
+                return {'key': key, 'value': {'doubleValue': value}}
+            return {'key': key, 'value': {'stringValue': str(value)}}
+
+        exported = []
+        for span in self.spans if spans is None else spans:
+            data = {
+                'traceId': self.trace_id,
+                'spanId': span.span_id,
+                'name': span.name,
+                'kind': 3 if span.kind == 'api' else 1,  # CLIENT / INTERNAL
+                'startTimeUnixNano': str(span.start_ns),
+                'endTimeUnixNano': str(span.end_ns),
+                'attributes': [attribute(k, v) for k, v in span.attributes.items()],
+                'status': ({'code': 2, 'message': span.error} if span.error else {'code': 1}),
+            }
+            if span.parent_id:
+                data['parentSpanId'] = span.parent_id
+            exported.append(data)
+        return {'resourceSpans': [{
+            'resource': {'attributes': [attribute('service.name', SERVICE_NAME),
+                                        attribute('process.pid', os.getpid())]},
+            'scopeSpans': [{'scope': {'name': SERVICE_NAME}, 'spans': exported}],
+        }]}
+
+    def to_prometheus(self) -> str:
+        """Prometheus textfile 형식"""
+        def labels(**values) -> str:
+            return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in values.items()) + '}'
+
+        with self._lock:
+            calls = sorted(self.calls.items())
+            phases = sorted((name, stats.seconds) for name, stats in self.phases.items())
+            lines = [
+                '# HELP task_sync_api_request_duration_seconds GitHub API 호출 지연 (재시도 포함)',
+                '# TYPE task_sync_api_request_duration_seconds summary',
+            ]
+            for name, stats in calls:
+                for q, value in zip(QUANTILES, stats.quantiles()):
+                    lines.append(f"task_sync_api_request_duration_seconds"
+                                 f"{labels(operation=name, quantile=q)} {value:.6f}")
+                lines.append(f"task_sync_api_request_duration_seconds_sum{labels(operation=name)} "
+                             f"{stats.seconds:.6f}")
+                lines.append(f"task_sync_api_request_duration_seconds_count"
+                             f"{labels(operation=name)} {stats.count}")
+
+            lines.append('# HELP task_sync_api_requests_total GitHub API 호출 수')
+            lines.append('# TYPE task_sync_api_requests_total counter')
+            for name, stats in calls:
+                for status, count in sorted(stats.statuses.items()):
+                    lines.append(f"task_sync_api_requests_total"
+                                 f"{labels(operation=name, status=status)} {count}")
+            counters = [
+                ('task_sync_api_retries_total', 'rate limit 재시도 수', 'retries'),
+                ('task_sync_api_rate_limit_wait_seconds_total', 'rate limit 대기 시간', 'wait'),
+                ('task_sync_api_request_bytes_total', '요청 본문 바이트', 'bytes_sent'),
+                ('task_sync_api_response_bytes_total', '응답 본문 바이트', 'bytes_received'),
+                ('task_sync_graphql_cost_total', 'GraphQL rateLimit.cost 합계', 'cost'),
+            ]
+            for metric, help_text, field in counters:
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} counter")
+                for name, stats in calls:
+                    value = getattr(stats, field)
+                    if value is not None:
+                        lines.append(f"{metric}{labels(operation=name)} {_number(value)}")
+
+        lines.append('# HELP task_sync_phase_duration_seconds 단계별 실행 시간 합계')
+        lines.append('# TYPE task_sync_phase_duration_seconds gauge')
+        for name, seconds in phases:
+            lines.append(f"task_sync_phase_duration_seconds{labels(phase=name)} {seconds:.6f}")
+        return '\n'.join(lines) + '\n'
+
+    def summary_lines(self) -> List[str]:
+        """사람이 읽는 요약 (단계별 시간, 작업별 호출 수와 p50/p95/p99)"""
+        lines = ['📈 실행 추적 요약']
+        with self._lock:
+            phases = sorted(self.phases.items(), key=lambda item: item[1].first_start_ns)
+            calls = sorted(self.calls.items(), key=lambda item: -item[1].count)
+            quantiles = {name: stats.quantiles() for name, stats in calls}
+        if phases:
+            lines.append(f"   {'단계':<32}{'횟수':>6}{'합계(초)':>12}")
+            for name, stats in phases:
+                lines.append(f"   {name:<32}{stats.count:>6}{stats.seconds:>12.3f}")
+        if calls:
+            lines.append(f"   {'API 작업':<48}{'호출':>6}{'p50(ms)':>10}{'p95(ms)':>10}"
+                         f"{'p99(ms)':>10}{'재시도':>8}{'비용':>6}")
+            for name, stats in calls:
+                lines.append(f"   {name[:47]:<48}{stats.count:>6}"
+                             + ''.join(f"{value * 1000:>10.1f}" for value in quantiles[name])
+                             + f"{stats.retries:>8}{stats.cost or 0:>6}")
+            total = sum(stats.count for _, stats in calls)
+            wait = sum(stats.wait for _, stats in calls)
+            received = sum(stats.bytes_received for _, stats in calls)
+            lines.append(f"   총 {total}회 호출, 응답 {received / 1024:.1f}KB, "
+                         f"rate limit 대기 {wait:.2f}초")
+        return lines
+
+    def flush_trace(self) -> None:
+        """보관 중인 span을 trace 파일에 OTLP/JSON 한 줄로 내보내고 비웁니다.
+
+        실행의 첫 내보내기는 파일을 새로 쓰고, 이후에는 줄을 덧붙입니다. (OTLP JSON Lines)
+        """
+        if not self.trace_path:
+            return
+        with self._export_lock:
+            with self._lock:
+                spans, self.spans = self.spans, []
+            if not spans and self._trace_written:
+                return
+            line = json.dumps(self.to_otlp(spans), ensure_ascii=False) + '\n'
+            if self._trace_written:
+                with open(self.trace_path, 'a', encoding='utf-8') as f:
+                    f.write(line)
+            else:
+                _write_atomic(self.trace_path, line)
+                self._trace_written = True
+
+    def flush(self) -> None:
+        """span과 지금까지의 지표를 파일로 내보냅니다. (watch처럼 오래 실행될 때 이벤트마다)"""
+        self.flush_trace()
+        if self.metrics_path:
+            _write_atomic(self.metrics_path, self.to_prometheus())
+
+    def export(self) -> None:
+        """설정된 형식으로 모두 내보냅니다. (프로세스 종료 시 1회)"""
+        self.flush()
+        if self.summary:
+            print('\n' + '\n'.join(self.summary_lines()))
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else f"{value:.6f}"
+
+
+def _write_atomic(path: str, text: str) -> None:
+    """textfile collector가 쓰는 중인 파일을 읽지 않도록 임시 파일 + rename으로 저장합니다."""
+    directory = os.path.dirname(os.path.abspath(path))
+    import tempfile
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.trace-', suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+class _NoopPhase:
+    """비활성 상태의 phase (공유 인스턴스)"""
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NOOP_PHASE = _NoopPhase()
+_tracer: Optional[Tracer] = None
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def get_tracer() -> Optional[Tracer]:
+    """명령줄/환경 변수 설정에 따른 Tracer (비활성이면 None)"""
+    global _tracer, _configured
+    if not _configured:
+        with _configure_lock:
+            if not _configured:
+                trace_path = get_option('--trace-json')
+                metrics_path = get_option('--metrics-prom')
+                summary = has_flag('--trace-summary') or os.environ.get(TRACE_ENV) == '1'
+                if trace_path or metrics_path or summary:
+                    import multiprocessing
+                    # 프로세스 풀 작업자는 기록하지 않음 (부모 프로세스만 내보냄)
+                    if multiprocessing.parent_process() is None:
+                        _tracer = Tracer(trace_path, metrics_path, summary)
+                        atexit.register(_tracer.export)
+                _configured = True
+    return _tracer
+
+
+def enabled() -> bool:
+    return (_tracer if _configured else get_tracer()) is not None
+
+
+def phase(name: str, **attributes):
+    """단계 span 컨텍스트 매니저. 비활성이면 no-op"""
+    tracer = _tracer if _configured else get_tracer()
+    if tracer is None:
+        return _NOOP_PHASE
+    return tracer.phase(name, **attributes)
+
+
+def record_phase(name: str, start_ns: int, end_ns: int, **attributes) -> None:
+    """이미 끝난 구간을 phase span으로 기록합니다. 비활성이면 아무것도 하지 않음"""
+    tracer = _tracer if _configured else get_tracer()
+    if tracer is not None:
+        tracer.record_phase(name, start_ns, end_ns, **attributes)
+
+
+def flush() -> None:
+    """지금까지의 span과 지표를 파일로 내보냅니다. 비활성이면 아무것도 하지 않음"""
+    tracer = _tracer if _configured else get_tracer()
+    if tracer is not None:
+        tracer.flush()
+
+
+def record_call(*args, **kwargs) -> None:
+    """API 호출 span을 기록합니다. 비활성이면 아무것도 하지 않음"""
+    tracer = _tracer if _configured else get_tracer()
+    if tracer is not None:
+        tracer.record_call(*args, **kwargs)
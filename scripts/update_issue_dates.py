@@ -2,105 +2,149 @@
 """
 GitHub Issues의 날짜 필드 업데이트 스크립트
 생성된 Issues에 시작일자와 종료일자를 설정합니다.
+- 날짜는 각 Issue에 해당하는 Task 파일의 frontmatter(start-date, due-date/target-date)에서 가져옴
+  (Issue 본문의 마커 키 → 원본 파일 경로 → 제목 순서로 Task 파일을 찾음)
+- Issue 목록과 본문은 로컬 미러(github_mirror.py)에서 가져옴 (마지막 실행 이후 바뀐 Issue만 조회)
+- 새 본문이 현재 본문과 같으면 건너뛰고, 바뀐 본문만 별칭 mutation으로 묶어 동시에 반영
 """
 
-import json
-import subprocess
 import re
-from typing import Optional, Tuple
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
-def get_github_repo() -> Optional[Tuple[str, str]]:
-    """현재 Git 리포지토리 정보를 가져옵니다."""
-    try:
-        result = subprocess.run(
-            ['gh', 'repo', 'view', '--json', 'nameWithOwner'],
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='ignore',
-            check=True
-        )
-        repo_info = json.loads(result.stdout)
-        owner, repo = repo_info['nameWithOwner'].split('/')
-        return owner, repo
-    except Exception:
-        return None
+import telemetry
+from cli_args import get_int_option, get_option
+from concurrency import map_processes, run_ordered
+from create_issues_from_tasks import discover_task_files, render_schedule_section
+from frontmatter import read_frontmatter
+from git_repo import get_github_repo
+from github_client import get_client
+from github_mirror import GitHubMirror
+from graphql_batch import chunked, execute_aliased, gql_value
+from issue_markers import find_marker, task_identity, task_key
 
-def get_issues_with_label(owner: str, repo: str, label: str) -> list:
-    """특정 라벨이 있는 Issues를 가져옵니다."""
+# 날짜 섹션: 제목 줄부터 첫 빈 줄까지
+DATE_SECTION_RE = re.compile(r'## 📅 일정 정보\n(.*?)\n\n', re.DOTALL)
+SOURCE_PATH_RE = re.compile(r'\*원본 파일: `([^`]+)`\*')
+# 본문이 길어 별칭 mutation 하나에 담는 수를 작게 유지
+DEFAULT_WRITE_BATCH_SIZE = 10
+
+def refresh_mirror(mirror: GitHubMirror) -> None:
+    """로컬 미러를 증분 갱신합니다. (실패하면 미러의 마지막 상태를 사용)"""
     try:
-        result = subprocess.run(
-            ['gh', 'issue', 'list', '--repo', f'{owner}/{repo}',
-             '--label', label, '--state', 'all', '--limit', '100',
-             '--json', 'number,title,body,url'],
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='ignore',
-            check=True
-        )
-        if result.stdout:
-            return json.loads(result.stdout)
+        mirror.refresh_issues()
     except Exception as e:
-        print(f"⚠️  Issues 조회 실패: {e}")
-    return []
+        print(f"⚠️  Issues 조회 실패 (미러의 마지막 상태 사용): {e}")
 
-def update_issue_body(owner: str, repo: str, issue_number: int, 
-                     start_date: str, end_date: str) -> bool:
-    """Issue 본문에 날짜 정보를 추가/업데이트합니다."""
+def read_task_dates(md_file: Path) -> Optional[Dict]:
+    """Task 파일의 식별 키, 제목, 날짜를 읽습니다. (프로세스 풀 작업 단위)"""
     try:
-        # 현재 Issue 본문 가져오기
-        result = subprocess.run(
-            ['gh', 'issue', 'view', str(issue_number), '--repo', f'{owner}/{repo}',
-             '--json', 'body'],
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='ignore',
-            check=True
-        )
-        
-        current_body = json.loads(result.stdout)['body'] or ''
-        
-        # 날짜 정보 섹션 찾기 또는 추가
-        date_section_pattern = r'## 📅 일정 정보\n(.*?)\n\n'
-        date_info = f"""## 📅 일정 정보
-- **시작일**: {start_date}
-- **마감일**: {end_date}
+        frontmatter, _ = read_frontmatter(md_file)
+    except Exception as e:
+        print(f"⚠️  Task 파일 읽기 실패: {md_file} - {e}")
+        return None
+    if not frontmatter:
+        return None
+    task = {
+        'key': task_key(task_identity(frontmatter, md_file)),
+        'path': str(md_file),
+        'title': str(frontmatter.get('title', md_file.stem)).strip(),
+    }
+    # start-date, due-date, target-date (본문 일정 섹션과 같은 규칙으로 표시)
+    for name in ('start', 'due', 'target'):
+        value = frontmatter.get(f'{name}-date')
+        task[name] = str(value) if value else None
+    return task
 
-"""
-        
-        if re.search(date_section_pattern, current_body, re.DOTALL):
-            # 기존 날짜 섹션 업데이트
-            new_body = re.sub(
-                date_section_pattern,
-                date_info,
-                current_body,
-                flags=re.DOTALL
-            )
-        else:
-            # 날짜 섹션이 없으면 본문 앞에 추가
-            if '## 📋 메타데이터' in current_body:
-                new_body = current_body.replace('## 📋 메타데이터', date_info + '## 📋 메타데이터')
-            elif '## 📝 상세 내용' in current_body:
-                new_body = current_body.replace('## 📝 상세 내용', date_info + '## 📝 상세 내용')
-            else:
-                new_body = date_info + current_body
-        
-        # Issue 업데이트
-        subprocess.run(
-            ['gh', 'issue', 'edit', str(issue_number), '--repo', f'{owner}/{repo}',
-             '--body', new_body],
-            capture_output=True,
-            encoding='utf-8',
-            errors='ignore',
-            check=True
-        )
+def load_task_dates(tasks_dir: Path, workers: Optional[int] = None) -> Dict[str, Dict]:
+    """Task 파일의 날짜를 마커 키/경로/제목으로 찾을 수 있는 인덱스를 만듭니다."""
+    index: Dict[str, Dict] = {}
+    for _, task in map_processes(read_task_dates, discover_task_files(tasks_dir), workers):
+        if task:
+            for lookup in (f"key:{task['key']}", f"path:{task['path']}", f"title:{task['title']}"):
+                index.setdefault(lookup, task)
+    return index
+
+def find_task_dates(issue: Dict, index: Dict[str, Dict]) -> Optional[Dict]:
+    """Issue에 해당하는 Task를 마커 키 → 원본 파일 경로 → 제목 순서로 찾습니다."""
+    body = issue.get('body') or ''
+    key = find_marker(body)
+    if key and f"key:{key}" in index:
+        return index[f"key:{key}"]
+    match = SOURCE_PATH_RE.search(body)
+    if match and f"path:{match.group(1)}" in index:
+        return index[f"path:{match.group(1)}"]
+    return index.get(f"title:{(issue.get('title') or '').strip()}")
+
+def render_body(current_body: str, start_date: Optional[str], due_date: Optional[str],
+                target_date: Optional[str] = None) -> str:
+    """날짜 섹션을 추가/교체한 본문을 반환합니다. (API 호출 없음)
+    
+    섹션 형식은 Issue 생성 시와 같음 (render_schedule_section, 날짜가 없으면 섹션 제거)
+    """
+    date_info = render_schedule_section(start_date, due_date, target_date)
+    if DATE_SECTION_RE.search(current_body):
+        # 기존 날짜 섹션 업데이트
+        return DATE_SECTION_RE.sub(lambda _: date_info, current_body, count=1)
+    if not date_info:
+        return current_body
+    # 날짜 섹션이 없으면 생성 시와 같은 위치(메타데이터 다음, 상세 내용 앞)에 추가
+    if '## 📝 상세 내용' in current_body:
+        return current_body.replace('## 📝 상세 내용', date_info + '## 📝 상세 내용', 1)
+    return date_info + current_body
+
+def update_issue_body(owner: str, repo: str, issue_number: int,
+                      start_date: str, end_date: str,
+                      current_body: Optional[str] = None) -> bool:
+    """Issue 본문에 날짜 정보를 추가/업데이트합니다.
+    
+    current_body가 주어지면 다시 조회하지 않고, 새 본문이 같으면 수정하지 않습니다.
+    """
+    client = get_client()
+    try:
+        if current_body is None:
+            issue = client.rest('GET', f'repos/{owner}/{repo}/issues/{issue_number}')
+            current_body = issue.get('body') or ''
+        new_body = render_body(current_body, start_date, end_date)
+        if new_body != current_body:
+            client.rest('PATCH', f'repos/{owner}/{repo}/issues/{issue_number}',
+                        {'body': new_body})
         return True
     except Exception as e:
         print(f"   ❌ 업데이트 실패: {e}")
         return False
 
+def _update_body_field(issue_id: str, body: str) -> str:
+    return (f"updateIssue(input: {{id: {gql_value(issue_id)}, body: {gql_value(body)}}}) "
+            "{ issue { number } }")
+
+def write_issue_bodies(edits: List[Tuple[Dict, str]],
+                       batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+                       concurrency: int = 1) -> Tuple[int, int]:
+    """(Issue, 새 본문) 목록을 별칭 updateIssue mutation 배치로 나눠 동시에 반영합니다.
+    
+    Returns:
+        (성공 수, 실패 수)
+    """
+    def write(batch: List[Tuple[Dict, str]]) -> Dict:
+        operations = [(issue['number'], _update_body_field(issue['id'], body))
+                      for issue, body in batch]
+        return execute_aliased(operations, batch_size=len(operations))
+    
+    success = failed = 0
+    batches = list(chunked(edits, max(1, batch_size)))
+    for batch, results in run_ordered(write, batches, concurrency):
+        for issue, _ in batch:
+            result = results.get(issue['number'])
+            if result is not None and result.ok:
+                print(f"   ✅ Issue #{issue['number']} 날짜 정보 업데이트 완료")
+                success += 1
+            else:
+                print(f"   ❌ Issue #{issue['number']} 업데이트 실패: "
+                      f"{result.error if result is not None else '결과 없음'}")
+                failed += 1
+    return success, failed
+
 def main():
     """메인 함수"""
     print("📅 GitHub Issues 날짜 업데이트 스크립트")
@@ -114,46 +158,70 @@ def main():
     owner, repo = repo_info
     print(f"📦 리포지토리: {owner}/{repo}")
     
-    # 'Issue Automation' 라벨이 있는 Issues 가져오기
-    print("\n🔍 'Issue Automation' 라벨이 있는 Issues 조회 중...")
-    issues = get_issues_with_label(owner, repo, 'Issue Automation')
-    
-    if not issues:
-        print("❌ 해당 라벨이 있는 Issues를 찾을 수 없습니다.")
-        return
+    batch_size = get_int_option('--batch-size', DEFAULT_WRITE_BATCH_SIZE)
+    concurrency = get_int_option('--concurrency', 4)
+    # Task 파일을 찾지 못한 Issue에 쓸 날짜 (지정하지 않으면 해당 Issue는 건너뜀)
+    default_start = get_option('--start-date')
+    default_end = get_option('--end-date')
     
-    print(f"📋 총 {len(issues)}개의 Issues 발견")
+    # Task 파일의 frontmatter 날짜 (마커 키/경로/제목으로 조회)
+    tasks_dir = Path('Tasks')
+    with telemetry.phase('load_tasks'):
+        task_index = load_task_dates(tasks_dir) if tasks_dir.exists() else {}
+    print(f"📂 Task 파일 날짜 {len({id(t) for t in task_index.values()})}개 로드")
     
-    # 날짜 설정
-    start_date = "2025-12-24"
-    end_date = "2025-12-31"
+    # 'Issue Automation' 라벨이 있는 Issues 가져오기 (미러 증분 갱신 후 라벨 인덱스에서 하나씩 읽음)
+    print("\n🔍 'Issue Automation' 라벨이 있는 Issues 조회 중...")
     
-    print(f"\n📅 날짜 설정:")
-    print(f"   - 시작일: {start_date}")
-    print(f"   - 종료일: {end_date}")
+    # 목록의 본문으로 새 본문을 만들고, 바뀐 Issue만 수정 대상으로 모음
+    edits: List[Tuple[Dict, str]] = []
+    total_count = 0
+    unchanged_count = 0
+    no_task_count = 0
+    with GitHubMirror(owner, repo) as mirror:
+        with telemetry.phase('mirror'):
+            refresh_mirror(mirror)
+        with telemetry.phase('render'):
+            for issue in mirror.issues_with_label('Issue Automation'):
+                total_count += 1
+                task = find_task_dates(issue, task_index)
+                if task:
+                    dates = (task['start'], task['due'], task['target'])
+                elif default_start or default_end:
+                    dates = (default_start, default_end, None)
+                else:
+                    no_task_count += 1
+                    continue
+                current_body = issue.get('body') or ''
+                new_body = render_body(current_body, *dates)
+                if new_body == current_body:
+                    unchanged_count += 1
+                else:
+                    edits.append((issue, new_body))
     
-    # 각 Issue 업데이트
-    print(f"\n🔄 Issues 업데이트 중...")
-    print("=" * 60)
+    if not total_count:
+        print("❌ 해당 라벨이 있는 Issues를 찾을 수 없습니다.")
+        return
     
-    updated_count = 0
-    failed_count = 0
+    print(f"📋 총 {total_count}개의 Issues 발견")
+    print(f"\n📊 변경할 Issues: {len(edits)}개, 변경 없음: {unchanged_count}개, "
+          f"Task 파일 없음: {no_task_count}개")
     
-    for issue in issues:
-        print(f"\n📝 Issue #{issue['number']}: {issue['title']}")
-        
-        if update_issue_body(owner, repo, issue['number'], start_date, end_date):
-            print(f"   ✅ 날짜 정보 업데이트 완료")
-            updated_count += 1
-        else:
-            failed_count += 1
+    updated_count = failed_count = 0
+    if edits:
+        print(f"\n🔄 Issues 업데이트 중... ({batch_size}개씩, 동시 {concurrency}개)")
+        print("=" * 60)
+        with telemetry.phase('write', issues=len(edits)):
+            updated_count, failed_count = write_issue_bodies(edits, batch_size, concurrency)
     
     print("\n" + "=" * 60)
     print(f"✅ 완료!")
     print(f"   - 업데이트 성공: {updated_count}개")
+    print(f"   - 변경 없음 (건너뜀): {unchanged_count}개")
+    if no_task_count:
+        print(f"   - Task 파일 없음 (건너뜀): {no_task_count}개")
     print(f"   - 실패: {failed_count}개")
     print(f"\n🔗 GitHub에서 확인: https://github.com/{owner}/{repo}/issues")
 
 if __name__ == '__main__':
     main()
-